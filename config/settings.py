@@ -9,10 +9,12 @@ https://docs.djangoproject.com/en/6.0/topics/settings/
 For the full list of settings and their values, see
 https://docs.djangoproject.com/en/6.0/ref/settings/
 """
+import copy
 import os
 from pathlib import Path
 from dotenv import load_dotenv
 from datetime import timedelta
+from django.core.exceptions import ImproperlyConfigured
 from rest_framework.permissions import IsAuthenticated
 
 
@@ -43,6 +45,7 @@ INSTALLED_APPS = [
     'django.contrib.sessions',
     'django.contrib.messages',
     'django.contrib.staticfiles',
+    'django.contrib.postgres',
     "rest_framework_simplejwt.token_blacklist",
     'rest_framework',
     'users',
@@ -55,6 +58,7 @@ MIDDLEWARE = [
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'core.middleware.ReplicaRoutingMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
@@ -100,6 +104,74 @@ DATABASES = {
     }
 }
 
+# psycopg connection pool, one per process and database alias. Size it so
+# workers * DB_POOL_MAX_SIZE stays below the server's max_connections.
+# With CONN_HEALTH_CHECKS Django hands ConnectionPool.check_connection to the
+# pool, so connections are checked on checkout and a broken one is discarded
+# instead of failing the request.
+DB_POOL_ENABLED = os.getenv("DB_POOL_ENABLED", "true").lower() == "true"
+
+DATABASES['default']['CONN_HEALTH_CHECKS'] = True
+
+if DB_POOL_ENABLED:
+    DATABASES['default']['OPTIONS'] = {
+        'pool': {
+            'min_size': int(os.getenv("DB_POOL_MIN_SIZE", "2")),
+            'max_size': int(os.getenv("DB_POOL_MAX_SIZE", "10")),
+            # seconds a request waits for a free connection
+            'timeout': float(os.getenv("DB_POOL_TIMEOUT", "10")),
+            'max_idle': float(os.getenv("DB_POOL_MAX_IDLE", "600")),
+            'max_lifetime': float(os.getenv("DB_POOL_MAX_LIFETIME", "3600")),
+        },
+    }
+else:
+    DATABASES['default']['CONN_MAX_AGE'] = int(os.getenv("DB_CONN_MAX_AGE", "0"))
+
+# Read replicas, comma separated host[:port] list sharing the primary's
+# credentials. Safe requests read from a random replica unless the user wrote
+# within REPLICA_READ_YOUR_WRITES_SECONDS, which should exceed the usual
+# replication lag. The pins are kept in the cache, so replicas require a shared
+# CACHE_BACKEND. Tests read replicas through the test primary (MIRROR), and
+# a replica host pointing at the primary itself gives a local two alias setup.
+DATABASE_REPLICAS = []
+
+for index, replica in enumerate(
+    filter(None, os.getenv("POSTGRES_REPLICA_HOSTS", "").split(",")), start=1
+):
+    host, _, port = replica.strip().partition(":")
+    alias = f"replica_{index}"
+
+    DATABASES[alias] = {
+        **copy.deepcopy(DATABASES['default']),
+        'HOST': host,
+        'PORT': port or DATABASES['default']['PORT'],
+        'TEST': {'MIRROR': 'default'},
+    }
+    DATABASE_REPLICAS.append(alias)
+
+DATABASE_ROUTERS = ["core.db_router.ReplicaRouter"]
+
+REPLICA_READ_YOUR_WRITES_SECONDS = int(os.getenv("REPLICA_READ_YOUR_WRITES_SECONDS", "5"))
+
+
+# Cache
+# https://docs.djangoproject.com/en/6.0/topics/cache/
+# Point CACHE_BACKEND/CACHE_LOCATION at a shared cache (redis, memcached) when
+# running more than one process so invalidations reach every worker.
+
+CACHES = {
+    'default': {
+        'BACKEND': os.getenv("CACHE_BACKEND", "django.core.cache.backends.locmem.LocMemCache"),
+        'LOCATION': os.getenv("CACHE_LOCATION", "taskvault"),
+    }
+}
+
+if CACHES['default']['BACKEND'].endswith("LocMemCache"):
+    # bound the per-process cache, shared backends evict on their own
+    CACHES['default']['OPTIONS'] = {
+        'MAX_ENTRIES': int(os.getenv("CACHE_MAX_ENTRIES", "10000")),
+    }
+
 
 # Password validation
 # https://docs.djangoproject.com/en/6.0/ref/settings/#auth-password-validators
@@ -119,15 +191,52 @@ AUTH_PASSWORD_VALIDATORS = [
     },
 ]
 
+# Password hashing
+# https://docs.djangoproject.com/en/6.0/topics/auth/passwords/
+# PASSWORD_HASHER picks the hasher used for new hashes, the others stay
+# listed so existing hashes verify and get upgraded on the next login.
+
+PASSWORD_HASHER_CHOICES = {
+    "pbkdf2": "users.hashers.ConfigurablePBKDF2PasswordHasher",
+    "argon2": "django.contrib.auth.hashers.Argon2PasswordHasher",
+    "bcrypt": "django.contrib.auth.hashers.BCryptSHA256PasswordHasher",
+    "scrypt": "django.contrib.auth.hashers.ScryptPasswordHasher",
+}
+
+PASSWORD_HASHER = os.getenv("PASSWORD_HASHER", "pbkdf2")
+
+if PASSWORD_HASHER not in PASSWORD_HASHER_CHOICES:
+    raise ImproperlyConfigured(
+        f"Unknown PASSWORD_HASHER '{PASSWORD_HASHER}', expected one of: "
+        f"{', '.join(PASSWORD_HASHER_CHOICES)}."
+    )
+
+PASSWORD_HASHERS = [PASSWORD_HASHER_CHOICES[PASSWORD_HASHER]] + [
+    path
+    for name, path in PASSWORD_HASHER_CHOICES.items()
+    if name != PASSWORD_HASHER
+]
+
+# PBKDF2 iteration count, unset keeps Django's default
+PASSWORD_HASH_ITERATIONS = (
+    int(os.getenv("PASSWORD_HASH_ITERATIONS"))
+    if os.getenv("PASSWORD_HASH_ITERATIONS")
+    else None
+)
+
 REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": [
-        "rest_framework_simplejwt.authentication.JWTAuthentication",
+        "users.authentication.CachedJWTAuthentication",
     ],
 
     "DEFAULT_PERMISSION_CLASSES": [
         "rest_framework.permissions.IsAuthenticated",
     ],
     'EXCEPTION_HANDLER': 'core.exceptions.custom_api_exception_handler',
+    "DEFAULT_THROTTLE_RATES": {
+        "login_ip": os.getenv("LOGIN_IP_THROTTLE_RATE", "30/min"),
+        "login_username": os.getenv("LOGIN_USERNAME_THROTTLE_RATE", "10/min"),
+    },
 }
 
 SIMPLE_JWT = {
@@ -139,6 +248,20 @@ SIMPLE_JWT = {
 
 }
 
+# Where blacklisted refresh tokens are kept, see users.token_blacklist.
+# CacheBlacklistStore requires a shared CACHE_BACKEND, run
+# `copy_token_blacklist_to_cache` before switching to it so tokens already
+# blacklisted in the database stay rejected.
+TOKEN_BLACKLIST_STORE = os.getenv(
+    "TOKEN_BLACKLIST_STORE",
+    "users.token_blacklist.DatabaseBlacklistStore",
+)
+
+# Keep tasks_stats_rollup up to date on every task write so the stats
+# endpoint reads pre-aggregated counts, run `rebuild_task_stats` after
+# enabling it on an existing database
+TASK_STATS_ROLLUP_ENABLED = os.getenv("TASK_STATS_ROLLUP_ENABLED", "false").lower() == "true"
+
 AUTH_USER_MODEL = "users.User"
 
 # Internationalization
@@ -23,6 +23,8 @@ urlpatterns = [
     
     path('api/v1/', include('users.urls')),
     path('api/v1/', include('tasks.urls')),
+    path('api/v1/async/', include('tasks.async_urls')),
+    path('api/v1/', include('core.urls')),
 ]
 
 handler404 = "core.exceptions.custom_404_handler"
@@ -0,0 +1,102 @@
+from django.http import HttpResponse, JsonResponse
+from django.views import View
+from rest_framework import exceptions, status
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.request import Request
+from rest_framework.utils.encoders import JSONEncoder
+
+from core.conditional import is_not_modified, set_validators
+from core.exceptions import custom_api_exception_handler
+from users.authentication import CachedJWTAuthentication
+
+
+class AsyncAPIView(View):
+    """
+    Base class of the read only views served natively on the ASGI entry point.
+
+    DRF's APIView only runs synchronously, so these are plain Django async
+    views that keep the same contract: JWT authentication, DRF permission
+    classes, DRF Request query params for the paginators and serializers, and
+    the error envelope of `custom_api_exception_handler`. Handlers fetch their
+    rows with the async ORM and return JSON ready dicts via `respond`.
+    """
+
+    permission_classes = [IsAuthenticated]
+    http_method_names = ["get", "head", "options"]
+
+    async def dispatch(self, request, *args, **kwargs):
+        request = Request(request)
+        self.request = request
+        self.args = args
+        self.kwargs = kwargs
+
+        try:
+            handler = getattr(self, request.method.lower(), None)
+            if request.method.lower() not in self.http_method_names or handler is None:
+                raise exceptions.MethodNotAllowed(request.method)
+
+            await self.initial(request)
+            return await handler(request, *args, **kwargs)
+        except Exception as exc:
+            return self.handle_exception(exc)
+
+    async def head(self, request, *args, **kwargs):
+        return await self.get(request, *args, **kwargs)
+
+    async def initial(self, request):
+        authenticator = CachedJWTAuthentication()
+        result = await authenticator.aauthenticate(request)
+
+        if result is None:
+            raise exceptions.NotAuthenticated()
+
+        request.user, request.auth = result
+        self.check_permissions(request)
+
+    def get_permissions(self):
+        return [permission() for permission in self.permission_classes]
+
+    def check_permissions(self, request):
+        for permission in self.get_permissions():
+            if not permission.has_permission(request, self):
+                raise exceptions.PermissionDenied(
+                    getattr(permission, "message", None)
+                )
+
+    def check_object_permissions(self, request, obj):
+        for permission in self.get_permissions():
+            if not permission.has_object_permission(request, self, obj):
+                raise exceptions.PermissionDenied(
+                    getattr(permission, "message", None)
+                )
+
+    def handle_exception(self, exc):
+        if isinstance(exc, (exceptions.NotAuthenticated, exceptions.AuthenticationFailed)):
+            exc.auth_header = CachedJWTAuthentication().authenticate_header(self.request)
+
+        response = custom_api_exception_handler(exc, {"view": self, "request": self.request})
+        json_response = self.respond(response.data, status=response.status_code)
+
+        for header, value in response.headers.items():
+            if header.lower() != "content-type":
+                json_response[header] = value
+
+        return json_response
+
+    def respond(self, data, status=status.HTTP_200_OK, etag=None, last_modified=None):
+        response = JsonResponse(data, status=status, encoder=JSONEncoder)
+
+        if etag is not None:
+            set_validators(response, etag, last_modified)
+
+        return response
+
+    def not_modified(self, etag, last_modified=None):
+        """
+        Return a 304 response when the client already holds this version.
+        """
+        if not is_not_modified(self.request, etag, last_modified):
+            return None
+
+        response = HttpResponse(status=status.HTTP_304_NOT_MODIFIED)
+        return set_validators(response, etag, last_modified)
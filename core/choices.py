@@ -17,5 +17,12 @@ class TaskPriorityChoices(models.TextChoices):
     MEDIUM = "MEDIUM", "Medium"
     LOW = "LOW", "Low"
 
+class UserCascadeActionChoices(models.TextChoices):
+    DELETE = "DELETE", "Delete"
+    RESTORE = "RESTORE", "Restore"
 
-
+class UserCascadePhaseChoices(models.TextChoices):
+    OWNED_TASKS = "OWNED_TASKS", "Owned Tasks"
+    ASSIGNED_TASKS = "ASSIGNED_TASKS", "Assigned Tasks"
+    COMMENTS = "COMMENTS", "Comments"
+    DONE = "DONE", "Done"
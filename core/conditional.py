@@ -0,0 +1,69 @@
+import hashlib
+
+from django.utils.http import http_date, parse_etags, parse_http_date_safe, quote_etag
+from rest_framework import status
+from rest_framework.response import Response
+
+from core.exceptions import PreconditionFailed
+
+
+def make_etag(*parts):
+    """
+    Build a strong ETag from the values a representation depends on.
+    """
+    raw = ":".join(str(part) for part in parts)
+    return quote_etag(hashlib.md5(raw.encode()).hexdigest())
+
+
+def set_validators(response, etag, last_modified=None):
+    response["ETag"] = etag
+
+    if last_modified is not None:
+        response["Last-Modified"] = http_date(last_modified.timestamp())
+
+    return response
+
+
+def is_not_modified(request, etag, last_modified=None):
+    """
+    Whether the client already holds this version.
+
+    If-None-Match takes precedence over If-Modified-Since, as in RFC 9110.
+    """
+    if_none_match = request.headers.get("If-None-Match")
+
+    if if_none_match:
+        return if_none_match.strip() == "*" or etag in parse_etags(if_none_match)
+
+    if_modified_since = parse_http_date_safe(
+        request.headers.get("If-Modified-Since", "")
+    )
+    return (
+        if_modified_since is not None
+        and last_modified is not None
+        and int(last_modified.timestamp()) <= if_modified_since
+    )
+
+
+def not_modified_response(request, etag, last_modified=None):
+    """
+    Return a 304 response when the client already holds this version.
+    """
+    if not is_not_modified(request, etag, last_modified):
+        return None
+
+    response = Response(status=status.HTTP_304_NOT_MODIFIED)
+    return set_validators(response, etag, last_modified)
+
+
+def check_if_match(request, etag):
+    """
+    Reject a write when If-Match does not match the current version.
+    """
+    if_match = request.headers.get("If-Match")
+
+    if not if_match or if_match.strip() == "*":
+        return
+
+    if etag not in parse_etags(if_match):
+        raise PreconditionFailed()
@@ -1,2 +1,35 @@
 pagination_page_size = 10
 
+bulk_task_max_items = 500
+
+task_acl_cache_timeout = 60 * 5
+
+user_cache_timeout = 60 * 5
+
+task_list_cache_timeout = 60
+
+sync_batch_size = 500
+
+# seconds, longer than any transaction writing tasks
+sync_watermark_lag = 60
+
+search_config = "english"
+
+autocomplete_min_length = 3
+
+autocomplete_max_results = 10
+
+export_chunk_size = 2000
+
+import_batch_size = 1000
+
+user_cascade_batch_size = 1000
+
+# batches of a user delete or restore processed within the API request, the
+# `cascade_user --resume` command finishes larger cascades
+user_cascade_request_batches = 5
+
+history_partition_months_ahead = 3
+
+# months before the current one a task history list covers by default
+history_list_months = 3
@@ -0,0 +1,91 @@
+import random
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.core.cache import cache
+
+# False only while a safe request of a user without recent writes is being
+# served, everything else (writes, management commands, shells, scripts)
+# reads from the primary
+_use_primary = ContextVar("use_primary", default=True)
+
+# set once the current request sent a write to the primary
+_wrote = ContextVar("wrote", default=False)
+
+
+def start_routing(use_replicas):
+    """
+    Start routing a request, reads go to the replicas when `use_replicas` is
+    set. Returns the tokens `reset_routing` expects.
+    """
+    return _use_primary.set(not use_replicas), _wrote.set(False)
+
+
+def reset_routing(tokens):
+    use_primary_token, wrote_token = tokens
+    _use_primary.reset(use_primary_token)
+    _wrote.reset(wrote_token)
+
+
+def has_written():
+    return _wrote.get()
+
+
+def is_reading_primary_over_replicas():
+    """
+    Whether replicas are configured but the current reads stay on the
+    primary, because the user wrote recently or the request is a write.
+    """
+    return bool(settings.DATABASE_REPLICAS) and _use_primary.get()
+
+
+def _pin_key(user_id):
+    return f"db_primary_pin:{user_id}"
+
+
+def pin_to_primary(user_id):
+    """
+    Keep the reads of a user on the primary until the replicas have caught
+    up with their write.
+    """
+    cache.set(_pin_key(user_id), 1, settings.REPLICA_READ_YOUR_WRITES_SECONDS)
+
+
+def is_pinned_to_primary(user_id):
+    return cache.get(_pin_key(user_id)) is not None
+
+
+async def apin_to_primary(user_id):
+    await cache.aset(_pin_key(user_id), 1, settings.REPLICA_READ_YOUR_WRITES_SECONDS)
+
+
+async def ais_pinned_to_primary(user_id):
+    return await cache.aget(_pin_key(user_id)) is not None
+
+
+class ReplicaRouter:
+    """
+    Reads go to a random replica alias of DATABASE_REPLICAS when the current
+    context allows it, writes and migrations always go to the primary.
+
+    A write switches the rest of the context to the primary, so a request
+    reading back what it just wrote never hits a lagging replica.
+    """
+
+    def db_for_read(self, model, **hints):
+        if _use_primary.get() or not settings.DATABASE_REPLICAS:
+            return "default"
+
+        return random.choice(settings.DATABASE_REPLICAS)
+
+    def db_for_write(self, model, **hints):
+        _use_primary.set(True)
+        _wrote.set(True)
+        return "default"
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # replicas hold the same rows as the primary
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        return db == "default"
@@ -2,6 +2,7 @@ from rest_framework.views import exception_handler
 from rest_framework.response import Response
 from rest_framework import status
 from rest_framework.exceptions import (
+    APIException,
     ValidationError,
     AuthenticationFailed,
     PermissionDenied,
@@ -11,6 +12,11 @@ from rest_framework.exceptions import (
 from django.http import JsonResponse
 
 
+class PreconditionFailed(APIException):
+    status_code = status.HTTP_412_PRECONDITION_FAILED
+    default_detail = "The resource has been modified since it was retrieved."
+    default_code = "precondition_failed"
+
 
 def custom_api_exception_handler(exc, context):
     response = exception_handler(exc, context)
@@ -0,0 +1,122 @@
+import base64
+import binascii
+import json
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from rest_framework_simplejwt.settings import api_settings
+
+from core.cache import is_shared_cache
+from core.db_router import (
+    ais_pinned_to_primary,
+    apin_to_primary,
+    has_written,
+    is_pinned_to_primary,
+    pin_to_primary,
+    reset_routing,
+    start_routing,
+)
+
+SAFE_METHODS = ("GET", "HEAD", "OPTIONS")
+
+
+def get_token_user_id(request):
+    """
+    Id of the user of the request's bearer token.
+
+    The middleware runs before DRF authenticates the token, so the user id
+    claim is read from the unverified token. It only decides which database
+    serves the reads, a forged token still fails authentication in the view.
+    """
+    parts = request.headers.get("Authorization", "").split()
+    if len(parts) != 2 or parts[0] not in api_settings.AUTH_HEADER_TYPES:
+        return None
+
+    try:
+        payload = parts[1].split(".")[1]
+        claims = json.loads(base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4)))
+        return str(claims[api_settings.USER_ID_CLAIM])
+    except (IndexError, KeyError, TypeError, ValueError, binascii.Error):
+        return None
+
+
+def get_request_user_id(request):
+    """
+    Id of the user making the request, session users (admin site) included.
+    """
+    user = getattr(request, "user", None)
+    if user is not None and user.is_authenticated:
+        return str(user.pk)
+
+    return get_token_user_id(request)
+
+
+class ReplicaRoutingMiddleware:
+    """
+    Serve safe requests from the read replicas, except for users who wrote
+    within the last REPLICA_READ_YOUR_WRITES_SECONDS, whose reads stay on
+    the primary so they see their own changes.
+
+    The pins live in the cache, every worker must see them or a user's next
+    request on another worker would read from a lagging replica.
+
+    Sync and async capable, so the async views keep running on the event
+    loop under ASGI. The async path only knows token users, the session
+    user would need a database read before the view runs.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        if settings.DATABASE_REPLICAS and not is_shared_cache():
+            raise ImproperlyConfigured(
+                "Read replicas need a cache shared by every worker for the "
+                "read-your-writes pins, set CACHE_BACKEND to redis or memcached."
+            )
+
+        self.get_response = get_response
+
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+
+        user_id = get_request_user_id(request)
+        use_replicas = request.method in SAFE_METHODS and not (
+            user_id is not None and is_pinned_to_primary(user_id)
+        )
+
+        tokens = start_routing(use_replicas)
+        try:
+            response = self.get_response(request)
+
+            if has_written() and response.status_code < 400:
+                # DRF sets the authenticated user on the request in the view
+                user_id = get_request_user_id(request) or user_id
+                if user_id is not None:
+                    pin_to_primary(user_id)
+
+            return response
+        finally:
+            reset_routing(tokens)
+
+    async def __acall__(self, request):
+        user_id = get_token_user_id(request)
+        use_replicas = request.method in SAFE_METHODS and not (
+            user_id is not None and await ais_pinned_to_primary(user_id)
+        )
+
+        tokens = start_routing(use_replicas)
+        try:
+            response = await self.get_response(request)
+
+            if has_written() and response.status_code < 400 and user_id is not None:
+                await apin_to_primary(user_id)
+
+            return response
+        finally:
+            reset_routing(tokens)
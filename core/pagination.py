@@ -1,8 +1,48 @@
-from rest_framework.pagination import PageNumberPagination
+import base64
+import binascii
+import json
+import uuid
+
+from django.core.paginator import InvalidPage
+from django.db.models import Q
+from django.utils.dateparse import parse_datetime
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination, PageNumberPagination
+from rest_framework.utils.urls import replace_query_param
+
 from core.constants import pagination_page_size
+
+
 class DefaultPagination(PageNumberPagination):
     page_size = pagination_page_size
 
+    async def apaginate_queryset(self, queryset, request, view=None):
+        """
+        `paginate_queryset` for async views, the count and the page rows
+        are fetched with the async ORM.
+        """
+        self.request = request
+        count = await queryset.acount()
+
+        # paginate the row positions, the page's range selects the rows
+        paginator = self.django_paginator_class(range(count), self.page_size)
+        page_number = self.get_page_number(request, paginator)
+
+        try:
+            self.page = paginator.page(page_number)
+        except InvalidPage as exc:
+            raise NotFound(
+                self.invalid_page_message.format(
+                    page_number=page_number, message=str(exc)
+                )
+            )
+
+        bounds = self.page.object_list
+        self.page.object_list = [
+            row async for row in queryset[bounds.start:bounds.stop]
+        ]
+        return list(self.page)
+
     def get_root_pagination_data(self):
         return {
             "total_count": self.page.paginator.count,
@@ -11,3 +51,177 @@ class DefaultPagination(PageNumberPagination):
             "page": self.page.number,
         }
 
+
+def encode_cursor(payload):
+    """
+    Encode a dict into an opaque, url-safe cursor string.
+    """
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode()
+
+
+def decode_cursor(value):
+    """
+    Decode a cursor produced by `encode_cursor`, returns None when invalid.
+    """
+    try:
+        raw = base64.urlsafe_b64decode(value.encode())
+        payload = json.loads(raw)
+    except (binascii.Error, ValueError, UnicodeError):
+        return None
+
+    if not isinstance(payload, dict):
+        return None
+
+    return payload
+
+
+class KeysetPagination(BasePagination):
+    """
+    Cursor pagination keyed on (created_at, id).
+
+    Pages are fetched with a WHERE clause on the last seen row instead of an
+    OFFSET, so deep pages cost the same as the first one. The total count is
+    only computed when the client asks for it with `include_count=true`.
+    """
+
+    page_size = pagination_page_size
+    cursor_query_param = "cursor"
+    count_query_param = "include_count"
+    invalid_cursor_message = "Invalid cursor"
+
+    def paginate_queryset(self, queryset, request, view=None):
+        window = self.get_window(queryset, request)
+
+        if self.count_requested:
+            self.total_count = queryset.count()
+
+        return self.set_page(list(window))
+
+    async def apaginate_queryset(self, queryset, request, view=None):
+        """
+        `paginate_queryset` for async views.
+        """
+        window = self.get_window(queryset, request)
+
+        if self.count_requested:
+            self.total_count = await queryset.acount()
+
+        return self.set_page([row async for row in window])
+
+    def get_window(self, queryset, request):
+        """
+        Read the cursor from the request and return the unevaluated
+        queryset of the page, with one extra row to detect a next page.
+        """
+        self.request = request
+        self.base_url = request.build_absolute_uri()
+
+        cursor = request.query_params.get(self.cursor_query_param)
+        position = self.decode_position(cursor) if cursor else None
+        reverse = bool(position and position["reverse"])
+
+        self.position = position
+        self.reverse = reverse
+        self.total_count = None
+        self.count_requested = (
+            request.query_params.get(self.count_query_param) == "true"
+        )
+
+        if position:
+            created_at, pk = position["created_at"], position["id"]
+            if reverse:
+                queryset = queryset.filter(
+                    Q(created_at__gt=created_at)
+                    | Q(created_at=created_at, id__gt=pk)
+                )
+            else:
+                queryset = queryset.filter(
+                    Q(created_at__lt=created_at)
+                    | Q(created_at=created_at, id__lt=pk)
+                )
+
+        if reverse:
+            queryset = queryset.order_by("created_at", "id")
+        else:
+            queryset = queryset.order_by("-created_at", "-id")
+
+        return queryset[: self.page_size + 1]
+
+    def set_page(self, rows):
+        has_more = len(rows) > self.page_size
+        rows = rows[: self.page_size]
+
+        if self.reverse:
+            rows.reverse()
+            self.has_next = self.position is not None
+            self.has_previous = has_more
+        else:
+            self.has_next = has_more
+            self.has_previous = self.position is not None
+
+        self.page = rows
+        return rows
+
+    def decode_position(self, cursor):
+        payload = decode_cursor(cursor)
+
+        try:
+            created_at = parse_datetime(payload["c"])
+            pk = uuid.UUID(payload["i"])
+            reverse = bool(payload.get("r"))
+        except (KeyError, TypeError, ValueError):
+            raise NotFound(self.invalid_cursor_message)
+
+        if created_at is None:
+            raise NotFound(self.invalid_cursor_message)
+
+        return {"created_at": created_at, "id": pk, "reverse": reverse}
+
+    def encode_position(self, row, reverse):
+        return encode_cursor(
+            {
+                "c": row.created_at.isoformat(),
+                "i": str(row.pk),
+                "r": int(reverse),
+            }
+        )
+
+    def get_next_link(self):
+        if not self.has_next or not self.page:
+            return None
+
+        cursor = self.encode_position(self.page[-1], reverse=False)
+        return replace_query_param(self.base_url, self.cursor_query_param, cursor)
+
+    def get_previous_link(self):
+        if not self.has_previous or not self.page:
+            return None
+
+        cursor = self.encode_position(self.page[0], reverse=True)
+        return replace_query_param(self.base_url, self.cursor_query_param, cursor)
+
+    def get_root_pagination_data(self):
+        return {
+            "total_count": self.total_count,
+            "next": self.get_next_link(),
+            "previous": self.get_previous_link(),
+        }
+
+
+def get_paginator(request):
+    """
+    Return the paginator requested by the client.
+
+    `?pagination=cursor` (or any `cursor` param) switches to keyset
+    pagination, everything else keeps page number pagination.
+    """
+    params = request.query_params
+
+    if (
+        params.get("pagination") == "cursor"
+        or KeysetPagination.cursor_query_param in params
+    ):
+        return KeysetPagination()
+
+    return DefaultPagination()
@@ -1,5 +1,6 @@
 from rest_framework.permissions import BasePermission
 from core.choices import UserRoleChoices
+from tasks.cache import get_task_acl
 
 
 
@@ -25,7 +26,7 @@ class IsAdmin(BasePermission):
         return (
             request.user
             and request.user.is_authenticated
-            and request.user.role == UserRoleChoices.ADMIN
+            and request.user.role == UserRoleChoices.TENANT_ADMIN
         )
 
 
@@ -36,24 +37,24 @@ class IsAdminOrSelf(BasePermission):
     """
 
     def has_object_permission(self, request, view, obj):
-        if request.user.role == UserRoleChoices.ADMIN:
+        if request.user.role == UserRoleChoices.TENANT_ADMIN:
             return True
 
         return obj == request.user
 
 class CanViewTask(BasePermission):
     """
-    Admin: can view all tasks
+    Admin: can view all tasks of their organization
     User: can view only tasks assigned to them
     """
 
     def has_object_permission(self, request, view, obj):
         user = request.user
 
-        if user.role == UserRoleChoices.ADMIN:
-            return True
+        if user.role == UserRoleChoices.TENANT_ADMIN:
+            return obj.organization_id == user.organization_id
 
-        return obj.assignee == user
+        return obj.assignee_id == user.id
 
 
 class CanUpdateTask(BasePermission):
@@ -65,10 +66,10 @@ class CanUpdateTask(BasePermission):
     def has_object_permission(self, request, view, obj):
         user = request.user
 
-        if user.role == UserRoleChoices.ADMIN:
-            return obj.owner == user
+        if user.role == UserRoleChoices.TENANT_ADMIN:
+            return obj.owner_id == user.id
 
-        return obj.assignee == user or obj.owner == user
+        return obj.assignee_id == user.id or obj.owner_id == user.id
 
 
 class CanDeleteTask(BasePermission):
@@ -83,13 +84,13 @@ class CanDeleteTask(BasePermission):
     def has_object_permission(self, request, view, obj):
         user = request.user
 
-        if user.role == UserRoleChoices.ADMIN:
-            return obj.owner == user
+        if user.role == UserRoleChoices.TENANT_ADMIN:
+            return obj.owner_id == user.id
 
         return (
             user.role == UserRoleChoices.USER
-            and obj.owner == user
-            and obj.assignee == user
+            and obj.owner_id == user.id
+            and obj.assignee_id == user.id
         )
 
 
@@ -103,14 +104,14 @@ class CanViewOrCreateComment(BasePermission):
 
     def has_object_permission(self, request, view, obj):
         """
-        obj → Task
+        obj → Task or TaskACL
         """
         user = request.user
 
-        if user.role == UserRoleChoices.ADMIN:
-            return obj.owner == user
+        if user.role == UserRoleChoices.TENANT_ADMIN:
+            return obj.owner_id == user.id
 
-        return obj.owner == user or obj.assignee == user
+        return obj.owner_id == user.id or obj.assignee_id == user.id
 
 
 class CanUpdateComment(BasePermission):
@@ -126,12 +127,12 @@ class CanUpdateComment(BasePermission):
         obj → Comment
         """
         user = request.user
-        task = obj.task
+        task = get_task_acl(obj.task_id)
 
-        if user.role == UserRoleChoices.ADMIN:
-            return task.owner == user
+        if user.role == UserRoleChoices.TENANT_ADMIN:
+            return task.owner_id == user.id
 
-        return obj.user == user
+        return obj.user_id == user.id
 
 
 class CanDeleteComment(BasePermission):
@@ -147,32 +148,32 @@ class CanDeleteComment(BasePermission):
         obj → Comment
         """
         user = request.user
-        task = obj.task
+        task = get_task_acl(obj.task_id)
 
-        if user.role == UserRoleChoices.ADMIN:
-            return task.owner == user
+        if user.role == UserRoleChoices.TENANT_ADMIN:
+            return task.owner_id == user.id
 
-        return obj.user == user
+        return obj.user_id == user.id
     
 
 
 class CanViewTaskHistory(BasePermission):
     """
     Admin:
-        - can view history of all tasks
+        - can view history of all tasks of their organization
     User:
         - can view history only for tasks assigned to them
     """
 
     def has_object_permission(self, request, view, obj):
         """
-        obj → Task
+        obj → Task or TaskACL
         """
         user = request.user
 
-        if user.role == UserRoleChoices.ADMIN:
-            return True
+        if user.role == UserRoleChoices.TENANT_ADMIN:
+            return obj.organization_id == user.organization_id
 
-        return obj.assignee == user
+        return obj.assignee_id == user.id
     
     
\ No newline at end of file
@@ -0,0 +1,40 @@
+from rest_framework import serializers
+
+from core.constants import autocomplete_min_length
+
+
+class EagerLoadingMixin:
+    """
+    Lets a read serializer declare the relations it renders.
+
+    `select_related_fields` names nested serializer fields backed by a foreign
+    key. `setup_eager_loading` joins them in the same query and restricts the
+    related columns to the ones the nested serializer actually outputs.
+    Columns listed in `defer_fields` are not loaded at all.
+    """
+
+    select_related_fields = ()
+    defer_fields = ()
+
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        if not cls.select_related_fields:
+            return queryset
+
+        columns = [
+            field.name
+            for field in queryset.model._meta.concrete_fields
+            if field.name not in cls.defer_fields
+        ]
+
+        for relation in cls.select_related_fields:
+            nested = cls._declared_fields[relation]
+            columns.extend(
+                f"{relation}__{name}" for name in nested.Meta.fields
+            )
+
+        return queryset.select_related(*cls.select_related_fields).only(*columns)
+
+
+class AutocompleteQuerySerializer(serializers.Serializer):
+    q = serializers.CharField(min_length=autocomplete_min_length, max_length=100)
@@ -0,0 +1,47 @@
+from contextlib import contextmanager
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+
+@contextmanager
+def assert_num_queries(expected, using=connection):
+    """
+    Fail when the wrapped block runs a different number of queries.
+
+    Usable outside of `TestCase` (scripts, pytest functions), the captured
+    SQL is included in the failure message.
+    """
+    with CaptureQueriesContext(using) as context:
+        yield context
+
+    executed = len(context.captured_queries)
+    if executed != expected:
+        queries = "\n".join(
+            f"{index}. {query['sql']}"
+            for index, query in enumerate(context.captured_queries, start=1)
+        )
+        raise AssertionError(
+            f"{executed} queries executed, {expected} expected.\n{queries}"
+        )
+
+
+def assert_endpoint_queries(client, method, path, expected, **kwargs):
+    """
+    Call an endpoint with the given client and assert its query count.
+    """
+    with assert_num_queries(expected):
+        response = getattr(client, method.lower())(path, **kwargs)
+
+    return response
+
+
+def table_reads(context, table):
+    """
+    SQL of the captured SELECTs reading from `table`, joins excluded.
+    """
+    return [
+        query["sql"]
+        for query in context.captured_queries
+        if query["sql"].startswith("SELECT") and f'FROM "{table}"' in query["sql"]
+    ]
@@ -0,0 +1,6 @@
+from django.urls import path
+from core.views import DatabasePoolStatsAPIView
+
+urlpatterns = [
+    path("internal/db-pool/", DatabasePoolStatsAPIView.as_view()),
+]
@@ -0,0 +1,61 @@
+from django.db import connections
+from rest_framework.views import APIView
+from rest_framework.response import Response
+from rest_framework import status
+
+from core.permissions import IsSuperAdmin
+
+
+def get_pool_stats(alias):
+    """
+    Connection pool counters of a database alias in this process, None when
+    the alias is not pooled.
+
+    `in_use` and `waiting` are the current state, the other counters are
+    cumulative since the pool was opened. Wait times are in milliseconds.
+    """
+    pool = connections[alias].pool
+    if pool is None:
+        return None
+
+    stats = pool.get_stats()
+    requests = stats.get("requests_num", 0)
+    wait_ms = stats.get("requests_wait_ms", 0)
+
+    return {
+        "min_size": stats["pool_min"],
+        "max_size": stats["pool_max"],
+        "size": stats["pool_size"],
+        "available": stats["pool_available"],
+        "in_use": stats["pool_size"] - stats["pool_available"],
+        "waiting": stats["requests_waiting"],
+        "requests": requests,
+        "requests_queued": stats.get("requests_queued", 0),
+        "requests_errors": stats.get("requests_errors", 0),
+        "wait_ms_total": wait_ms,
+        "wait_ms_avg": round(wait_ms / requests, 2) if requests else 0,
+        "connections_opened": stats.get("connections_num", 0),
+        "connections_errors": stats.get("connections_errors", 0),
+        "connections_lost": stats.get("connections_lost", 0),
+        "returns_bad": stats.get("returns_bad", 0),
+    }
+
+
+class DatabasePoolStatsAPIView(APIView):
+    """
+    Pool statistics of the worker process serving the request, every process
+    owns its pools so poll a few times to sample several workers.
+    """
+    permission_classes = [IsSuperAdmin]
+
+    def get(self, request):
+        data = {alias: get_pool_stats(alias) for alias in connections}
+
+        return Response(
+            {
+                "status": "success",
+                "message": "Database pool statistics retrieved successfully",
+                "data": data,
+            },
+            status=status.HTTP_200_OK,
+        )
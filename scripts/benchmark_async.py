@@ -0,0 +1,110 @@
+"""
+Concurrency benchmark of the task read path for TaskVault
+
+Opens many concurrent keep-alive clients against two running servers and
+reports throughput and latency percentiles of the same read endpoint:
+
+    - the synchronous views under WSGI threads, e.g.
+        gunicorn config.wsgi -w 4 --threads 32 -b :8000
+    - the async views under ASGI, e.g.
+        uvicorn config.asgi:application --workers 4 --port 8001
+
+Each client sends BENCH_REQUESTS requests one after another on its own
+connection. A client counts as failed when its connection cannot be opened
+or a response is not a 200.
+
+Usage:
+    BENCH_TOKEN=<access token> BENCH_CLIENTS=500 python scripts/benchmark_async.py
+"""
+
+import asyncio
+import os
+import statistics
+import time
+from urllib.parse import urlsplit
+
+TOKEN = os.environ["BENCH_TOKEN"]
+CLIENTS = int(os.getenv("BENCH_CLIENTS", "500"))
+REQUESTS = int(os.getenv("BENCH_REQUESTS", "20"))
+TARGETS = {
+    "wsgi": os.getenv("BENCH_WSGI_URL", "http://127.0.0.1:8000/api/v1/tasks/"),
+    "asgi": os.getenv("BENCH_ASGI_URL", "http://127.0.0.1:8001/api/v1/async/tasks/"),
+}
+
+
+async def read_response(reader):
+    status_line = await reader.readline()
+    status = int(status_line.split()[1])
+
+    length = 0
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        if name.strip().lower() == "content-length":
+            length = int(value)
+
+    await reader.readexactly(length)
+    return status
+
+
+async def client(url, timings, failures):
+    parts = urlsplit(url)
+    path = parts.path + (f"?{parts.query}" if parts.query else "")
+    request = (
+        f"GET {path} HTTP/1.1\r\n"
+        f"Host: {parts.netloc}\r\n"
+        f"Authorization: Bearer {TOKEN}\r\n"
+        "Connection: keep-alive\r\n\r\n"
+    ).encode()
+
+    try:
+        reader, writer = await asyncio.open_connection(parts.hostname, parts.port or 80)
+    except OSError:
+        failures.append(None)
+        return
+
+    try:
+        for _ in range(REQUESTS):
+            started = time.perf_counter()
+            writer.write(request)
+            await writer.drain()
+            status = await read_response(reader)
+            timings.append((time.perf_counter() - started) * 1000)
+
+            if status != 200:
+                failures.append(status)
+    except (OSError, asyncio.IncompleteReadError, IndexError, ValueError):
+        failures.append(None)
+    finally:
+        writer.close()
+
+
+async def bench(name, url):
+    timings, failures = [], []
+
+    started = time.perf_counter()
+    await asyncio.gather(*(client(url, timings, failures) for _ in range(CLIENTS)))
+    elapsed = time.perf_counter() - started
+
+    if len(timings) < 2:
+        print(f"{name}: no responses, is {url} up?")
+        return
+
+    quantiles = statistics.quantiles(timings, n=100)
+    print(
+        f"{name}: {len(timings)} requests in {elapsed:.1f}s "
+        f"({len(timings) / elapsed:.0f} req/s), {len(failures)} failures, "
+        f"p50={quantiles[49]:.1f}ms p95={quantiles[94]:.1f}ms "
+        f"p99={quantiles[98]:.1f}ms max={max(timings):.1f}ms"
+    )
+
+
+async def run():
+    print(f"{CLIENTS} concurrent clients, {REQUESTS} requests each")
+    for name, url in TARGETS.items():
+        await bench(name, url)
+
+
+asyncio.run(run())
@@ -0,0 +1,69 @@
+"""
+Authentication benchmark for TaskVault
+
+Compares requests per second on an authenticated endpoint with the stock
+JWTAuthentication and with CachedJWTAuthentication.
+
+Usage:
+    python manage.py shell < scripts/benchmark_auth.py
+"""
+
+import os
+import time
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIRequestFactory
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from users.authentication import CachedJWTAuthentication
+from users.views import UserDetailUpdateDeleteAPIView
+
+User = get_user_model()
+
+BENCH_USERNAME = "bench_auth_user"
+REQUESTS = int(os.getenv("BENCH_REQUESTS", "2000"))
+
+
+def measure(authentication_class, user, token):
+    view = UserDetailUpdateDeleteAPIView.as_view(
+        authentication_classes=[authentication_class]
+    )
+    factory = APIRequestFactory()
+    path = f"/api/v1/users/{user.id}/"
+
+    cache.clear()
+
+    with CaptureQueriesContext(connection) as queries:
+        started = time.perf_counter()
+        for _ in range(REQUESTS):
+            request = factory.get(path, HTTP_AUTHORIZATION=f"Bearer {token}")
+            response = view(request, id=user.id)
+            assert response.status_code == 200, response.data
+        elapsed = time.perf_counter() - started
+
+    return REQUESTS / elapsed, len(queries.captured_queries) / REQUESTS
+
+
+def run():
+    user, _ = User.objects.get_or_create(
+        username=BENCH_USERNAME,
+        defaults={"email": f"{BENCH_USERNAME}@example.com"},
+    )
+    token = str(RefreshToken.for_user(user).access_token)
+
+    try:
+        for authentication_class in (JWTAuthentication, CachedJWTAuthentication):
+            rps, queries = measure(authentication_class, user, token)
+            print(
+                f"{authentication_class.__name__:<28} "
+                f"{rps:>10.1f} req/s  {queries:.2f} queries/request"
+            )
+    finally:
+        user.delete()
+
+
+run()
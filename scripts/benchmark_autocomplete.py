@@ -0,0 +1,93 @@
+"""
+Autocomplete benchmark for TaskVault
+
+Loads a large number of synthetic tasks and reports latency percentiles of
+the task title autocomplete query for random 3 to 5 character fragments.
+
+Usage:
+    BENCH_ROWS=1000000 python manage.py shell < scripts/benchmark_autocomplete.py
+"""
+
+import os
+import random
+import statistics
+import string
+import time
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+
+from tasks.models import Task
+from tasks.search import autocomplete_tasks
+from tasks.services import get_visible_tasks
+
+User = get_user_model()
+
+BENCH_USERNAME = "bench_autocomplete_user"
+ROWS = int(os.getenv("BENCH_ROWS", "1000000"))
+QUERIES = int(os.getenv("BENCH_QUERIES", "500"))
+BATCH_SIZE = 10000
+
+WORDS = [
+    "invoice", "deploy", "review", "migrate", "report", "refactor", "billing",
+    "onboarding", "release", "backup", "audit", "customer", "dashboard",
+    "export", "import", "schedule", "payment", "security", "upgrade", "sync",
+]
+
+
+def load(user):
+    created = 0
+    while created < ROWS:
+        size = min(BATCH_SIZE, ROWS - created)
+        Task.objects.bulk_create(
+            Task(
+                owner=user,
+                assignee=user,
+                title=f"{' '.join(random.sample(WORDS, 3))} {created + index}",
+            )
+            for index in range(size)
+        )
+        created += size
+
+    with connection.cursor() as cursor:
+        cursor.execute("ANALYZE tasks")
+
+
+def fragment():
+    word = random.choice(WORDS + [string.digits])
+    length = random.randint(3, 5)
+    start = random.randint(0, max(len(word) - length, 0))
+    return word[start:start + length]
+
+
+def run():
+    user, _ = User.objects.get_or_create(
+        username=BENCH_USERNAME,
+        defaults={"email": f"{BENCH_USERNAME}@example.com"},
+    )
+
+    try:
+        started = time.perf_counter()
+        load(user)
+        print(f"loaded {ROWS} tasks in {time.perf_counter() - started:.1f}s")
+
+        timings = []
+        for _ in range(QUERIES):
+            text = fragment()
+            started = time.perf_counter()
+            list(autocomplete_tasks(get_visible_tasks(user), text))
+            timings.append((time.perf_counter() - started) * 1000)
+
+        percentiles = statistics.quantiles(timings, n=100)
+        print(
+            f"p50 {percentiles[49]:.2f}ms  "
+            f"p95 {percentiles[94]:.2f}ms  "
+            f"p99 {percentiles[98]:.2f}ms"
+        )
+    finally:
+        with connection.cursor() as cursor:
+            cursor.execute("DELETE FROM tasks WHERE owner_id = %s", [user.id])
+        user.delete()
+
+
+run()
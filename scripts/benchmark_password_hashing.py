@@ -0,0 +1,72 @@
+"""
+Password hashing benchmark for TaskVault
+
+Measures register (hash a new password) and login (verify a password)
+throughput per core for every configured hasher, so login pods can be sized
+from PASSWORD_HASHER / PASSWORD_HASH_ITERATIONS.
+
+Usage:
+    python manage.py shell < scripts/benchmark_password_hashing.py
+
+BENCH_ROUNDS sets the number of operations per measurement and
+BENCH_PBKDF2_ITERATIONS (comma separated) adds PBKDF2 iteration counts to
+compare against the configured one.
+"""
+
+import os
+import time
+
+from django.conf import settings
+from django.test.utils import override_settings
+from django.utils.module_loading import import_string
+
+PASSWORD = "Benchmark@Password1"
+ROUNDS = int(os.getenv("BENCH_ROUNDS", "20"))
+PBKDF2_ITERATIONS = [
+    int(value)
+    for value in os.getenv("BENCH_PBKDF2_ITERATIONS", "").split(",")
+    if value.strip()
+]
+
+
+def measure(hasher):
+    started = time.perf_counter()
+    for _ in range(ROUNDS):
+        encoded = hasher.encode(PASSWORD, hasher.salt())
+    register_rate = ROUNDS / (time.perf_counter() - started)
+
+    started = time.perf_counter()
+    for _ in range(ROUNDS):
+        assert hasher.verify(PASSWORD, encoded)
+    login_rate = ROUNDS / (time.perf_counter() - started)
+
+    return register_rate, login_rate
+
+
+def report(label, hasher):
+    try:
+        register_rate, login_rate = measure(hasher)
+    except ValueError as exc:
+        # optional hasher libraries (argon2-cffi, bcrypt) may be missing
+        print(f"{label:<45} skipped: {exc}")
+        return
+
+    print(
+        f"{label:<45} register {register_rate:>8.1f}/s   login {login_rate:>8.1f}/s"
+    )
+
+
+def run():
+    print(f"{ROUNDS} operations per measurement, single core\n")
+
+    for path in settings.PASSWORD_HASHERS:
+        hasher = import_string(path)()
+        report(path.rsplit(".", 1)[-1], hasher)
+
+    for iterations in PBKDF2_ITERATIONS:
+        with override_settings(PASSWORD_HASH_ITERATIONS=iterations):
+            hasher = import_string(settings.PASSWORD_HASHER_CHOICES["pbkdf2"])()
+            report(f"PBKDF2 ({iterations} iterations)", hasher)
+
+
+run()
@@ -23,7 +23,7 @@ def run():
         email=ADMIN_EMAIL,
         first_name="System",
         last_name="Administrator",
-        role=UserRoleChoices.ADMIN,
+        role=UserRoleChoices.TENANT_ADMIN,
         is_staff=True,        
         is_superuser=True,   
     )
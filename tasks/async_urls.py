@@ -0,0 +1,11 @@
+from django.urls import path
+from tasks.views import AsyncTaskListAPIView , AsyncTaskDetailAPIView , AsyncTaskHistoryListAPIView , AsyncTaskCommentListAPIView
+
+# read only endpoints served by async views, only useful behind the ASGI
+# entry point (config.asgi), under WSGI every request runs in its own thread
+urlpatterns = [
+    path("tasks/", AsyncTaskListAPIView.as_view()),
+    path("tasks/<uuid:id>/", AsyncTaskDetailAPIView.as_view()),
+    path("tasks/<uuid:task_id>/history/", AsyncTaskHistoryListAPIView.as_view()),
+    path("tasks/<uuid:task_id>/comments/", AsyncTaskCommentListAPIView.as_view()),
+]
@@ -0,0 +1,226 @@
+import hashlib
+import time
+import uuid
+from collections import namedtuple
+
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS, transaction
+from django.http import Http404
+
+from core.choices import UserRoleChoices
+from core.constants import task_acl_cache_timeout, task_list_cache_timeout
+from core.db_router import is_reading_primary_over_replicas
+from tasks.models import Task
+
+
+TaskACL = namedtuple(
+    "TaskACL",
+    ["id", "organization_id", "owner_id", "assignee_id", "deleted_at"],
+)
+
+
+def _task_acl_key(task_id):
+    # versioned with the TaskACL fields, entries pickled with other fields
+    # would not unpickle
+    return f"task_acl:v2:{task_id}"
+
+
+def get_task_acl(task_id):
+    """
+    Return the access control fields of a task, cached by task id.
+
+    Permission checks only need the organization, owner and assignee ids, so
+    views can authorize a request without loading the task or its users.
+    """
+    key = _task_acl_key(task_id)
+    acl = cache.get(key)
+
+    if acl is None:
+        row = _task_acl_query(task_id).first()
+        if row is None:
+            return None
+
+        acl = TaskACL(*row)
+        cache.set(key, acl, task_acl_cache_timeout)
+
+    return acl
+
+
+async def aget_task_acl(task_id):
+    """
+    `get_task_acl` for async views.
+    """
+    key = _task_acl_key(task_id)
+    acl = await cache.aget(key)
+
+    if acl is None:
+        row = await _task_acl_query(task_id).afirst()
+        if row is None:
+            return None
+
+        acl = TaskACL(*row)
+        await cache.aset(key, acl, task_acl_cache_timeout)
+
+    return acl
+
+
+def _task_acl_query(task_id):
+    # read from the primary, a lagging replica would put a stale entry back
+    # in the cache right after an invalidation
+    return (
+        Task.objects.using(DEFAULT_DB_ALIAS)
+        .filter(id=task_id)
+        .values_list(*TaskACL._fields)
+    )
+
+
+def _live_or_404(acl):
+    if acl is None or acl.deleted_at is not None:
+        raise Http404
+
+    return acl
+
+
+def get_task_acl_or_404(task_id):
+    return _live_or_404(get_task_acl(task_id))
+
+
+async def aget_task_acl_or_404(task_id):
+    return _live_or_404(await aget_task_acl(task_id))
+
+
+def invalidate_task_acl(*task_ids):
+    """
+    Drop cached ACL entries once the current transaction commits.
+    """
+    keys = [_task_acl_key(task_id) for task_id in task_ids]
+
+    if keys:
+        transaction.on_commit(lambda: cache.delete_many(keys))
+
+
+def _generation_key(scope):
+    return f"task_list_gen:{scope}"
+
+
+def _new_generation():
+    # time based so an evicted counter never restarts at a value that was
+    # already used for cached pages
+    return time.time_ns()
+
+
+def get_task_list_generation(scope):
+    key = _generation_key(scope)
+    generation = cache.get(key)
+
+    if generation is None:
+        cache.add(key, _new_generation(), None)
+        generation = cache.get(key)
+
+    return generation
+
+
+async def aget_task_list_generation(scope):
+    key = _generation_key(scope)
+    generation = await cache.aget(key)
+
+    if generation is None:
+        await cache.aadd(key, _new_generation(), None)
+        generation = await cache.aget(key)
+
+    return generation
+
+
+def bump_task_list_generations(*, organization_ids=(), owner_ids=(), assignee_ids=()):
+    """
+    Make cached task list pages touching these organizations, owners or
+    assignees unreachable once the current transaction commits.
+    """
+    scopes = [f"org:{organization_id}" for organization_id in set(organization_ids)]
+    scopes += [f"owner:{owner_id}" for owner_id in set(owner_ids)]
+    scopes += [f"assignee:{assignee_id}" for assignee_id in set(assignee_ids)]
+
+    def bump():
+        for scope in scopes:
+            key = _generation_key(scope)
+            try:
+                cache.incr(key)
+            except ValueError:
+                cache.set(key, _new_generation(), None)
+
+    transaction.on_commit(bump)
+
+
+def _is_uuid(value):
+    try:
+        uuid.UUID(str(value))
+    except ValueError:
+        return False
+    return True
+
+
+def _task_list_scope(request):
+    """
+    The narrowest scope the listed tasks belong to.
+    """
+    user = request.user
+    params = request.query_params
+
+    if user.role != UserRoleChoices.TENANT_ADMIN:
+        return f"assignee:{user.id}"
+    if _is_uuid(params.get("assignee_id")):
+        return f"assignee:{params['assignee_id']}"
+    if _is_uuid(params.get("owner_id")):
+        return f"owner:{params['owner_id']}"
+    return f"org:{user.organization_id}"
+
+
+def _task_list_key(request, scope, generation):
+    user = request.user
+    query = sorted(request.query_params.lists())
+    digest = hashlib.md5(
+        f"{request.get_host()}{request.path}{query}".encode()
+    ).hexdigest()
+
+    return f"task_list:{user.id}:{user.role}:{scope}:{generation}:{digest}"
+
+
+def task_list_cache_key(request):
+    """
+    Cache key of a task list response.
+
+    Combines the user, its role, every query param and the generation of
+    the narrowest scope the listed tasks belong to.
+    """
+    scope = _task_list_scope(request)
+    return _task_list_key(request, scope, get_task_list_generation(scope))
+
+
+async def atask_list_cache_key(request):
+    scope = _task_list_scope(request)
+    return _task_list_key(request, scope, await aget_task_list_generation(scope))
+
+
+def get_cached_task_list(key):
+    # a page built from a lagging replica may be cached under the generation
+    # bumped by the user's own write, while pinned to the primary the page is
+    # rebuilt from the primary and overwrites it
+    if is_reading_primary_over_replicas():
+        return None
+
+    return cache.get(key)
+
+
+def set_cached_task_list(key, data):
+    cache.set(key, data, task_list_cache_timeout)
+
+
+async def aget_cached_task_list(key):
+    if is_reading_primary_over_replicas():
+        return None
+
+    return await cache.aget(key)
+
+
+async def aset_cached_task_list(key, data):
+    await cache.aset(key, data, task_list_cache_timeout)
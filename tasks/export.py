@@ -0,0 +1,73 @@
+import csv
+import json
+
+from django.core.serializers.json import DjangoJSONEncoder
+
+from core.constants import export_chunk_size
+from users.serializers import UserMiniDetailSerializer
+
+TASK_EXPORT_FIELDS = (
+    "id",
+    "title",
+    "description",
+    "status",
+    "priority",
+    "deadline",
+    "created_at",
+    "updated_at",
+)
+
+USER_EXPORT_FIELDS = UserMiniDetailSerializer.Meta.fields
+
+
+def _export_columns():
+    columns = list(TASK_EXPORT_FIELDS)
+    for relation in ("owner", "assignee"):
+        columns.extend(f"{relation}__{name}" for name in USER_EXPORT_FIELDS)
+    return columns
+
+
+def export_rows(queryset):
+    """
+    Flat dicts of the exported columns, fetched through a server-side cursor
+    in chunks so memory does not grow with the number of tasks.
+    """
+    return (
+        queryset
+        .values(*_export_columns())
+        .iterator(chunk_size=export_chunk_size)
+    )
+
+
+class _Echo:
+    """
+    File-like object handing back what csv.writer writes to it.
+    """
+
+    def write(self, value):
+        return value
+
+
+def stream_csv(queryset):
+    writer = csv.writer(_Echo())
+    columns = _export_columns()
+
+    yield writer.writerow(columns)
+    for row in export_rows(queryset):
+        yield writer.writerow([row[column] for column in columns])
+
+
+def stream_ndjson(queryset):
+    for row in export_rows(queryset):
+        task = {field: row[field] for field in TASK_EXPORT_FIELDS}
+        for relation in ("owner", "assignee"):
+            task[relation] = {
+                name: row[f"{relation}__{name}"] for name in USER_EXPORT_FIELDS
+            }
+        yield json.dumps(task, cls=DjangoJSONEncoder) + "\n"
+
+
+EXPORT_FORMATS = {
+    "csv": (stream_csv, "text/csv"),
+    "ndjson": (stream_ndjson, "application/x-ndjson"),
+}
@@ -0,0 +1,184 @@
+import csv
+import json
+from itertools import islice
+
+from django.db import connection, transaction
+from django.utils import timezone
+
+from core.constants import import_batch_size
+from tasks.search import refresh_task_search_vectors
+from tasks.serializers.bulk import TaskBulkCreateItemSerializer
+from tasks.services import build_bulk_tasks, notify_tasks_changed
+from tasks.stats import task_stats_key, record_task_stats
+
+IMPORT_FORMATS = ("csv", "ndjson")
+
+IMPORT_FIELDS = ("title", "description", "priority", "deadline", "assignee_id")
+
+STAGING_TABLE = "tasks_import_staging"
+
+STAGING_COLUMNS = (
+    "id",
+    "organization_id",
+    "owner_id",
+    "assignee_id",
+    "title",
+    "description",
+    "status",
+    "priority",
+    "deadline",
+    "created_at",
+    "updated_at",
+)
+
+INVALID_ROW = {"non_field_errors": ["Invalid row."]}
+
+
+def _clean_row(row):
+    # blank cells mean "not provided", like a key missing from a JSON payload
+    return {
+        field: row[field]
+        for field in IMPORT_FIELDS
+        if row.get(field) not in (None, "")
+    }
+
+
+def read_rows(lines, file_format):
+    """
+    Yield (line number, row) pairs from an iterable of text lines, one row at
+    a time. Unparseable rows are yielded as None.
+    """
+    if file_format == "csv":
+        reader = csv.DictReader(lines)
+        for row in reader:
+            yield reader.line_num, _clean_row(row)
+        return
+
+    for line, raw in enumerate(lines, start=1):
+        if not raw.strip():
+            continue
+
+        try:
+            row = json.loads(raw)
+        except ValueError:
+            row = None
+
+        yield line, _clean_row(row) if isinstance(row, dict) else None
+
+
+def _load_batch(tasks):
+    """
+    COPY a batch of unsaved tasks into the staging table and merge it into
+    tasks, skipping titles created concurrently.
+
+    Returns the tasks actually inserted.
+    """
+    now = timezone.now()
+    columns = ", ".join(STAGING_COLUMNS)
+
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.execute(
+            f"CREATE TEMP TABLE IF NOT EXISTS {STAGING_TABLE} "
+            f"(LIKE tasks INCLUDING DEFAULTS) ON COMMIT DELETE ROWS"
+        )
+
+        with cursor.copy(
+            f"COPY {STAGING_TABLE} ({columns}) FROM STDIN"
+        ) as copy:
+            for task in tasks:
+                copy.write_row(
+                    (
+                        task.id,
+                        task.organization_id,
+                        task.owner_id,
+                        task.assignee_id,
+                        task.title,
+                        task.description,
+                        task.status,
+                        task.priority,
+                        task.deadline,
+                        now,
+                        now,
+                    )
+                )
+
+        cursor.execute(
+            f"""
+            INSERT INTO tasks ({columns})
+            SELECT {columns} FROM {STAGING_TABLE}
+            ON CONFLICT (assignee_id, LOWER(title)) WHERE deleted_at IS NULL
+            DO NOTHING
+            RETURNING id
+            """
+        )
+        inserted = {row[0] for row in cursor.fetchall()}
+
+        created = [task for task in tasks if task.id in inserted]
+        for task in created:
+            task.created_at = task.updated_at = now
+
+        record_task_stats(added=[task_stats_key(task) for task in created])
+        notify_tasks_changed(created)
+        refresh_task_search_vectors([task.id for task in created])
+
+    return created
+
+
+def import_tasks(rows, *, user, batch_size=import_batch_size):
+    """
+    Import tasks owned by `user` from (line number, row) pairs.
+
+    Rows go through the bulk create validation in batches: field rules per
+    row, then one assignee and one duplicate title query per batch. Valid
+    rows are loaded with COPY, so memory only holds one batch at a time.
+
+    Returns a report with the imported count and the errors of every
+    rejected row by line number.
+    """
+    imported = 0
+    rejected = []
+    rows = iter(rows)
+
+    while batch := list(islice(rows, batch_size)):
+        valid = {}
+
+        for line, row in batch:
+            if row is None:
+                rejected.append({"line": line, "errors": INVALID_ROW})
+                continue
+
+            serializer = TaskBulkCreateItemSerializer(data=row)
+            if serializer.is_valid():
+                valid[line] = serializer.validated_data
+            else:
+                rejected.append({"line": line, "errors": serializer.errors})
+
+        tasks, errors = build_bulk_tasks(valid, user=user)
+        rejected.extend(
+            {"line": line, "errors": line_errors}
+            for line, line_errors in errors.items()
+        )
+
+        if tasks:
+            created = _load_batch(list(tasks.values()))
+            imported += len(created)
+
+            created_ids = {task.id for task in created}
+            rejected.extend(
+                {
+                    "line": line,
+                    "errors": {
+                        "title": ["Task with this title already exists for this user."]
+                    },
+                }
+                for line, task in tasks.items()
+                if task.id not in created_ids
+            )
+
+    rejected.sort(key=lambda error: error["line"])
+
+    return {
+        "imported": imported,
+        "rejected": len(rejected),
+        "errors": rejected,
+    }
@@ -0,0 +1,116 @@
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+
+from tasks.cache import invalidate_task_acl, bump_task_list_generations
+from tasks.stats import rebuild_task_stats
+
+# (table, UPDATE ... FROM filling organization_id of the given ids)
+BACKFILLS = (
+    (
+        "tasks",
+        """
+        UPDATE tasks SET organization_id = users.organization_id
+        FROM users
+        WHERE tasks.owner_id = users.id AND tasks.id = ANY(%s)
+        AND users.organization_id IS NOT NULL
+        RETURNING tasks.id, tasks.organization_id, tasks.owner_id, tasks.assignee_id
+        """,
+    ),
+    (
+        "comments",
+        """
+        UPDATE comments SET organization_id = tasks.organization_id
+        FROM tasks
+        WHERE comments.task_id = tasks.id AND comments.id = ANY(%s)
+        AND tasks.organization_id IS NOT NULL
+        """,
+    ),
+    (
+        "tasks_history",
+        """
+        UPDATE tasks_history SET organization_id = tasks.organization_id
+        FROM tasks
+        WHERE tasks_history.task_id = tasks.id AND tasks_history.id = ANY(%s)
+        AND tasks.organization_id IS NOT NULL
+        """,
+    ),
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Fill organization_id of tasks from their owner, then of comments "
+        "and task history from their task, in id ordered batches. Rows already "
+        "filled are skipped, so an interrupted run can simply be restarted."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=5000,
+            help="Number of rows updated per transaction.",
+        )
+        parser.add_argument(
+            "--sleep",
+            type=float,
+            default=0,
+            help="Seconds to wait between batches to limit database load.",
+        )
+
+    def handle(self, *args, **options):
+        for table, update in BACKFILLS:
+            total = self.backfill(table, update, options["batch_size"], options["sleep"])
+            self.stdout.write(f"{table}: {total} rows backfilled.")
+
+        if settings.TASK_STATS_ROLLUP_ENABLED:
+            # rollup buckets are keyed by organization
+            rebuild_task_stats()
+            self.stdout.write("Task stats rollup rebuilt.")
+
+        self.stdout.write(self.style.SUCCESS("Organization backfill finished."))
+
+    def backfill(self, table, update, batch_size, sleep):
+        last_id = None
+        total = 0
+
+        while True:
+            with transaction.atomic(), connection.cursor() as cursor:
+                # rows whose parent has no organization stay NULL, the keyset
+                # moves past them instead of selecting them again
+                after = "AND id > %s" if last_id else ""
+                cursor.execute(
+                    f"""
+                    SELECT id FROM {table}
+                    WHERE organization_id IS NULL {after}
+                    ORDER BY id
+                    LIMIT %s
+                    FOR UPDATE
+                    """,
+                    [last_id, batch_size] if last_id else [batch_size],
+                )
+                ids = [row[0] for row in cursor.fetchall()]
+                if not ids:
+                    return total
+
+                cursor.execute(update, [ids])
+                total += cursor.rowcount
+
+                if table == "tasks":
+                    # cached ACLs and list pages were built without the tenant
+                    changed = cursor.fetchall()
+                    invalidate_task_acl(*[row[0] for row in changed])
+                    bump_task_list_generations(
+                        organization_ids=[row[1] for row in changed],
+                        owner_ids=[row[2] for row in changed],
+                        assignee_ids=[row[3] for row in changed],
+                    )
+
+            last_id = ids[-1]
+            self.stdout.write(f"{table}: {total} rows backfilled so far...")
+
+            if sleep:
+                time.sleep(sleep)
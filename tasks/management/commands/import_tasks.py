@@ -0,0 +1,76 @@
+import json
+from pathlib import Path
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+
+from core.constants import import_batch_size
+from tasks.importer import IMPORT_FORMATS, import_tasks, read_rows
+
+User = get_user_model()
+
+
+class Command(BaseCommand):
+    help = "Import tasks from a CSV or NDJSON file."
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="CSV file with a header row, or NDJSON file.")
+        parser.add_argument(
+            "--owner",
+            required=True,
+            help="Username of the user the imported tasks are created by.",
+        )
+        parser.add_argument(
+            "--file-format",
+            choices=IMPORT_FORMATS,
+            help="Defaults to the file extension.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=import_batch_size,
+            help="Number of rows validated and loaded per transaction.",
+        )
+        parser.add_argument(
+            "--errors",
+            help="Write the rejected rows to this file as NDJSON.",
+        )
+
+    def handle(self, *args, **options):
+        path = Path(options["path"])
+        file_format = options["file_format"] or path.suffix.lstrip(".").lower()
+        if file_format not in IMPORT_FORMATS:
+            raise CommandError(
+                f"Unknown file format '{file_format}', use --file-format."
+            )
+
+        try:
+            owner = User.objects.get(
+                username=options["owner"],
+                deleted_at__isnull=True,
+                is_active=True,
+            )
+        except User.DoesNotExist:
+            raise CommandError(f"User '{options['owner']}' does not exist.")
+
+        with path.open(encoding="utf-8-sig", newline="") as lines:
+            report = import_tasks(
+                read_rows(lines, file_format),
+                user=owner,
+                batch_size=options["batch_size"],
+            )
+
+        if options["errors"]:
+            with open(options["errors"], "w", encoding="utf-8") as output:
+                for error in report["errors"]:
+                    output.write(json.dumps(error) + "\n")
+        else:
+            for error in report["errors"]:
+                self.stderr.write(f"line {error['line']}: {json.dumps(error['errors'])}")
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Import finished, {report['imported']} tasks imported, "
+                f"{report['rejected']} rows rejected."
+            )
+        )
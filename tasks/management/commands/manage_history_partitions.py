@@ -0,0 +1,56 @@
+from django.core.management.base import BaseCommand
+
+from core.constants import history_partition_months_ahead
+from tasks.partitions import (
+    create_history_partitions,
+    expired_history_partitions,
+    expire_history_partition,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Create the upcoming monthly partitions of tasks_history and detach "
+        "or drop the ones past the retention window. Run it at least monthly."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--months-ahead",
+            type=int,
+            default=history_partition_months_ahead,
+            help="Number of future months to have partitions for.",
+        )
+        parser.add_argument(
+            "--retention-months",
+            type=int,
+            help="Expire partitions older than this many months, keep all when unset.",
+        )
+        parser.add_argument(
+            "--drop",
+            action="store_true",
+            help="Drop expired partitions instead of only detaching them.",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Only list the partitions that would be expired.",
+        )
+
+    def handle(self, *args, **options):
+        if not options["dry_run"]:
+            for name in create_history_partitions(options["months_ahead"]):
+                self.stdout.write(f"Created {name}")
+
+        if options["retention_months"] is not None:
+            action = "Dropped" if options["drop"] else "Detached"
+
+            for name in expired_history_partitions(options["retention_months"]):
+                if options["dry_run"]:
+                    self.stdout.write(f"Would expire {name}")
+                    continue
+
+                expire_history_partition(name, drop=options["drop"])
+                self.stdout.write(f"{action} {name}")
+
+        self.stdout.write(self.style.SUCCESS("History partitions are up to date."))
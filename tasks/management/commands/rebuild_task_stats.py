@@ -0,0 +1,23 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from tasks.stats import rebuild_task_stats
+
+
+class Command(BaseCommand):
+    help = "Recompute the task stats rollup table from the tasks table."
+
+    def handle(self, *args, **options):
+        if not settings.TASK_STATS_ROLLUP_ENABLED:
+            self.stdout.write(
+                self.style.WARNING(
+                    "TASK_STATS_ROLLUP_ENABLED is off, the rollup will not be "
+                    "kept up to date after this rebuild."
+                )
+            )
+
+        buckets = rebuild_task_stats()
+
+        self.stdout.write(
+            self.style.SUCCESS(f"Task stats rebuilt, {buckets} buckets written.")
+        )
@@ -0,0 +1,46 @@
+# Generated by Django 6.0 on 2026-10-16 10:30
+
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+# The title check used to run before the insert, concurrent creates could
+# leave live duplicates behind and the unique index would fail to build on
+# them. The oldest task of every (assignee, lower(title)) group stays live,
+# the others are soft deleted so their rows, comments and history are kept.
+SOFT_DELETE_LIVE_DUPLICATE_TITLES = """
+UPDATE tasks
+SET deleted_at = now(), updated_at = now()
+WHERE id IN (
+    SELECT id
+    FROM (
+        SELECT
+            id,
+            row_number() OVER (
+                PARTITION BY assignee_id, lower(title)
+                ORDER BY created_at, id
+            ) AS position
+        FROM tasks
+        WHERE deleted_at IS NULL AND assignee_id IS NOT NULL
+    ) ranked
+    WHERE position > 1
+);
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks', '0002_composite_list_indexes'),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            SOFT_DELETE_LIVE_DUPLICATE_TITLES,
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+        migrations.AddConstraint(
+            model_name='task',
+            constraint=models.UniqueConstraint(models.F('assignee'), django.db.models.functions.text.Lower('title'), condition=models.Q(('deleted_at__isnull', True)), name='tasks_assignee_title_live_uniq'),
+        ),
+    ]
@@ -0,0 +1,38 @@
+# Generated by Django 6.0 on 2026-10-16 11:30
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.db import migrations
+
+
+# same document as tasks.search.task_search_vector
+BACKFILL_SEARCH_VECTOR = """
+UPDATE tasks SET search_vector =
+    setweight(to_tsvector('english', coalesce(tasks.title, '')), 'A')
+    || setweight(to_tsvector('english', coalesce(tasks.description, '')), 'B')
+    || setweight(to_tsvector('english', coalesce((
+        SELECT string_agg(comments.message, ' ')
+        FROM comments
+        WHERE comments.task_id = tasks.id AND comments.deleted_at IS NULL
+    ), '')), 'C');
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks', '0004_task_sync_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='task',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='tasks_search_vector_idx'),
+        ),
+        migrations.RunSQL(BACKFILL_SEARCH_VECTOR, migrations.RunSQL.noop),
+    ]
@@ -0,0 +1,35 @@
+# Generated by Django 6.0 on 2026-10-16 13:00
+
+import django.db.models.deletion
+import uuid
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks', '0006_task_title_trigram_index'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(condition=models.Q(('deleted_at__isnull', True), models.Q(('status', 'COMPLETED'), _negated=True), ('deadline__isnull', False)), fields=['assignee', 'deadline'], name='tasks_assignee_overdue_idx'),
+        ),
+        migrations.CreateModel(
+            name='TaskStatsRollup',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('status', models.CharField(choices=[('PENDING', 'Pending'), ('IN_PROGRESS', 'In Progress'), ('COMPLETED', 'Completed')], max_length=20)),
+                ('priority', models.CharField(choices=[('HIGH', 'High'), ('MEDIUM', 'Medium'), ('LOW', 'Low')], max_length=20)),
+                ('task_count', models.IntegerField(default=0)),
+                ('assignee', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='task_stats', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'db_table': 'tasks_stats_rollup',
+                'constraints': [models.UniqueConstraint(fields=('assignee', 'status', 'priority'), name='tasks_stats_rollup_uniq')],
+            },
+        ),
+    ]
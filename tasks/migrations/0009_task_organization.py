@@ -0,0 +1,63 @@
+# Generated by Django 6.0 on 2026-10-16 15:00
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks', '0008_cascade_keyset_indexes'),
+        ('users', '0004_user_cascade_job'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='task',
+            name='organization',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='tasks', to='users.organization'),
+        ),
+        migrations.AddField(
+            model_name='taskhistory',
+            name='organization',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='task_history', to='users.organization'),
+        ),
+        migrations.AddField(
+            model_name='comment',
+            name='organization',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='comments', to='users.organization'),
+        ),
+        migrations.AddField(
+            model_name='taskstatsrollup',
+            name='organization',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='task_stats', to='users.organization'),
+        ),
+        migrations.RemoveConstraint(
+            model_name='taskstatsrollup',
+            name='tasks_stats_rollup_uniq',
+        ),
+        migrations.AddConstraint(
+            model_name='taskstatsrollup',
+            constraint=models.UniqueConstraint(fields=('organization', 'assignee', 'status', 'priority'), name='tasks_stats_rollup_org_uniq', nulls_distinct=False),
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(condition=models.Q(('deleted_at__isnull', True)), fields=['organization', '-created_at', '-id'], name='tasks_org_created_live_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(condition=models.Q(('deleted_at__isnull', True)), fields=['organization', 'assignee', '-created_at', '-id'], name='tasks_org_assignee_live_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(condition=models.Q(('deleted_at__isnull', True)), fields=['organization', 'assignee', 'status', 'priority'], name='tasks_org_stats_live_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='taskhistory',
+            index=models.Index(fields=['organization', 'task', '-created_at', '-id'], name='tasks_history_org_task_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='comment',
+            index=models.Index(condition=models.Q(('deleted_at__isnull', True)), fields=['organization', 'task', '-created_at', '-id'], name='comments_org_task_live_idx'),
+        ),
+    ]
@@ -0,0 +1,96 @@
+# Generated by Django 6.0 on 2026-10-16 16:00
+
+import django.contrib.postgres.indexes
+from django.db import migrations
+
+
+# Rebuild tasks_history as a table range partitioned by month on created_at.
+# A partitioned table's primary key must contain the partition key, so the
+# database key is (id, created_at) while Django keeps treating `id` as the
+# primary key. Monthly partitions are created from the oldest row up to three
+# months ahead, later ones by the `manage_history_partitions` command, and a
+# default partition catches rows outside every range.
+#
+# This is a maintenance window step on a large table: the whole history is
+# copied in the migration's transaction, which locks tasks_history against
+# writes from the first statement to the commit (a row written during the
+# copy would otherwise be lost with the old table), so every task write that
+# records history waits for it. Time it on a copy of production first.
+PARTITION_TASK_HISTORY = """
+LOCK TABLE tasks_history IN EXCLUSIVE MODE;
+
+CREATE TABLE tasks_history_new (LIKE tasks_history INCLUDING DEFAULTS)
+PARTITION BY RANGE (created_at);
+
+DO $$
+DECLARE
+    partition_start date := date_trunc(
+        'month', coalesce((SELECT min(created_at) FROM tasks_history), now())
+    );
+    last_start date := date_trunc('month', now()) + interval '3 months';
+BEGIN
+    WHILE partition_start <= last_start LOOP
+        EXECUTE format(
+            'CREATE TABLE %I PARTITION OF tasks_history_new FOR VALUES FROM (%L) TO (%L)',
+            'tasks_history_p' || to_char(partition_start, 'YYYYMM'),
+            partition_start,
+            (partition_start + interval '1 month')::date
+        );
+        partition_start := partition_start + interval '1 month';
+    END LOOP;
+END $$;
+
+CREATE TABLE tasks_history_default PARTITION OF tasks_history_new DEFAULT;
+
+INSERT INTO tasks_history_new SELECT * FROM tasks_history;
+
+DROP TABLE tasks_history;
+ALTER TABLE tasks_history_new RENAME TO tasks_history;
+
+ALTER TABLE tasks_history
+    ADD CONSTRAINT tasks_history_pkey PRIMARY KEY (id, created_at);
+
+ALTER TABLE tasks_history
+    ADD CONSTRAINT tasks_history_task_id_fk_tasks_id
+    FOREIGN KEY (task_id) REFERENCES tasks (id) DEFERRABLE INITIALLY DEFERRED;
+ALTER TABLE tasks_history
+    ADD CONSTRAINT tasks_history_actor_id_fk_users_id
+    FOREIGN KEY (actor_id) REFERENCES users (id) DEFERRABLE INITIALLY DEFERRED;
+ALTER TABLE tasks_history
+    ADD CONSTRAINT tasks_history_organization_id_fk_organizations_id
+    FOREIGN KEY (organization_id) REFERENCES organizations (id) DEFERRABLE INITIALLY DEFERRED;
+
+CREATE INDEX tasks_histo_task_id_fb6619_idx ON tasks_history (task_id);
+CREATE INDEX tasks_histo_actor_i_3a2fb8_idx ON tasks_history (actor_id);
+CREATE INDEX tasks_history_task_created_idx
+    ON tasks_history (task_id, created_at DESC, id DESC);
+CREATE INDEX tasks_history_org_task_idx
+    ON tasks_history (organization_id, task_id, created_at DESC, id DESC);
+CREATE INDEX tasks_history_created_brin
+    ON tasks_history USING brin (created_at);
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks', '0009_task_organization'),
+    ]
+
+    operations = [
+        migrations.SeparateDatabaseAndState(
+            database_operations=[
+                migrations.RunSQL(PARTITION_TASK_HISTORY),
+            ],
+            state_operations=[
+                migrations.RemoveIndex(
+                    model_name='taskhistory',
+                    name='tasks_histo_created_a0777e_idx',
+                ),
+                migrations.AddIndex(
+                    model_name='taskhistory',
+                    index=django.contrib.postgres.indexes.BrinIndex(fields=['created_at'], name='tasks_history_created_brin'),
+                ),
+            ],
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 6.0 on 2026-10-17 10:00
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks', '0010_partition_task_history'),
+    ]
+
+    operations = [
+        # both single column task_id indexes are covered by the leading
+        # column of tasks_history_task_created_idx
+        migrations.RemoveIndex(
+            model_name='taskhistory',
+            name='tasks_histo_task_id_fb6619_idx',
+        ),
+        migrations.AlterField(
+            model_name='taskhistory',
+            name='task',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='history', to='tasks.task'),
+        ),
+    ]
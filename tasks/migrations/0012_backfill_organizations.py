@@ -0,0 +1,60 @@
+# Generated by Django 6.0 on 2026-10-17 11:00
+
+from django.conf import settings
+from django.db import migrations
+
+
+# Fill organization_id of existing rows, admin task lists and the comment and
+# history lists filter on it. Runs as plain UPDATEs in the migration
+# transaction; on large tables run `backfill_task_organizations` (batched,
+# resumable) before migrating, so this migration finds nothing left to update.
+BACKFILL_ORGANIZATIONS = """
+UPDATE tasks SET organization_id = users.organization_id
+FROM users
+WHERE tasks.owner_id = users.id
+AND tasks.organization_id IS NULL
+AND users.organization_id IS NOT NULL;
+
+UPDATE comments SET organization_id = tasks.organization_id
+FROM tasks
+WHERE comments.task_id = tasks.id
+AND comments.organization_id IS NULL
+AND tasks.organization_id IS NOT NULL;
+
+UPDATE tasks_history SET organization_id = tasks.organization_id
+FROM tasks
+WHERE tasks_history.task_id = tasks.id
+AND tasks_history.organization_id IS NULL
+AND tasks.organization_id IS NOT NULL;
+"""
+
+
+def rebuild_task_stats(apps, schema_editor):
+    # rollup buckets are keyed by organization
+    if not settings.TASK_STATS_ROLLUP_ENABLED:
+        return
+
+    schema_editor.execute("LOCK TABLE tasks_stats_rollup IN EXCLUSIVE MODE")
+    schema_editor.execute("DELETE FROM tasks_stats_rollup")
+    schema_editor.execute(
+        """
+        INSERT INTO tasks_stats_rollup
+            (id, organization_id, assignee_id, status, priority, task_count)
+        SELECT gen_random_uuid(), organization_id, assignee_id, status, priority, count(*)
+        FROM tasks
+        WHERE deleted_at IS NULL
+        GROUP BY organization_id, assignee_id, status, priority
+        """
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks', '0011_remove_taskhistory_task_index'),
+    ]
+
+    operations = [
+        migrations.RunSQL(BACKFILL_ORGANIZATIONS, migrations.RunSQL.noop),
+        migrations.RunPython(rebuild_task_stats, migrations.RunPython.noop),
+    ]
@@ -1,13 +1,28 @@
 import uuid
 from django.db import models
 from django.conf import settings
+from django.contrib.postgres.indexes import BrinIndex, GinIndex, OpClass
+from django.contrib.postgres.search import SearchVectorField
+from django.db.models.functions import Lower, Upper
 from core.choices import TaskStatusChoices, TaskPriorityChoices
 
 User = settings.AUTH_USER_MODEL
 
+TASK_TITLE_UNIQUE_CONSTRAINT = "tasks_assignee_title_live_uniq"
+
 class Task(models.Model):
     id = models.UUIDField(primary_key=True , default=uuid.uuid4 , editable=False)
 
+    # tenant of the owner, copied on create so tenant scoped queries do not
+    # need to join users
+    organization = models.ForeignKey(
+        "users.Organization",
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name="tasks",
+    )
+
     owner = models.ForeignKey(
         User,
         on_delete=models.CASCADE ,
@@ -41,6 +56,9 @@ class Task(models.Model):
     updated_at = models.DateTimeField(auto_now=True)
     deleted_at = models.DateTimeField(null=True, blank=True)
 
+    # title, description and live comments, maintained by tasks.search
+    search_vector = SearchVectorField(null=True, editable=False)
+
     class Meta:
         db_table = "tasks"
         indexes = [
@@ -49,20 +67,97 @@ class Task(models.Model):
             models.Index(fields=["owner"]),
             models.Index(fields=["assignee"]),
             models.Index(fields=["created_at"]),
+            # partial indexes matching the live task list filters and ordering
+            models.Index(
+                fields=["-created_at", "-id"],
+                name="tasks_created_live_idx",
+                condition=models.Q(deleted_at__isnull=True),
+            ),
+            models.Index(
+                fields=["assignee", "-created_at", "-id"],
+                name="tasks_assignee_live_idx",
+                condition=models.Q(deleted_at__isnull=True),
+            ),
+            models.Index(
+                fields=["owner", "status", "-created_at", "-id"],
+                name="tasks_owner_status_live_idx",
+                condition=models.Q(deleted_at__isnull=True),
+            ),
+            # delta sync lookups
+            models.Index(
+                fields=["assignee", "updated_at"],
+                name="tasks_assignee_updated_idx",
+            ),
+            models.Index(
+                fields=["assignee", "deleted_at"],
+                name="tasks_assignee_deleted_idx",
+            ),
+            GinIndex(fields=["search_vector"], name="tasks_search_vector_idx"),
+            # substring matches, icontains compiles to UPPER(title) LIKE
+            GinIndex(
+                OpClass(Upper("title"), name="gin_trgm_ops"),
+                name="tasks_title_trgm_idx",
+            ),
+            # overdue counts of the stats endpoint
+            models.Index(
+                fields=["assignee", "deadline"],
+                name="tasks_assignee_overdue_idx",
+                condition=models.Q(deleted_at__isnull=True)
+                & ~models.Q(status=TaskStatusChoices.COMPLETED)
+                & models.Q(deadline__isnull=False),
+            ),
+            # id ordered batches of users.services.run_user_cascade
+            models.Index(fields=["owner", "id"], name="tasks_owner_id_idx"),
+            models.Index(fields=["assignee", "id"], name="tasks_assignee_id_idx"),
+            # tenant scoped list and stats queries
+            models.Index(
+                fields=["organization", "-created_at", "-id"],
+                name="tasks_org_created_live_idx",
+                condition=models.Q(deleted_at__isnull=True),
+            ),
+            models.Index(
+                fields=["organization", "assignee", "-created_at", "-id"],
+                name="tasks_org_assignee_live_idx",
+                condition=models.Q(deleted_at__isnull=True),
+            ),
+            models.Index(
+                fields=["organization", "assignee", "status", "priority"],
+                name="tasks_org_stats_live_idx",
+                condition=models.Q(deleted_at__isnull=True),
+            ),
+        ]
+        constraints = [
+            models.UniqueConstraint(
+                models.F("assignee"),
+                Lower("title"),
+                name=TASK_TITLE_UNIQUE_CONSTRAINT,
+                condition=models.Q(deleted_at__isnull=True),
+            ),
         ]
 
     def __str__(self):
         return self.title
 
 
-# task history model 
+# task history model, range partitioned by month on created_at in the
+# database (see migration 0010 and the manage_history_partitions command)
 class TaskHistory(models.Model):
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
 
+    # served by tasks_history_task_created_idx, task_id is its leading column
     task = models.ForeignKey(
         Task,
         on_delete=models.CASCADE,
-        related_name="history"
+        related_name="history",
+        db_index=False,
+    )
+
+    organization = models.ForeignKey(
+        "users.Organization",
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name="task_history",
     )
 
     actor = models.ForeignKey(
@@ -106,9 +201,18 @@ class TaskHistory(models.Model):
     class Meta:
         db_table = "tasks_history"
         indexes = [
-            models.Index(fields=["task"]),
             models.Index(fields=["actor"]),
-            models.Index(fields=["created_at"]),
+            # rows are appended in created_at order, a BRIN index stays tiny
+            # whatever the table size
+            BrinIndex(fields=["created_at"], name="tasks_history_created_brin"),
+            models.Index(
+                fields=["task", "-created_at", "-id"],
+                name="tasks_history_task_created_idx",
+            ),
+            models.Index(
+                fields=["organization", "task", "-created_at", "-id"],
+                name="tasks_history_org_task_idx",
+            ),
         ]
 
     def __str__(self):
@@ -128,6 +232,14 @@ class Comment(models.Model):
         related_name="comments"
     )
 
+    organization = models.ForeignKey(
+        "users.Organization",
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name="comments",
+    )
+
 
     user = models.ForeignKey(
             User,
@@ -149,8 +261,54 @@ class Comment(models.Model):
             models.Index(fields=["task"]),
             models.Index(fields=["user"]),
             models.Index(fields=["created_at"]),
+            models.Index(
+                fields=["task", "-created_at", "-id"],
+                name="comments_task_live_idx",
+                condition=models.Q(deleted_at__isnull=True),
+            ),
+            models.Index(fields=["user", "id"], name="comments_user_id_idx"),
+            models.Index(
+                fields=["organization", "task", "-created_at", "-id"],
+                name="comments_org_task_live_idx",
+                condition=models.Q(deleted_at__isnull=True),
+            ),
         ]
 
     def __str__(self):
         return f"Comment by {self.user} on {self.task}"
 
+
+# live task counts per assignee, status and priority, see tasks.stats
+class TaskStatsRollup(models.Model):
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+
+    organization = models.ForeignKey(
+        "users.Organization",
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name="task_stats",
+    )
+
+    assignee = models.ForeignKey(
+        User,
+        on_delete=models.CASCADE,
+        related_name="task_stats"
+    )
+
+    status = models.CharField(max_length=20, choices=TaskStatusChoices.choices)
+    priority = models.CharField(max_length=20, choices=TaskPriorityChoices.choices)
+    task_count = models.IntegerField(default=0)
+
+    class Meta:
+        db_table = "tasks_stats_rollup"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["organization", "assignee", "status", "priority"],
+                name="tasks_stats_rollup_org_uniq",
+                nulls_distinct=False,
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.assignee_id} {self.status}/{self.priority}: {self.task_count}"
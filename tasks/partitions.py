@@ -0,0 +1,158 @@
+import datetime
+import re
+
+from django.db import connection, transaction
+from django.utils import timezone
+
+HISTORY_TABLE = "tasks_history"
+
+HISTORY_DEFAULT_PARTITION = f"{HISTORY_TABLE}_default"
+
+HISTORY_PARTITION_PATTERN = re.compile(r"^tasks_history_p(\d{4})(\d{2})$")
+
+
+def month_start(value):
+    return datetime.date(value.year, value.month, 1)
+
+
+def month_bound(month):
+    """
+    The instant a month starts, partition bounds are UTC dates.
+    """
+    return datetime.datetime.combine(month, datetime.time.min, tzinfo=datetime.timezone.utc)
+
+
+def add_months(month, months):
+    index = month.year * 12 + month.month - 1 + months
+    return datetime.date(index // 12, index % 12 + 1, 1)
+
+
+def history_partition_name(month):
+    return f"{HISTORY_TABLE}_p{month:%Y%m}"
+
+
+def list_history_partitions():
+    """
+    Monthly partitions attached to tasks_history as {month: name}, the
+    default partition is left out.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(
+            """
+            SELECT child.relname
+            FROM pg_inherits
+            JOIN pg_class parent ON parent.oid = pg_inherits.inhparent
+            JOIN pg_class child ON child.oid = pg_inherits.inhrelid
+            WHERE parent.relname = %s
+            """,
+            [HISTORY_TABLE],
+        )
+        names = [row[0] for row in cursor.fetchall()]
+
+    partitions = {}
+    for name in names:
+        match = HISTORY_PARTITION_PATTERN.match(name)
+        if match:
+            partitions[datetime.date(int(match[1]), int(match[2]), 1)] = name
+
+    return partitions
+
+
+def create_history_partitions(months_ahead):
+    """
+    Create the partitions of the current month and the next `months_ahead`
+    months that do not exist yet.
+
+    Rows of a missing month already in the default partition are moved into
+    the new partition, see `create_history_partition`.
+
+    Returns the names of the created partitions.
+    """
+    existing = list_history_partitions()
+    current = month_start(timezone.now())
+    created = []
+
+    for offset in range(months_ahead + 1):
+        month = add_months(current, offset)
+        if month in existing:
+            continue
+
+        name = history_partition_name(month)
+        with transaction.atomic():
+            create_history_partition(name, month, add_months(month, 1))
+        created.append(name)
+
+    return created
+
+
+def create_history_partition(name, start, end):
+    """
+    Create the partition `name` of [start, end), in the caller's transaction.
+
+    Postgres refuses to create a partition whose range has rows in the
+    default partition. Those rows are moved: the default partition is
+    detached, the new partition created, the rows moved through the parent
+    into it and the default partition attached again. DETACH locks
+    tasks_history until the transaction ends, so history writes wait for
+    the move.
+    """
+    # DDL takes no bind parameters, the bounds are dates built by the caller
+    create = (
+        f"CREATE TABLE {name} PARTITION OF {HISTORY_TABLE} "
+        f"FOR VALUES FROM ('{start}') TO ('{end}')"
+    )
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"SELECT EXISTS (SELECT 1 FROM {HISTORY_DEFAULT_PARTITION} "
+            "WHERE created_at >= %s AND created_at < %s)",
+            [start, end],
+        )
+        if not cursor.fetchone()[0]:
+            cursor.execute(create)
+            return
+
+        cursor.execute(
+            f"ALTER TABLE {HISTORY_TABLE} DETACH PARTITION {HISTORY_DEFAULT_PARTITION}"
+        )
+        cursor.execute(create)
+        cursor.execute(
+            f"""
+            WITH moved AS (
+                DELETE FROM {HISTORY_DEFAULT_PARTITION}
+                WHERE created_at >= %s AND created_at < %s
+                RETURNING *
+            )
+            INSERT INTO {HISTORY_TABLE} SELECT * FROM moved
+            """,
+            [start, end],
+        )
+        cursor.execute(
+            f"ALTER TABLE {HISTORY_TABLE} "
+            f"ATTACH PARTITION {HISTORY_DEFAULT_PARTITION} DEFAULT"
+        )
+
+
+def expired_history_partitions(retention_months):
+    """
+    Names of the partitions holding only rows older than the retention
+    window, oldest first.
+    """
+    cutoff = add_months(month_start(timezone.now()), -retention_months)
+
+    return [
+        name
+        for month, name in sorted(list_history_partitions().items())
+        if add_months(month, 1) <= cutoff
+    ]
+
+
+def expire_history_partition(name, drop=False):
+    """
+    Detach a partition from tasks_history, keeping it as a standalone table
+    for archiving unless `drop` is set.
+    """
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.execute(f"ALTER TABLE {HISTORY_TABLE} DETACH PARTITION {name}")
+        if drop:
+            cursor.execute(f"DROP TABLE {name}")
@@ -0,0 +1,77 @@
+from django.contrib.postgres.search import SearchQuery, SearchRank, SearchVector
+from django.db import transaction
+from django.db.models import F, OuterRef, StringAgg, Subquery, Value
+from django.db.models.functions import Coalesce
+
+from core.constants import search_config, autocomplete_max_results
+from tasks.models import Task, Comment
+
+
+def task_search_vector():
+    """
+    Weighted document of a task: title (A), description (B) and the text of
+    its live comments (C).
+    """
+    comments = (
+        Comment.objects
+        .filter(task=OuterRef("pk"), deleted_at__isnull=True)
+        .values("task")
+        .annotate(text=StringAgg("message", delimiter=Value(" ")))
+        .values("text")
+    )
+
+    return (
+        SearchVector("title", weight="A", config=search_config)
+        + SearchVector("description", weight="B", config=search_config)
+        + SearchVector(
+            Coalesce(Subquery(comments), Value("")),
+            weight="C",
+            config=search_config,
+        )
+    )
+
+
+def refresh_task_search_vectors(task_ids):
+    """
+    Recompute the stored search vector of the given tasks on commit.
+    """
+    task_ids = list(task_ids)
+    if not task_ids:
+        return
+
+    transaction.on_commit(
+        lambda: Task.objects.filter(id__in=task_ids).update(
+            search_vector=task_search_vector()
+        )
+    )
+
+
+def search_tasks(queryset, text):
+    """
+    Filter a task queryset by full-text query and order it by rank.
+    """
+    query = SearchQuery(text, search_type="websearch", config=search_config)
+
+    return (
+        queryset
+        .filter(search_vector=query)
+        .annotate(rank=SearchRank(F("search_vector"), query))
+        .order_by("-rank", "-created_at", "-id")
+    )
+
+
+def autocomplete_tasks(queryset, text):
+    """
+    Substring match on task titles for type-ahead, served by the trigram
+    index on UPPER(title) that backs `icontains`.
+
+    The query has no ORDER BY, the LIMIT stops the scan at the first matches
+    instead of sorting every match of a short fragment. Only the returned
+    suggestions are sorted by title.
+    """
+    matches = (
+        queryset
+        .filter(title__icontains=text)
+        .values("id", "title")[:autocomplete_max_results]
+    )
+    return sorted(matches, key=lambda match: match["title"].lower())
@@ -1,3 +1,4 @@
 from .task import *
 from .history import *
-from .comment import *
\ No newline at end of file
+from .comment import *
+from .bulk import *
@@ -0,0 +1,41 @@
+from rest_framework import serializers
+
+from core.constants import bulk_task_max_items
+from tasks.serializers.task import TaskCreateSerializer, TaskUpdateSerializer
+
+
+class TaskBulkSerializer(serializers.Serializer):
+    tasks = serializers.ListField(
+        child=serializers.DictField(),
+        allow_empty=False,
+        max_length=bulk_task_max_items,
+    )
+
+
+class TaskBulkDeleteSerializer(serializers.Serializer):
+    ids = serializers.ListField(
+        child=serializers.UUIDField(),
+        allow_empty=False,
+        max_length=bulk_task_max_items,
+    )
+
+
+class TaskBulkCreateItemSerializer(TaskCreateSerializer):
+    """
+    Field level validation of one bulk item, assignee and duplicate title
+    checks run once for the whole batch in `bulk_create_tasks`.
+    """
+
+    def validate(self, attrs):
+        attrs["title"] = attrs["title"].strip()
+        return attrs
+
+
+class TaskBulkUpdateItemSerializer(TaskUpdateSerializer):
+    id = serializers.UUIDField()
+
+    def validate(self, attrs):
+        task_id = attrs.pop("id")
+        attrs = super().validate(attrs)
+        attrs["id"] = task_id
+        return attrs
@@ -1,6 +1,8 @@
 from rest_framework import serializers
 from tasks.models import Comment
+from tasks.search import refresh_task_search_vectors
 from users.serializers import UserMiniDetailSerializer
+from core.serializers import EagerLoadingMixin
 
 
 
@@ -32,11 +34,14 @@ class CommentCreateUpdateSerializer(serializers.Serializer):
         request = self.context["request"]
         task = self.context["task"]
 
-        return Comment.objects.create(
-            task=task,
+        comment = Comment.objects.create(
+            task_id=task.id,
+            organization_id=task.organization_id,
             user=request.user,
             message=validated_data["message"]
         )
+        refresh_task_search_vectors([task.id])
+        return comment
     
     def update(self, instance, validated_data):
         instance.message = validated_data.get('message', instance.message)
@@ -45,7 +50,9 @@ class CommentCreateUpdateSerializer(serializers.Serializer):
 
 
 
-class CommentDetailSerializer(serializers.Serializer):
+class CommentDetailSerializer(EagerLoadingMixin, serializers.Serializer):
+    select_related_fields = ("user",)
+
     id = serializers.UUIDField()
     message = serializers.CharField()
     user = UserMiniDetailSerializer(allow_null=True)
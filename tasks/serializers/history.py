@@ -1,9 +1,12 @@
 from rest_framework import serializers
 from tasks.models import TaskHistory
 from users.serializers import UserMiniDetailSerializer
+from core.serializers import EagerLoadingMixin
 
 
-class TaskHistorySerializer(serializers.Serializer):
+class TaskHistorySerializer(EagerLoadingMixin, serializers.Serializer):
+    select_related_fields = ("actor",)
+
     id = serializers.UUIDField()
     old_status = serializers.CharField(allow_null=True)
     new_status = serializers.CharField(allow_null=True)
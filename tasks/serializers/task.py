@@ -2,15 +2,20 @@ from rest_framework import serializers
 from django.contrib.auth import get_user_model
 from core.choices import TaskPriorityChoices, UserRoleChoices
 from tasks.models import Task
-from django.db.models import functions
+from django.db import IntegrityError
 from django.utils import timezone
 from users.serializers import UserMiniDetailSerializer
+from core.serializers import EagerLoadingMixin
+from tasks.services import create_task, is_duplicate_title_error
 from core.choices import TaskStatusChoices, TaskPriorityChoices
 
 
 User = get_user_model()
 
-class TaskListSerializer(serializers.Serializer):
+class TaskListSerializer(EagerLoadingMixin, serializers.Serializer):
+    select_related_fields = ("owner", "assignee")
+    defer_fields = ("search_vector",)
+
     id = serializers.UUIDField()
     title = serializers.CharField()
     status = serializers.CharField()
@@ -20,7 +25,10 @@ class TaskListSerializer(serializers.Serializer):
     created_at = serializers.DateTimeField()
 
 
-class TaskDetailSerializer(serializers.Serializer):
+class TaskDetailSerializer(EagerLoadingMixin, serializers.Serializer):
+    select_related_fields = ("owner", "assignee")
+    defer_fields = ("search_vector",)
+
     id = serializers.UUIDField()
     title = serializers.CharField()
     description = serializers.CharField()
@@ -62,11 +70,14 @@ class TaskCreateSerializer(serializers.Serializer):
                 )
             assignee = user
 
-        elif user.role == UserRoleChoices.ADMIN:
+        elif user.role == UserRoleChoices.TENANT_ADMIN:
             if assignee_id:
                 try:
+                    # tasks belong to the owner's organization, so do
+                    # their assignees
                     assignee = User.objects.get(
                         id=assignee_id,
+                        organization_id=user.organization_id,
                         deleted_at__isnull=True,
                         is_active=True 
                     )
@@ -81,27 +92,9 @@ class TaskCreateSerializer(serializers.Serializer):
             raise serializers.ValidationError("Invalid user role.")
     
 
-        title = attrs.get("title").strip()
-        normalized_title = title.lower()
-
-        duplicate_exists = Task.objects.filter(
-            # owner=user,
-            assignee=assignee,
-            deleted_at__isnull=True,
-        ).annotate(
-            normalized_db_title=functions.Lower("title")
-        ).filter(
-            normalized_db_title=normalized_title
-        ).exists()
-
-        if duplicate_exists:
-            raise serializers.ValidationError(
-                {
-                    "title": "Task with this title already exists for this user."
-                }
-            )
-
-        attrs["title"] = title
+        # case-insensitive title uniqueness per assignee is enforced by the
+        # tasks_assignee_title_live_uniq index, see create()
+        attrs["title"] = attrs.get("title").strip()
         attrs["assignee"] = assignee
         return attrs
 
@@ -110,11 +103,21 @@ class TaskCreateSerializer(serializers.Serializer):
 
         validated_data.pop("assignee_id", None)
 
-        return Task.objects.create(
-            owner=request.user,
-            assignee=validated_data.pop("assignee"),
-            **validated_data
-        )
+        try:
+            return create_task(
+                owner=request.user,
+                assignee=validated_data.pop("assignee"),
+                **validated_data
+            )
+        except IntegrityError as exc:
+            if not is_duplicate_title_error(exc):
+                raise
+
+            raise serializers.ValidationError(
+                {
+                    "title": "Task with this title already exists for this user."
+                }
+            )
 
 
 class TaskUpdateSerializer(serializers.Serializer):
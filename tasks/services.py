@@ -1,28 +1,130 @@
-from tasks.models import TaskHistory
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.db.models.functions import Lower
+from django.utils import timezone
 
+from core.choices import UserRoleChoices
+from tasks.models import Task, TaskHistory, TASK_TITLE_UNIQUE_CONSTRAINT
+from tasks.cache import invalidate_task_acl, bump_task_list_generations
+from tasks.search import refresh_task_search_vectors
+from tasks.stats import task_stats_key, record_task_stats
 
-def update_task(task, *, user, status=None, priority=None, deadline=None):
+User = get_user_model()
+
+
+def is_duplicate_title_error(exc):
     """
-    Update task and create audit history.
+    Whether an IntegrityError was raised by the live title unique index.
     """
+    diag = getattr(exc.__cause__, "diag", None)
+    constraint_name = getattr(diag, "constraint_name", None)
+
+    if constraint_name:
+        return constraint_name == TASK_TITLE_UNIQUE_CONSTRAINT
+
+    return TASK_TITLE_UNIQUE_CONSTRAINT in str(exc)
+
+
+def get_visible_tasks(user, include_deleted=False):
+    """
+    Tasks the user is allowed to list, same rules as `CanViewTask`.
+
+    Admin: all tasks of the organization
+    User: only tasks assigned to them, tasks assigned before assignees were
+    restricted to the owner's organization included
+    """
+    if user.role == UserRoleChoices.TENANT_ADMIN:
+        queryset = Task.objects.filter(organization_id=user.organization_id)
+    else:
+        queryset = Task.objects.filter(assignee=user)
+
+    if not include_deleted:
+        queryset = queryset.filter(deleted_at__isnull=True)
+
+    return queryset
+
+
+def filter_tasks(queryset, params):
+    """
+    Apply the task list query param filters.
+    """
+    owner_id = params.get("owner_id")
+    assignee_id = params.get("assignee_id")
+    status_param = params.get("status")
+    priority_param = params.get("priority")
+
+    if owner_id:
+        queryset = queryset.filter(owner_id=owner_id)
+
+    if assignee_id:
+        queryset = queryset.filter(assignee_id=assignee_id)
+
+    if status_param:
+        queryset = queryset.filter(status=status_param)
+
+    if priority_param:
+        queryset = queryset.filter(priority=priority_param)
+
+    return queryset
 
-    old_status = task.status
-    old_priority = task.priority
 
-    if status is not None:
-        task.status = status
+def notify_tasks_changed(tasks):
+    """
+    Invalidate data cached from these tasks once the transaction commits.
+
+    Every write path calls it, `tasks` only need id, organization_id,
+    owner_id and assignee_id.
+    """
+    tasks = list(tasks)
+    if not tasks:
+        return
+
+    invalidate_task_acl(*[task.id for task in tasks])
+    bump_task_list_generations(
+        organization_ids=[task.organization_id for task in tasks],
+        owner_ids=[task.owner_id for task in tasks],
+        assignee_ids=[task.assignee_id for task in tasks],
+    )
 
-    if priority is not None:
-        task.priority = priority
 
-    if deadline is not None:
-        task.deadline = deadline
+@transaction.atomic
+def create_task(*, owner, assignee, **fields):
+    """
+    Create a task owned by `owner`.
+    """
+    task = Task.objects.create(
+        organization_id=owner.organization_id,
+        owner=owner,
+        assignee=assignee,
+        **fields,
+    )
+    record_task_stats(added=[task_stats_key(task)])
+    notify_tasks_changed([task])
+    refresh_task_search_vectors([task.id])
+    return task
 
-    task.save()
 
+def _apply_task_changes(task, *, user, **changes):
+    """
+    Set the provided values on a task in memory.
+
+    Returns the names of the fields that actually changed and the history row
+    to record for them, if any.
+    """
+    old_status = task.status
+    old_priority = task.priority
+    changed_fields = []
+
+    for field, value in changes.items():
+        if value is not None and getattr(task, field) != value:
+            setattr(task, field, value)
+            changed_fields.append(field)
+
+    history = None
     if old_status != task.status or old_priority != task.priority:
-        TaskHistory.objects.create(
+        history = TaskHistory(
             task=task,
+            organization_id=task.organization_id,
             actor=user,
             old_status=old_status,
             new_status=task.status,
@@ -30,4 +132,328 @@ def update_task(task, *, user, status=None, priority=None, deadline=None):
             new_priority=task.priority,
         )
 
-    return task
\ No newline at end of file
+    return changed_fields, history
+
+
+LOCKED_TASK_FIELDS = (
+    "organization_id",
+    "owner_id",
+    "assignee_id",
+    "status",
+    "priority",
+    "deadline",
+)
+
+
+def _lock_tasks(tasks):
+    """
+    Lock the live rows of `tasks` in id order and refresh the copies with
+    their stored values.
+
+    The copies may have been loaded before a concurrent write, the changed
+    fields, the history and the stats deltas are all computed from the
+    locked values. Returns the tasks whose row is still live.
+    """
+    rows = {
+        row.pop("id"): row
+        for row in (
+            Task.objects.select_for_update()
+            .filter(id__in=[task.id for task in tasks], deleted_at__isnull=True)
+            .order_by("id")
+            .values("id", *LOCKED_TASK_FIELDS)
+        )
+    }
+
+    live = []
+    for task in tasks:
+        row = rows.get(task.id)
+        if row is None:
+            continue
+
+        for field, value in row.items():
+            setattr(task, field, value)
+        live.append(task)
+
+    return live
+
+
+@transaction.atomic
+def update_tasks(tasks, *, user, status=None, priority=None, deadline=None):
+    """
+    Apply the same update to many tasks and create audit history.
+
+    Only tasks that actually change are written, with a single UPDATE limited
+    to the provided fields, and all history rows are inserted with a single
+    INSERT.
+    """
+    values = {
+        field: value
+        for field, value in {
+            "status": status,
+            "priority": priority,
+            "deadline": deadline,
+        }.items()
+        if value is not None
+    }
+
+    now = timezone.now()
+    changed = []
+    history = []
+    removed = []
+
+    for task in _lock_tasks(tasks):
+        stats_key = task_stats_key(task)
+        changed_fields, history_row = _apply_task_changes(task, user=user, **values)
+
+        if not changed_fields:
+            continue
+
+        task.updated_at = now
+        changed.append(task)
+        removed.append(stats_key)
+
+        if history_row:
+            history.append(history_row)
+
+    if changed:
+        Task.objects.filter(
+            id__in=[task.id for task in changed]
+        ).update(updated_at=now, **values)
+        TaskHistory.objects.bulk_create(history)
+        record_task_stats(
+            removed=removed,
+            added=[task_stats_key(task) for task in changed],
+        )
+        notify_tasks_changed(changed)
+
+    return tasks
+
+
+def update_task(task, *, user, status=None, priority=None, deadline=None):
+    """
+    Update task and create audit history.
+    """
+    update_tasks(
+        [task],
+        user=user,
+        status=status,
+        priority=priority,
+        deadline=deadline,
+    )
+    return task
+
+
+def _resolve_bulk_assignees(items, *, user):
+    """
+    Resolve the assignee of every item with a single user lookup.
+
+    Returns ({index: assignee}, {index: errors}).
+    """
+    assignees = {}
+    errors = {}
+
+    if user.role == UserRoleChoices.USER:
+        for index, attrs in items.items():
+            assignee_id = attrs.get("assignee_id")
+            if assignee_id and assignee_id != user.id:
+                errors[index] = {
+                    "non_field_errors": ["Users can only create tasks for themselves."]
+                }
+            else:
+                assignees[index] = user
+        return assignees, errors
+
+    if user.role != UserRoleChoices.TENANT_ADMIN:
+        for index in items:
+            errors[index] = {"non_field_errors": ["Invalid user role."]}
+        return assignees, errors
+
+    assignee_ids = {
+        attrs["assignee_id"] for attrs in items.values() if attrs.get("assignee_id")
+    }
+    # tasks belong to the owner's organization, so do their assignees
+    found = User.objects.filter(
+        id__in=assignee_ids,
+        organization_id=user.organization_id,
+        deleted_at__isnull=True,
+        is_active=True,
+    ).in_bulk()
+
+    for index, attrs in items.items():
+        assignee_id = attrs.get("assignee_id")
+        if not assignee_id:
+            assignees[index] = user
+        elif assignee_id in found:
+            assignees[index] = found[assignee_id]
+        else:
+            errors[index] = {"assignee_id": ["Assignee does not exist."]}
+
+    return assignees, errors
+
+
+def build_bulk_tasks(items, *, user):
+    """
+    Turn field validated payloads into unsaved tasks owned by `user`.
+
+    `items` maps the position of each payload to its validated data.
+    Assignees and duplicate titles are checked with one query each for the
+    whole batch, rejected items do not block the others.
+
+    Returns ({index: task}, {index: errors}).
+    """
+    assignees, errors = _resolve_bulk_assignees(items, user=user)
+
+    titles = {items[index]["title"].lower() for index in assignees}
+    existing = set(
+        Task.objects.filter(
+            assignee__in={assignee.id for assignee in assignees.values()},
+            deleted_at__isnull=True,
+        )
+        .annotate(normalized_title=Lower("title"))
+        .filter(normalized_title__in=titles)
+        .values_list("assignee_id", "normalized_title")
+    )
+
+    tasks = {}
+    for index, assignee in assignees.items():
+        attrs = items[index]
+        key = (assignee.id, attrs["title"].lower())
+
+        if key in existing:
+            errors[index] = {
+                "title": ["Task with this title already exists for this user."]
+            }
+            continue
+
+        existing.add(key)
+        tasks[index] = Task(
+            organization_id=user.organization_id,
+            owner=user,
+            assignee=assignee,
+            title=attrs["title"],
+            description=attrs.get("description", ""),
+            priority=attrs["priority"],
+            deadline=attrs.get("deadline"),
+        )
+
+    return tasks, errors
+
+
+def bulk_create_tasks(items, *, user):
+    """
+    Create many tasks owned by `user` in one transaction.
+
+    `items` maps the position of each payload in the request to its field
+    validated data, see `build_bulk_tasks`.
+
+    Returns ({index: task}, {index: errors}).
+    """
+    tasks, errors = build_bulk_tasks(items, user=user)
+
+    with transaction.atomic():
+        # a title taken concurrently since build_bulk_tasks checked it makes
+        # ON CONFLICT DO NOTHING skip that row, the rows read back are the
+        # ones inserted and only the skipped items fail
+        Task.objects.bulk_create(tasks.values(), ignore_conflicts=True)
+        inserted = set(
+            Task.objects.filter(
+                id__in=[task.id for task in tasks.values()]
+            ).values_list("id", flat=True)
+        )
+
+        for index, task in list(tasks.items()):
+            if task.id not in inserted:
+                del tasks[index]
+                errors[index] = {
+                    "title": ["Task with this title already exists for this user."]
+                }
+
+        record_task_stats(
+            added=[task_stats_key(task) for task in tasks.values()]
+        )
+        notify_tasks_changed(tasks.values())
+        refresh_task_search_vectors([task.id for task in tasks.values()])
+
+    return tasks, errors
+
+
+@transaction.atomic
+def bulk_update_tasks(changes, *, user):
+    """
+    Apply validated updates to many tasks with one UPDATE and record audit
+    history for all of them with one INSERT.
+
+    `changes` is a list of (task, validated_data) pairs, the tasks locked with
+    `select_for_update` in the caller's transaction.
+    """
+    now = timezone.now()
+    fields = {"updated_at"}
+    history = []
+    removed = []
+    _lock_tasks([task for task, _ in changes])
+
+    for task, validated_data in changes:
+        removed.append(task_stats_key(task))
+        changed_fields, history_row = _apply_task_changes(
+            task, user=user, **validated_data
+        )
+        fields.update(changed_fields)
+        task.updated_at = now
+
+        if history_row:
+            history.append(history_row)
+
+    tasks = [task for task, _ in changes]
+    Task.objects.bulk_update(tasks, fields=sorted(fields))
+    TaskHistory.objects.bulk_create(history)
+    record_task_stats(
+        removed=removed,
+        added=[task_stats_key(task) for task in tasks],
+    )
+    notify_tasks_changed(tasks)
+
+    return tasks
+
+
+@transaction.atomic
+def bulk_delete_tasks(tasks):
+    """
+    Soft delete many tasks with a single UPDATE.
+
+    The still live rows are locked first, so a concurrent delete of the same
+    task is only counted once in the stats rollup.
+    """
+    now = timezone.now()
+    live = list(
+        Task.objects
+        .select_for_update()
+        .filter(id__in=[task.id for task in tasks], deleted_at__isnull=True)
+        .only(
+            "id",
+            "organization_id",
+            "owner_id",
+            "assignee_id",
+            "status",
+            "priority",
+        )
+    )
+
+    Task.objects.filter(
+        id__in=[task.id for task in live],
+    ).update(deleted_at=now)
+
+    for task in tasks:
+        task.deleted_at = now
+
+    record_task_stats(removed=[task_stats_key(task) for task in live])
+    notify_tasks_changed(live)
+
+    return tasks
+
+
+def delete_task(task):
+    """
+    Soft delete a single task.
+    """
+    bulk_delete_tasks([task])
+    return task
@@ -0,0 +1,219 @@
+import uuid
+from collections import Counter
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.db.models import Count, F, Q
+from django.utils import timezone
+
+from core.choices import TaskStatusChoices, TaskPriorityChoices, UserRoleChoices
+from tasks.models import Task, TaskStatsRollup
+
+
+def task_stats_key(task):
+    """
+    Rollup bucket a live task is counted in.
+    """
+    return (task.organization_id, task.assignee_id, task.status, task.priority)
+
+
+def record_task_stats(removed=(), added=()):
+    """
+    Move tasks between rollup buckets inside the current transaction.
+
+    `removed` and `added` are bucket keys from `task_stats_key`, taken before
+    and after the write. Deltas of the same bucket are merged and applied with
+    a single upsert, so the rollup rolls back together with the task rows.
+    """
+    if not settings.TASK_STATS_ROLLUP_ENABLED:
+        return
+
+    deltas = Counter(added)
+    deltas.subtract(Counter(removed))
+
+    # sorted so concurrent writers lock the rollup rows in the same order
+    # (str() as tasks without an organization have None in the key)
+    rows = sorted(
+        ((key, delta) for key, delta in deltas.items() if delta),
+        key=lambda row: str(row[0]),
+    )
+    if not rows:
+        return
+
+    values = ", ".join(["(%s, %s, %s, %s, %s, %s)"] * len(rows))
+    params = []
+    for (organization_id, assignee_id, status, priority), delta in rows:
+        params.extend(
+            [uuid.uuid4(), organization_id, assignee_id, status, priority, delta]
+        )
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"""
+            INSERT INTO tasks_stats_rollup
+                (id, organization_id, assignee_id, status, priority, task_count)
+            VALUES {values}
+            ON CONFLICT (organization_id, assignee_id, status, priority)
+            DO UPDATE SET task_count =
+                tasks_stats_rollup.task_count + EXCLUDED.task_count
+            """,
+            params,
+        )
+
+
+@transaction.atomic
+def rebuild_task_stats():
+    """
+    Recompute the whole rollup from the tasks table.
+
+    The rollup is locked for the duration, writers that commit before the
+    lock is granted are counted by the rebuild, later ones apply their delta
+    on top of it.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute("LOCK TABLE tasks_stats_rollup IN EXCLUSIVE MODE")
+
+    TaskStatsRollup.objects.all().delete()
+
+    buckets = (
+        Task.objects
+        .filter(deleted_at__isnull=True)
+        .values("organization_id", "assignee_id", "status", "priority")
+        .annotate(total=Count("id"))
+        .order_by()
+    )
+
+    return len(
+        TaskStatsRollup.objects.bulk_create(
+            (
+                TaskStatsRollup(
+                    organization_id=bucket["organization_id"],
+                    assignee_id=bucket["assignee_id"],
+                    status=bucket["status"],
+                    priority=bucket["priority"],
+                    task_count=bucket["total"],
+                )
+                for bucket in buckets.iterator()
+            ),
+            batch_size=1000,
+        )
+    )
+
+
+def overdue_filter(now):
+    """
+    Open tasks whose deadline has passed.
+    """
+    return (
+        Q(deadline__lt=now)
+        & ~Q(status=TaskStatusChoices.COMPLETED)
+    )
+
+
+def _empty_matrix():
+    return {
+        status: {priority: 0 for priority in TaskPriorityChoices.values}
+        for status in TaskStatusChoices.values
+    }
+
+
+def build_task_stats(rows, overdue):
+    """
+    Shape grouped counts into the stats payload.
+
+    `rows` are dicts with assignee_id, assignee__username, status, priority
+    and total, `overdue` maps assignee ids to their overdue task count.
+    """
+    by_status_priority = _empty_matrix()
+    assignees = {}
+
+    for row in rows:
+        if not row["total"]:
+            continue
+
+        by_status_priority[row["status"]][row["priority"]] += row["total"]
+
+        workload = assignees.setdefault(
+            row["assignee_id"],
+            {
+                "assignee_id": row["assignee_id"],
+                "username": row["assignee__username"],
+                "total": 0,
+                "open": 0,
+                "overdue": overdue.get(row["assignee_id"], 0),
+                "by_status": {status: 0 for status in TaskStatusChoices.values},
+            },
+        )
+        workload["total"] += row["total"]
+        workload["by_status"][row["status"]] += row["total"]
+        if row["status"] != TaskStatusChoices.COMPLETED:
+            workload["open"] += row["total"]
+
+    return {
+        "total": sum(workload["total"] for workload in assignees.values()),
+        "overdue": sum(overdue.values()),
+        "by_status_priority": by_status_priority,
+        "by_assignee": sorted(
+            assignees.values(), key=lambda workload: -workload["total"]
+        ),
+    }
+
+
+def compute_task_stats(queryset):
+    """
+    Stats of a task queryset with a single grouped query.
+    """
+    now = timezone.now()
+
+    buckets = list(
+        queryset
+        .values("assignee_id", "assignee__username", "status", "priority")
+        .annotate(
+            total=Count("id"),
+            overdue=Count("id", filter=overdue_filter(now)),
+        )
+        .order_by()
+    )
+
+    overdue = Counter()
+    for bucket in buckets:
+        overdue[bucket["assignee_id"]] += bucket["overdue"]
+
+    return build_task_stats(buckets, +overdue)
+
+
+def rollup_task_stats(user):
+    """
+    Stats read from the rollup table, scoped like `get_visible_tasks`.
+
+    Overdue depends on the current time so it is counted live, through the
+    partial (assignee, deadline) index.
+    """
+    rollup = TaskStatsRollup.objects.filter(task_count__gt=0)
+    tasks = Task.objects.filter(deleted_at__isnull=True)
+
+    if user.role == UserRoleChoices.TENANT_ADMIN:
+        rollup = rollup.filter(organization_id=user.organization_id)
+        tasks = tasks.filter(organization_id=user.organization_id)
+    else:
+        rollup = rollup.filter(assignee=user)
+        tasks = tasks.filter(assignee=user)
+
+    rows = rollup.values(
+        "assignee_id",
+        "assignee__username",
+        "status",
+        "priority",
+        total=F("task_count"),
+    )
+
+    overdue = dict(
+        tasks
+        .filter(overdue_filter(timezone.now()))
+        .values("assignee_id")
+        .annotate(total=Count("id"))
+        .order_by()
+        .values_list("assignee_id", "total")
+    )
+
+    return build_task_stats(rows, overdue)
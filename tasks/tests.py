@@ -1,3 +1,952 @@
-from django.test import TestCase
+import datetime
+import json
+import threading
+import uuid
+from contextlib import contextmanager
+from unittest import mock
 
-# Create your tests here.
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import connection, connections, transaction
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.test import APIClient, APITestCase, APITransactionTestCase
+
+from core.choices import UserRoleChoices
+from core.constants import history_list_months
+from core.db_router import ReplicaRouter, reset_routing, start_routing
+from core.testing import assert_endpoint_queries, table_reads
+from tasks.models import Comment, Task, TaskHistory
+from tasks.partitions import (
+    add_months,
+    create_history_partition,
+    history_partition_name,
+    month_start,
+)
+from tasks import importer, services
+from tasks.services import get_visible_tasks, filter_tasks, update_task
+from tasks.stats import compute_task_stats, rebuild_task_stats, rollup_task_stats
+from tasks.views.history import get_task_history
+from tasks.views.sync import TaskSyncAPIView
+from users.cache import get_cached_user
+from users.models import Organization
+from users.services import restore_user, soft_delete_user
+from users.tokens import RefreshToken
+
+User = get_user_model()
+
+
+class TaskFixturesMixin:
+    """
+    An organization with an admin, a few members and tasks spread between
+    them, every task with comments and history rows.
+    """
+
+    tasks_per_member = 3
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.organization = Organization.objects.create(name="Acme")
+        cls.admin = cls.create_user("admin", role=UserRoleChoices.TENANT_ADMIN)
+        cls.members = [cls.create_user(f"member{index}") for index in range(3)]
+
+        cls.tasks = []
+        for member in cls.members:
+            for index in range(cls.tasks_per_member):
+                task = Task.objects.create(
+                    organization=cls.organization,
+                    owner=cls.admin,
+                    assignee=member,
+                    title=f"{member.username} task {index}",
+                )
+                cls.tasks.append(task)
+
+        cls.task = cls.tasks[0]
+        for user in [cls.admin, *cls.members]:
+            Comment.objects.create(
+                organization=cls.organization,
+                task=cls.task,
+                user=user,
+                message=f"comment by {user.username}",
+            )
+            TaskHistory.objects.create(
+                organization=cls.organization,
+                task=cls.task,
+                actor=user,
+                old_status="PENDING",
+                new_status="IN_PROGRESS",
+            )
+
+    @classmethod
+    def create_user(cls, username, role=UserRoleChoices.USER):
+        return User.objects.create_user(
+            username=username,
+            email=f"{username}@example.com",
+            password="password",
+            organization=cls.organization,
+            role=role,
+        )
+
+    def setUp(self):
+        cache.clear()
+        self.client.force_authenticate(self.admin)
+
+    def authenticate(self, user):
+        """
+        Authenticate with a real token, the request user then comes from the
+        user cache as in production.
+        """
+        token = RefreshToken.for_user(user).access_token
+        self.client.force_authenticate(None)
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
+
+
+class TaskEndpointQueryCountTests(TaskFixturesMixin, APITestCase):
+    """
+    Read endpoints run a fixed number of queries whatever the number of
+    rows and related users they render.
+    """
+
+    def test_task_list(self):
+        # count, page
+        response = assert_endpoint_queries(self.client, "get", "/api/v1/tasks/", 2)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.data["data"]), len(self.tasks))
+
+    def test_task_list_cursor(self):
+        # page only, no count unless requested
+        response = assert_endpoint_queries(
+            self.client, "get", "/api/v1/tasks/?pagination=cursor", 1
+        )
+        self.assertEqual(response.status_code, 200)
+
+    def test_task_detail(self):
+        # acl, validators, task with its users
+        response = assert_endpoint_queries(
+            self.client, "get", f"/api/v1/tasks/{self.task.id}/", 3
+        )
+        self.assertEqual(response.status_code, 200)
+
+    def test_comment_list(self):
+        # acl, version aggregate, count, page
+        response = assert_endpoint_queries(
+            self.client, "get", f"/api/v1/tasks/{self.task.id}/comments/", 4
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.data["data"]), len(self.members) + 1)
+
+    def test_history_list(self):
+        # acl, version aggregate, count, page
+        response = assert_endpoint_queries(
+            self.client, "get", f"/api/v1/tasks/{self.task.id}/history/", 4
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.data["data"]), len(self.members) + 1)
+
+
+class TaskListIndexPlanTests(TaskFixturesMixin, APITestCase):
+    """
+    The list queries walk a composite index in their order, without sorting.
+
+    The fixture tables are tiny, so sequential scans are disabled for the
+    planner to show which index it would use on a large table.
+    """
+
+    def explain(self, queryset):
+        sql, params = queryset.query.sql_with_params()
+
+        with connection.cursor() as cursor:
+            cursor.execute("SET LOCAL enable_seqscan = off")
+            cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+            plan = cursor.fetchone()[0]
+
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        return plan[0]["Plan"]
+
+    def plan_nodes(self, plan):
+        yield plan
+        for child in plan.get("Plans", []):
+            yield from self.plan_nodes(child)
+
+    def root_index(self, name):
+        # partitions of tasks_history carry their own copies of its indexes
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT coalesce(pg_partition_root(%s::regclass)::text, %s)",
+                [name, name],
+            )
+            return cursor.fetchone()[0]
+
+    def assert_index_ordered(self, queryset, indexes):
+        nodes = list(self.plan_nodes(self.explain(queryset)))
+        node_types = [node["Node Type"] for node in nodes]
+        used = {
+            self.root_index(node["Index Name"])
+            for node in nodes
+            if "Index Name" in node
+        }
+
+        self.assertNotIn("Sort", node_types)
+        self.assertNotIn("Incremental Sort", node_types)
+        self.assertNotIn("Seq Scan", node_types)
+        self.assertTrue(used, node_types)
+        self.assertLessEqual(used, set(indexes))
+
+    def page(self, queryset):
+        return queryset.order_by("-created_at", "-id")[:11]
+
+    def test_admin_task_list(self):
+        self.assert_index_ordered(
+            self.page(get_visible_tasks(self.admin)),
+            ["tasks_org_created_live_idx"],
+        )
+
+    def test_member_task_list(self):
+        self.assert_index_ordered(
+            self.page(get_visible_tasks(self.members[0])),
+            ["tasks_org_assignee_live_idx", "tasks_assignee_live_idx"],
+        )
+
+    def test_owner_status_task_list(self):
+        queryset = filter_tasks(
+            get_visible_tasks(self.admin),
+            {"owner_id": self.admin.id, "status": "PENDING"},
+        )
+        self.assert_index_ordered(
+            self.page(queryset),
+            ["tasks_owner_status_live_idx", "tasks_org_created_live_idx"],
+        )
+
+    def test_comment_list(self):
+        queryset = Comment.objects.filter(
+            organization_id=self.organization.id,
+            task_id=self.task.id,
+            deleted_at__isnull=True,
+        )
+        self.assert_index_ordered(
+            self.page(queryset),
+            ["comments_org_task_live_idx", "comments_task_live_idx"],
+        )
+
+    def test_history_list(self):
+        self.assert_index_ordered(
+            self.page(get_task_history(self.task, {})),
+            ["tasks_history_org_task_idx", "tasks_history_task_created_idx"],
+        )
+
+    def test_history_list_prunes_partitions(self):
+        # partitions of the window, one older month and the ones migrations
+        # created from the current month on
+        current = month_start(timezone.now())
+        for offset in range(-6, 0):
+            month = add_months(current, offset)
+            create_history_partition(
+                history_partition_name(month), month, add_months(month, 1)
+            )
+
+        plan = self.explain(self.page(get_task_history(self.task, {})))
+        scanned = {
+            node["Relation Name"]
+            for node in self.plan_nodes(plan)
+            if "Relation Name" in node
+        }
+
+        self.assertEqual(
+            scanned,
+            {
+                history_partition_name(add_months(current, offset))
+                for offset in range(-history_list_months, 1)
+            },
+        )
+
+
+@override_settings(DATABASE_REPLICAS=["replica_1"])
+@mock.patch("core.middleware.is_shared_cache", return_value=True)
+class ReplicaRoutingTests(TaskFixturesMixin, APITestCase):
+    """
+    Safe requests read from a replica, writes and the requests of users who
+    wrote within REPLICA_READ_YOUR_WRITES_SECONDS read from the primary.
+
+    The routing decisions are recorded and every query still runs on the
+    test database, so no replica has to be configured. Requests authenticate
+    with real tokens, the middleware reads the user id from the token before
+    DRF authenticates it.
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.authenticate(self.admin)
+
+    @contextmanager
+    def record_reads(self):
+        reads = []
+        db_for_read = ReplicaRouter.db_for_read
+
+        def record(router, model, **hints):
+            reads.append(db_for_read(router, model, **hints))
+            return "default"
+
+        with mock.patch.object(ReplicaRouter, "db_for_read", record):
+            yield reads
+
+    def assert_reads_from(self, alias, method, path, data=None):
+        kwargs = {} if data is None else {"data": data, "format": "json"}
+
+        with self.record_reads() as reads:
+            response = getattr(self.client, method)(path, **kwargs)
+
+        self.assertLess(response.status_code, 400, response.data)
+        self.assertTrue(reads)
+        self.assertEqual(set(reads), {alias})
+        return response
+
+    def test_safe_request_reads_from_replica(self, is_shared_cache):
+        self.assert_reads_from("replica_1", "get", "/api/v1/tasks/")
+
+    def test_write_request_reads_from_primary(self, is_shared_cache):
+        self.assert_reads_from(
+            "default", "patch", f"/api/v1/tasks/{self.task.id}/",
+            {"status": "IN_PROGRESS"},
+        )
+
+    def test_write_switches_reads_to_primary(self, is_shared_cache):
+        router = ReplicaRouter()
+        tokens = start_routing(True)
+        try:
+            self.assertEqual(router.db_for_read(Task), "replica_1")
+            self.assertEqual(router.db_for_write(Task), "default")
+            self.assertEqual(router.db_for_read(Task), "default")
+        finally:
+            reset_routing(tokens)
+
+    def test_task_create_pins_reads_to_primary(self, is_shared_cache):
+        self.assert_reads_from(
+            "default", "post", "/api/v1/tasks/",
+            {"title": "new task", "priority": "LOW"},
+        )
+        self.assert_reads_from("default", "get", "/api/v1/tasks/")
+
+    def test_task_update_pins_reads_to_primary(self, is_shared_cache):
+        self.assert_reads_from(
+            "default", "patch", f"/api/v1/tasks/{self.task.id}/",
+            {"status": "IN_PROGRESS"},
+        )
+        self.assert_reads_from("default", "get", f"/api/v1/tasks/{self.task.id}/")
+
+    def test_comment_create_pins_reads_to_primary(self, is_shared_cache):
+        path = f"/api/v1/tasks/{self.task.id}/comments/"
+        self.assert_reads_from("default", "post", path, {"message": "hello"})
+        self.assert_reads_from("default", "get", path)
+
+    def test_pin_is_per_user(self, is_shared_cache):
+        self.assert_reads_from(
+            "default", "patch", f"/api/v1/tasks/{self.task.id}/",
+            {"status": "IN_PROGRESS"},
+        )
+
+        self.authenticate(self.task.assignee)
+        self.assert_reads_from("replica_1", "get", "/api/v1/tasks/")
+
+    def test_expired_pin_reads_from_replica(self, is_shared_cache):
+        self.assert_reads_from(
+            "default", "patch", f"/api/v1/tasks/{self.task.id}/",
+            {"status": "IN_PROGRESS"},
+        )
+
+        # the pin is a cache entry, dropping it is what its timeout does
+        cache.clear()
+        self.assert_reads_from("replica_1", "get", "/api/v1/tasks/")
+
+
+class TaskSyncTests(TaskFixturesMixin, APITestCase):
+    """
+    Delta sync returns every change after a watermark, deletions as
+    tombstones.
+    """
+
+    def watermark(self, changed_at):
+        return TaskSyncAPIView().encode_watermark(changed_at, uuid.UUID(int=0))
+
+    def sync(self, since):
+        response = self.client.get("/api/v1/tasks/sync/", {"since": since})
+        self.assertEqual(response.status_code, 200)
+        return response.data["data"]
+
+    def ids(self, rows):
+        return {str(row["id"]) for row in rows}
+
+    def test_initial_sync_returns_live_tasks(self):
+        Task.objects.filter(id=self.tasks[1].id).update(deleted_at=timezone.now())
+
+        response = self.client.get("/api/v1/tasks/sync/")
+        data = response.data["data"]
+
+        self.assertEqual(
+            self.ids(data["changed"]),
+            {str(task.id) for task in self.tasks[:1] + self.tasks[2:]},
+        )
+        self.assertEqual(data["deleted"], [])
+
+    def test_delete_is_synced_as_tombstone(self):
+        since = self.watermark(timezone.now() - datetime.timedelta(hours=1))
+        Task.objects.update(updated_at=timezone.now() - datetime.timedelta(hours=2))
+
+        self.client.delete(f"/api/v1/tasks/{self.task.id}/")
+
+        data = self.sync(since)
+        self.assertEqual(data["changed"], [])
+        self.assertEqual(self.ids(data["deleted"]), {str(self.task.id)})
+
+    @mock.patch("tasks.views.sync.sync_batch_size", 2)
+    def test_pages_follow_the_watermark(self):
+        Task.objects.update(updated_at=timezone.now() - datetime.timedelta(hours=2))
+        since = self.watermark(timezone.now() - datetime.timedelta(hours=3))
+
+        seen = []
+        while True:
+            data = self.sync(since)
+            seen.extend(str(row["id"]) for row in data["changed"])
+            since = data["watermark"]
+            if not data["has_more"]:
+                break
+
+        self.assertEqual(sorted(seen), sorted(str(task.id) for task in self.tasks))
+
+        # everything returned is older than the lag, nothing comes back
+        self.assertEqual(self.sync(since)["changed"], [])
+
+    def test_late_commit_is_returned_by_next_sync(self):
+        data = self.sync(self.watermark(timezone.now() - datetime.timedelta(hours=1)))
+        self.assertEqual(len(data["changed"]), len(self.tasks))
+
+        # committed after the sync, stamped before the rows it returned
+        late = timezone.now() - datetime.timedelta(seconds=10)
+        Task.objects.filter(id=self.task.id).update(
+            title="late change", updated_at=late
+        )
+
+        data = self.sync(data["watermark"])
+        titles = {str(row["id"]): row["title"] for row in data["changed"]}
+        self.assertEqual(titles[str(self.task.id)], "late change")
+
+    def test_restored_tasks_follow_their_tombstones(self):
+        member = self.members[0]
+        member_tasks = {
+            str(task.id) for task in self.tasks if task.assignee_id == member.id
+        }
+
+        # tasks last edited well before the client's watermark
+        now = timezone.now()
+        Task.objects.update(updated_at=now - datetime.timedelta(hours=2))
+        since = self.watermark(now - datetime.timedelta(hours=1))
+
+        soft_delete_user(member)
+        data = self.sync(since)
+        self.assertEqual({str(row["id"]) for row in data["deleted"]}, member_tasks)
+
+        restore_user(member)
+        data = self.sync(since)
+        self.assertEqual({str(row["id"]) for row in data["changed"]}, member_tasks)
+        self.assertEqual(data["deleted"], [])
+
+
+class TaskUpdateTests(TaskFixturesMixin, APITestCase):
+    """
+    Updates compute their changes and history from the locked rows, not
+    from copies loaded before a concurrent write.
+    """
+
+    def test_history_uses_locked_values(self):
+        stale = Task.objects.get(id=self.task.id)
+        # a concurrent write committed after the copy was loaded
+        Task.objects.filter(id=self.task.id).update(status="IN_PROGRESS")
+
+        update_task(stale, user=self.admin, status="COMPLETED")
+
+        history = TaskHistory.objects.get(task=self.task, new_status="COMPLETED")
+        self.assertEqual(history.old_status, "IN_PROGRESS")
+
+    def test_no_change_against_locked_values(self):
+        stale = Task.objects.get(id=self.task.id)
+        Task.objects.filter(id=self.task.id).update(status="COMPLETED")
+        history_count = TaskHistory.objects.filter(task=self.task).count()
+
+        update_task(stale, user=self.admin, status="COMPLETED")
+
+        self.assertEqual(TaskHistory.objects.filter(task=self.task).count(), history_count)
+
+    def test_deleted_task_is_not_updated(self):
+        stale = Task.objects.get(id=self.task.id)
+        Task.objects.filter(id=self.task.id).update(deleted_at=timezone.now())
+
+        update_task(stale, user=self.admin, status="COMPLETED")
+
+        self.assertEqual(Task.objects.get(id=self.task.id).status, "PENDING")
+
+
+class TaskValidatorTests(TaskFixturesMixin, APITestCase):
+    """
+    A response embedding users gets a new ETag when one of them changes.
+    """
+
+    def assert_changed_by_rename(self, path):
+        etag = self.client.get(path)["ETag"]
+        self.assertEqual(
+            self.client.get(path, HTTP_IF_NONE_MATCH=etag).status_code, 304
+        )
+
+        response = self.client.patch(
+            f"/api/v1/users/{self.members[0].id}/",
+            {"first_name": "Renamed"},
+            format="json",
+        )
+        self.assertEqual(response.status_code, 200)
+
+        response = self.client.get(path, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
+
+    def test_task_detail_follows_assignee(self):
+        self.assert_changed_by_rename(f"/api/v1/tasks/{self.task.id}/")
+
+    def test_comment_list_follows_commenters(self):
+        self.assert_changed_by_rename(f"/api/v1/tasks/{self.task.id}/comments/")
+
+
+class CachedRequestUserTests(TaskFixturesMixin, APITestCase):
+    """
+    Write endpoints render the request user from the user cache, without
+    loading its profile fields one query at a time.
+    """
+
+    def setUp(self):
+        super().setUp()
+        self.authenticate(self.admin)
+        get_cached_user(self.admin.id)
+
+    def assert_no_user_reads(self, method, path, data):
+        with CaptureQueriesContext(connection) as context:
+            response = getattr(self.client, method)(path, data, format="json")
+
+        self.assertLess(response.status_code, 300, response.data)
+        self.assertEqual(table_reads(context, "users"), [])
+        return response
+
+    def test_task_create(self):
+        response = self.assert_no_user_reads(
+            "post", "/api/v1/tasks/", {"title": "new task", "priority": "LOW"}
+        )
+        self.assertEqual(response.data["data"]["owner"]["username"], "admin")
+
+    def test_comment_create(self):
+        response = self.assert_no_user_reads(
+            "post",
+            f"/api/v1/tasks/{self.task.id}/comments/",
+            {"message": "hello"},
+        )
+        self.assertEqual(response.data["data"]["user"]["username"], "admin")
+
+    def test_bulk_create(self):
+        response = self.assert_no_user_reads(
+            "post",
+            "/api/v1/tasks/bulk/",
+            {"tasks": [{"title": f"bulk {index}", "priority": "LOW"} for index in range(3)]},
+        )
+        self.assertEqual(response.data["data"]["succeeded"], 3)
+
+
+class TaskBulkTests(TaskFixturesMixin, APITestCase):
+    """
+    Bulk requests report every item on its own, failed items do not block
+    the valid ones.
+    """
+
+    def bulk(self, method, data):
+        response = getattr(self.client, method)("/api/v1/tasks/bulk/", data, format="json")
+        self.assertEqual(response.status_code, 200, response.data)
+        return response.data["data"]
+
+    def statuses(self, data):
+        return [result["status"] for result in data["results"]]
+
+    def test_create_partial_failure(self):
+        data = self.bulk(
+            "post",
+            {
+                "tasks": [
+                    {"title": "new task", "priority": "LOW"},
+                    {"title": "no priority"},
+                    {
+                        "title": "MEMBER0 task 0",
+                        "priority": "LOW",
+                        "assignee_id": str(self.members[0].id),
+                    },
+                    {"title": "New Task", "priority": "HIGH"},
+                ]
+            },
+        )
+
+        self.assertEqual(self.statuses(data), ["success", "error", "error", "error"])
+        self.assertIn("priority", data["results"][1]["errors"])
+        self.assertIn("title", data["results"][2]["errors"])
+        self.assertIn("title", data["results"][3]["errors"])
+        self.assertEqual(Task.objects.filter(title__iexact="new task").count(), 1)
+
+    def test_create_title_taken_concurrently(self):
+        build_bulk_tasks = services.build_bulk_tasks
+
+        def build_then_race(items, *, user):
+            built = build_bulk_tasks(items, user=user)
+            # another request creates the same title after the check
+            Task.objects.create(
+                organization=self.organization,
+                owner=self.admin,
+                assignee=self.admin,
+                title="raced",
+            )
+            return built
+
+        with mock.patch("tasks.services.build_bulk_tasks", build_then_race):
+            data = self.bulk(
+                "post",
+                {
+                    "tasks": [
+                        {"title": "raced", "priority": "LOW"},
+                        {"title": "not raced", "priority": "LOW"},
+                    ]
+                },
+            )
+
+        self.assertEqual(self.statuses(data), ["error", "success"])
+        self.assertIn("title", data["results"][0]["errors"])
+        self.assertEqual(Task.objects.filter(title="raced").count(), 1)
+
+    def test_update_partial_failure(self):
+        data = self.bulk(
+            "patch",
+            {
+                "tasks": [
+                    {"id": str(self.tasks[0].id), "status": "COMPLETED"},
+                    {"id": str(self.tasks[0].id), "status": "IN_PROGRESS"},
+                    {"id": str(uuid.uuid4()), "status": "COMPLETED"},
+                    {"id": "not a uuid"},
+                ]
+            },
+        )
+
+        self.assertEqual(self.statuses(data), ["success", "error", "error", "error"])
+        self.assertEqual(Task.objects.get(id=self.tasks[0].id).status, "COMPLETED")
+
+    def test_delete_reports_duplicates(self):
+        task_id = str(self.tasks[0].id)
+        data = self.bulk("delete", {"ids": [task_id, task_id, str(uuid.uuid4())]})
+
+        self.assertEqual(self.statuses(data), ["success", "error", "error"])
+        self.assertEqual(
+            data["results"][1]["errors"],
+            {"id": ["Task appears more than once in the batch."]},
+        )
+        self.assertEqual(data["results"][2]["errors"], {"id": ["Task not found."]})
+
+
+class TaskBulkLockTests(TaskFixturesMixin, APITransactionTestCase):
+    """
+    Bulk updates lock their rows, a concurrent writer holding one makes the
+    batch wait and the batch then works on the committed values.
+    """
+
+    def setUp(self):
+        self.setUpTestData()
+        super().setUp()
+
+    def test_update_waits_for_row_lock(self):
+        results = {}
+
+        def bulk_update():
+            try:
+                client = APIClient()
+                client.force_authenticate(self.admin)
+                results["response"] = client.patch(
+                    "/api/v1/tasks/bulk/",
+                    {"tasks": [{"id": str(self.task.id), "priority": "HIGH"}]},
+                    format="json",
+                )
+            finally:
+                connections.close_all()
+
+        thread = threading.Thread(target=bulk_update)
+
+        with transaction.atomic():
+            Task.objects.select_for_update().get(id=self.task.id)
+            thread.start()
+            thread.join(timeout=1)
+            self.assertTrue(thread.is_alive())
+
+            Task.objects.filter(id=self.task.id).update(status="COMPLETED")
+
+        thread.join(timeout=10)
+        self.assertFalse(thread.is_alive())
+
+        result = results["response"].data["data"]["results"][0]
+        self.assertEqual(result["status"], "success")
+        self.assertEqual(result["data"]["status"], "COMPLETED")
+        self.assertEqual(result["data"]["priority"], "HIGH")
+
+
+class TaskListCacheTests(TaskFixturesMixin, APITestCase):
+    """
+    Cached task list pages are served without queries until a write bumps
+    the generation of a scope they belong to.
+    """
+
+    path = "/api/v1/tasks/"
+
+    def assert_cached(self):
+        assert_endpoint_queries(self.client, "get", self.path, 0)
+
+    def assert_rebuilt(self):
+        return assert_endpoint_queries(self.client, "get", self.path, 2)
+
+    def rename(self, user, first_name):
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.patch(
+                f"/api/v1/users/{user.id}/", {"first_name": first_name}, format="json"
+            )
+        self.assertEqual(response.status_code, 200, response.data)
+
+    def test_page_is_cached(self):
+        self.assert_rebuilt()
+        self.assert_cached()
+
+    def test_task_update_rebuilds_page(self):
+        self.assert_rebuilt()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.patch(
+                f"/api/v1/tasks/{self.task.id}/", {"status": "COMPLETED"}, format="json"
+            )
+
+        response = self.assert_rebuilt()
+        statuses = {row["id"]: row["status"] for row in response.data["data"]}
+        self.assertEqual(statuses[str(self.task.id)], "COMPLETED")
+
+    def test_other_assignee_keeps_page(self):
+        member = self.members[1]
+        self.client.force_authenticate(member)
+        self.assert_rebuilt()
+
+        self.client.force_authenticate(self.admin)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.patch(
+                f"/api/v1/tasks/{self.task.id}/", {"status": "COMPLETED"}, format="json"
+            )
+
+        # the task is assigned to another member, their page stays valid
+        self.client.force_authenticate(member)
+        self.assert_cached()
+
+    def test_user_rename_rebuilds_page(self):
+        self.assert_rebuilt()
+
+        self.rename(self.members[0], "Renamed")
+
+        response = self.assert_rebuilt()
+        names = {
+            row["assignee"]["first_name"]
+            for row in response.data["data"]
+            if row["assignee"]["id"] == str(self.members[0].id)
+        }
+        self.assertEqual(names, {"Renamed"})
+
+    def test_user_rename_rebuilds_pages_of_other_organizations(self):
+        # assigned across organizations before assignees were restricted
+        other = Organization.objects.create(name="Globex")
+        other_admin = User.objects.create_user(
+            username="other_admin",
+            email="other_admin@example.com",
+            password="password",
+            organization=other,
+            role=UserRoleChoices.TENANT_ADMIN,
+        )
+        Task.objects.create(
+            organization=other,
+            owner=other_admin,
+            assignee=self.members[0],
+            title="legacy task",
+        )
+
+        self.client.force_authenticate(other_admin)
+        self.assert_rebuilt()
+
+        self.client.force_authenticate(self.admin)
+        self.rename(self.members[0], "Renamed")
+
+        self.client.force_authenticate(other_admin)
+        response = self.assert_rebuilt()
+        self.assertEqual(response.data["data"][0]["assignee"]["first_name"], "Renamed")
+
+
+@override_settings(TASK_STATS_ROLLUP_ENABLED=True)
+class TaskStatsRollupTests(TaskFixturesMixin, APITestCase):
+    """
+    The rollup kept up to date by the write paths matches the live
+    aggregate of the tasks for every user.
+    """
+
+    def setUp(self):
+        super().setUp()
+        rebuild_task_stats()
+
+    def normalized(self, stats):
+        # workloads of equal size come in any order
+        return {
+            **stats,
+            "by_assignee": sorted(
+                stats["by_assignee"], key=lambda workload: str(workload["assignee_id"])
+            ),
+        }
+
+    def assert_rollup_matches(self):
+        for user in [self.admin, *self.members]:
+            self.assertEqual(
+                self.normalized(rollup_task_stats(user)),
+                self.normalized(compute_task_stats(get_visible_tasks(user))),
+            )
+
+    def request(self, method, path, data):
+        response = getattr(self.client, method)(path, data, format="json")
+        self.assertLess(response.status_code, 300, response.data)
+
+    def test_rebuild(self):
+        self.assert_rollup_matches()
+
+    def test_task_writes(self):
+        self.request(
+            "post",
+            "/api/v1/tasks/",
+            {
+                "title": "new task",
+                "priority": "HIGH",
+                "assignee_id": str(self.members[1].id),
+            },
+        )
+        self.request("patch", f"/api/v1/tasks/{self.task.id}/", {"status": "COMPLETED"})
+        self.request(
+            "patch",
+            "/api/v1/tasks/bulk/",
+            {
+                "tasks": [
+                    {"id": str(task.id), "priority": "LOW"} for task in self.tasks[1:4]
+                ]
+            },
+        )
+        self.request(
+            "delete", "/api/v1/tasks/bulk/", {"ids": [str(self.tasks[4].id)]}
+        )
+
+        self.assert_rollup_matches()
+
+    def test_stale_copies(self):
+        first = Task.objects.get(id=self.task.id)
+        second = Task.objects.get(id=self.task.id)
+
+        update_task(first, user=self.admin, status="IN_PROGRESS")
+        # loaded before the first update committed
+        update_task(second, user=self.admin, status="COMPLETED")
+
+        self.assert_rollup_matches()
+
+    def test_user_cascade(self):
+        soft_delete_user(self.members[0])
+        self.assert_rollup_matches()
+
+        restore_user(self.members[0])
+        self.assert_rollup_matches()
+
+
+class TaskImportTests(TaskFixturesMixin, APITestCase):
+    """
+    Imports load valid rows with COPY and report rejected rows by line,
+    titles taken concurrently included.
+    """
+
+    csv = (
+        "title,priority,assignee_id\n"
+        "imported 1,LOW,\n"
+        "imported 2,URGENT,\n"
+        "MEMBER0 task 0,LOW,{member}\n"
+        "Imported 1,HIGH,\n"
+        "imported 3,HIGH,{member}\n"
+    )
+
+    def upload(self, content, name="tasks.csv"):
+        response = self.client.post(
+            "/api/v1/tasks/import/",
+            {"file": SimpleUploadedFile(name, content.encode())},
+            format="multipart",
+        )
+        self.assertEqual(response.status_code, 200, response.data)
+        return response.data["data"]
+
+    def test_csv(self):
+        report = self.upload(self.csv.format(member=self.members[0].id))
+
+        self.assertEqual(report["imported"], 2)
+        self.assertEqual([error["line"] for error in report["errors"]], [3, 4, 5])
+        self.assertIn("priority", report["errors"][0]["errors"])
+        self.assertIn("title", report["errors"][1]["errors"])
+        self.assertIn("title", report["errors"][2]["errors"])
+        self.assertTrue(
+            Task.objects.filter(
+                title="imported 3", assignee=self.members[0], owner=self.admin
+            ).exists()
+        )
+
+    def test_ndjson(self):
+        report = self.upload(
+            '{"title": "imported", "priority": "LOW"}\n'
+            "not json\n"
+            "\n"
+            '["not", "an", "object"]\n',
+            name="tasks.ndjson",
+        )
+
+        self.assertEqual(report["imported"], 1)
+        self.assertEqual([error["line"] for error in report["errors"]], [2, 4])
+
+    def test_title_taken_concurrently(self):
+        build_bulk_tasks = importer.build_bulk_tasks
+
+        def build_then_race(items, *, user):
+            built = build_bulk_tasks(items, user=user)
+            Task.objects.create(
+                organization=self.organization,
+                owner=self.admin,
+                assignee=self.admin,
+                title="raced",
+            )
+            return built
+
+        with mock.patch("tasks.importer.build_bulk_tasks", build_then_race):
+            report = self.upload("title,priority\nraced,LOW\nnot raced,LOW\n")
+
+        self.assertEqual(report["imported"], 1)
+        self.assertEqual(report["errors"][0]["line"], 2)
+        self.assertIn("title", report["errors"][0]["errors"])
+        self.assertEqual(Task.objects.filter(title="raced").count(), 1)
+
+    def test_batches(self):
+        rows = [
+            (line, {"title": f"imported {line}", "priority": "LOW"})
+            for line in range(2, 7)
+        ]
+
+        report = importer.import_tasks(rows, user=self.admin, batch_size=2)
+
+        self.assertEqual(report["imported"], 5)
+        self.assertEqual(
+            Task.objects.filter(title__startswith="imported ").count(), 5
+        )
@@ -1,9 +1,15 @@
 from django.urls import path
-from tasks.views import  TaskListCreateAPIView , TaskDetailUpdateDeleteAPIView , TaskHistoryListAPIView , TaskCommentListCreateAPIView , TaskCommentDetailUpdateDeleteAPIView
+from tasks.views import  TaskListCreateAPIView , TaskDetailUpdateDeleteAPIView , TaskHistoryListAPIView , TaskCommentListCreateAPIView , TaskCommentDetailUpdateDeleteAPIView , TaskBulkAPIView , TaskSyncAPIView , TaskAutocompleteAPIView , TaskStatsAPIView , TaskExportAPIView , TaskImportAPIView
 
 urlpatterns = [
     # path("tasks/", TaskCreateAPIView.as_view()),
     path("tasks/", TaskListCreateAPIView.as_view()),
+    path("tasks/bulk/", TaskBulkAPIView.as_view()),
+    path("tasks/sync/", TaskSyncAPIView.as_view()),
+    path("tasks/autocomplete/", TaskAutocompleteAPIView.as_view()),
+    path("tasks/stats/", TaskStatsAPIView.as_view()),
+    path("tasks/export/", TaskExportAPIView.as_view()),
+    path("tasks/import/", TaskImportAPIView.as_view()),
     path("tasks/<uuid:id>/", TaskDetailUpdateDeleteAPIView.as_view()),
 
     path("tasks/<uuid:task_id>/history/", TaskHistoryListAPIView.as_view()),
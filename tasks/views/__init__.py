@@ -1,3 +1,10 @@
 from .task import *
 from .history import *
 from .comment import *
+from .bulk import *
+from .sync import *
+from .autocomplete import *
+from .stats import *
+from .export import *
+from .importer import *
+from .async_read import *
@@ -0,0 +1,183 @@
+from django.db.models import Count, Max
+from django.http import Http404
+
+from core.async_views import AsyncAPIView
+from core.pagination import DefaultPagination, get_paginator
+from core.permissions import CanViewTask, CanViewOrCreateComment, CanViewTaskHistory
+from core.conditional import make_etag
+from tasks.models import Task, Comment, TaskHistory
+from tasks.search import search_tasks
+from tasks.services import get_visible_tasks, filter_tasks
+from tasks.cache import (
+    aget_task_acl_or_404,
+    atask_list_cache_key,
+    aget_cached_task_list,
+    aset_cached_task_list,
+)
+from tasks.serializers.task import TaskDetailSerializer, TaskListSerializer
+from tasks.views.task import TASK_VALIDATOR_FIELDS, get_task_validators
+from tasks.views.comment import COMMENT_LIST_VERSION, get_comment_list_validators
+from tasks.views.history import get_task_history
+from tasks.serializers.comment import CommentDetailSerializer
+from tasks.serializers.history import TaskHistorySerializer
+
+
+# Read paths of the task API served natively under ASGI. Each view mirrors its
+# synchronous counterpart, response bodies, validators and cache entries are
+# the same, only the queries go through the async ORM so a worker is not
+# blocked while they run.
+
+
+class AsyncTaskListAPIView(AsyncAPIView):
+
+    async def get(self, request):
+        user = request.user
+
+        cache_key = await atask_list_cache_key(request)
+        cached_response = await aget_cached_task_list(cache_key)
+        if cached_response is not None:
+            return self.respond(cached_response)
+
+        queryset = get_visible_tasks(user)
+        queryset = filter_tasks(queryset, request.query_params)
+
+        search = request.query_params.get("q")
+
+        if search:
+            # ranked results, keyset pagination only applies to created_at order
+            queryset = search_tasks(queryset, search)
+            paginator = DefaultPagination()
+        else:
+            queryset = queryset.order_by("-created_at", "-id")
+            paginator = get_paginator(request)
+
+        queryset = TaskListSerializer.setup_eager_loading(queryset)
+
+        page = await paginator.apaginate_queryset(queryset, request)
+
+        serializer = TaskListSerializer(page, many=True)
+
+        response_data = {
+            "status": "success",
+            "message": "Tasks retrieved successfully",
+            "data": serializer.data,
+        }
+
+        response_data.update(paginator.get_root_pagination_data())
+        await aset_cached_task_list(cache_key, response_data)
+
+        return self.respond(response_data)
+
+
+class AsyncTaskDetailAPIView(AsyncAPIView):
+    permission_classes = AsyncAPIView.permission_classes + [CanViewTask]
+
+    async def get(self, request, id):
+        self.check_object_permissions(request, await aget_task_acl_or_404(id))
+
+        # validators come from a timestamps only read, the full task and its
+        # users are only loaded when the client copy is outdated
+        queryset = Task.objects.filter(id=id, deleted_at__isnull=True)
+        stamps = await queryset.values_list(*TASK_VALIDATOR_FIELDS).afirst()
+        if stamps is None:
+            raise Http404
+
+        not_modified = self.not_modified(*get_task_validators(id, stamps))
+        if not_modified is not None:
+            return not_modified
+
+        task = await TaskDetailSerializer.setup_eager_loading(queryset).afirst()
+        if task is None:
+            raise Http404
+
+        etag, last_modified = get_task_validators(task.id, (task.updated_at, *stamps[1:]))
+
+        return self.respond(
+            {
+                "status": "success",
+                "message": "Task retrieved successfully",
+                "data": TaskDetailSerializer(task).data,
+            },
+            etag=etag,
+            last_modified=last_modified,
+        )
+
+
+class AsyncTaskCommentListAPIView(AsyncAPIView):
+    permission_classes = AsyncAPIView.permission_classes + [CanViewOrCreateComment]
+
+    async def get(self, request, task_id):
+        task = await aget_task_acl_or_404(task_id)
+
+        #  object-level permission
+        self.check_object_permissions(request, task)
+
+        comments = Comment.objects.filter(
+            organization_id=task.organization_id,
+            task_id=task.id,
+        )
+
+        version = await comments.aaggregate(**COMMENT_LIST_VERSION)
+        queryset = comments.filter(deleted_at__isnull=True)
+        etag, last_modified = get_comment_list_validators(request, version)
+
+        not_modified = self.not_modified(etag, last_modified)
+        if not_modified is not None:
+            return not_modified
+
+        queryset = queryset.order_by("-created_at", "-id")
+        queryset = CommentDetailSerializer.setup_eager_loading(queryset)
+
+        paginator = get_paginator(request)
+        page = await paginator.apaginate_queryset(queryset, request)
+
+        response_data = {
+            "status": "success",
+            "message": "Comments retrieved successfully",
+            "data": CommentDetailSerializer(page, many=True).data,
+        }
+        response_data.update(paginator.get_root_pagination_data())
+
+        return self.respond(response_data, etag=etag, last_modified=last_modified)
+
+
+class AsyncTaskHistoryListAPIView(AsyncAPIView):
+    permission_classes = AsyncAPIView.permission_classes + [CanViewTaskHistory]
+
+    async def get(self, request, task_id):
+        task = await aget_task_acl_or_404(task_id)
+
+        # object-level permission
+        self.check_object_permissions(request, task)
+
+        queryset = get_task_history(task, request.query_params)
+
+        # history is append only, count and newest row identify its version
+        version = await queryset.aaggregate(
+            count=Count("id"), last_created=Max("created_at")
+        )
+        last_modified = version["last_created"]
+        etag = make_etag(
+            request.get_full_path(),
+            version["count"],
+            last_modified.isoformat() if last_modified else None,
+        )
+
+        not_modified = self.not_modified(etag, last_modified)
+        if not_modified is not None:
+            return not_modified
+
+        queryset = queryset.order_by("-created_at", "-id")
+        queryset = TaskHistorySerializer.setup_eager_loading(queryset)
+
+        paginator = get_paginator(request)
+        page = await paginator.apaginate_queryset(queryset, request)
+
+        response_data = {
+            "status": "success",
+            "message": "Task history retrieved successfully",
+            "data": TaskHistorySerializer(page, many=True).data,
+        }
+        response_data.update(paginator.get_root_pagination_data())
+
+        return self.respond(response_data, etag=etag, last_modified=last_modified)
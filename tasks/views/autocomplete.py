@@ -0,0 +1,30 @@
+from rest_framework.views import APIView
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework import status
+
+from core.serializers import AutocompleteQuerySerializer
+from tasks.search import autocomplete_tasks
+from tasks.services import get_visible_tasks
+
+
+class TaskAutocompleteAPIView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        serializer = AutocompleteQuerySerializer(data=request.query_params)
+        serializer.is_valid(raise_exception=True)
+
+        results = autocomplete_tasks(
+            get_visible_tasks(request.user),
+            serializer.validated_data["q"],
+        )
+
+        return Response(
+            {
+                "status": "success",
+                "message": "Task suggestions retrieved successfully",
+                "data": list(results),
+            },
+            status=status.HTTP_200_OK,
+        )
@@ -0,0 +1,207 @@
+import uuid
+
+from django.db import transaction
+from rest_framework.views import APIView
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework import status
+
+from core.permissions import CanUpdateTask, CanDeleteTask
+from tasks.models import Task
+from tasks.services import bulk_create_tasks, bulk_update_tasks, bulk_delete_tasks
+from tasks.serializers.task import TaskDetailSerializer
+from tasks.serializers.bulk import (
+    TaskBulkSerializer,
+    TaskBulkDeleteSerializer,
+    TaskBulkCreateItemSerializer,
+    TaskBulkUpdateItemSerializer,
+)
+
+
+TASK_NOT_FOUND = {"id": ["Task not found."]}
+TASK_DUPLICATED = {"id": ["Task appears more than once in the batch."]}
+TASK_PERMISSION_DENIED = {
+    "non_field_errors": ["You do not have permission to perform this action."]
+}
+
+
+class TaskBulkAPIView(APIView):
+    """
+    Create, update or delete many tasks in one request.
+
+    Every item is validated on its own and reported in `data.results` by its
+    position in the request, valid items are written even when others fail.
+    """
+
+    permission_classes = [IsAuthenticated]
+
+    def build_response(self, message, results):
+        failed = sum(1 for result in results if result["status"] == "error")
+
+        return Response(
+            {
+                "status": "success",
+                "message": message,
+                "data": {
+                    "results": results,
+                    "succeeded": len(results) - failed,
+                    "failed": failed,
+                },
+            },
+            status=status.HTTP_200_OK,
+        )
+
+    def success(self, index, task):
+        return {
+            "index": index,
+            "status": "success",
+            "data": TaskDetailSerializer(task).data,
+        }
+
+    def error(self, index, errors):
+        return {"index": index, "status": "error", "errors": errors}
+
+    def get_tasks(self, ids, for_update=False):
+        queryset = TaskDetailSerializer.setup_eager_loading(
+            Task.objects.filter(
+                organization_id=self.request.user.organization_id,
+                id__in=ids,
+                deleted_at__isnull=True,
+            )
+        )
+        if for_update:
+            # locked in id order, concurrent batches overlapping on some
+            # tasks wait for each other instead of deadlocking
+            queryset = queryset.select_for_update(of=("self",)).order_by("id")
+
+        return {task.id: task for task in queryset}
+
+    def post(self, request):
+        serializer = TaskBulkSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        items = serializer.validated_data["tasks"]
+
+        valid = {}
+        errors = {}
+
+        for index, item in enumerate(items):
+            item_serializer = TaskBulkCreateItemSerializer(
+                data=item,
+                context={"request": request},
+            )
+            if item_serializer.is_valid():
+                valid[index] = item_serializer.validated_data
+            else:
+                errors[index] = item_serializer.errors
+
+        created, failed = bulk_create_tasks(valid, user=request.user)
+        errors.update(failed)
+
+        results = [
+            self.success(index, created[index])
+            if index in created
+            else self.error(index, errors[index])
+            for index in range(len(items))
+        ]
+
+        return self.build_response("Bulk task creation processed", results)
+
+    def patch(self, request):
+        serializer = TaskBulkSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        items = serializer.validated_data["tasks"]
+
+        ids = {}
+        seen = set()
+        errors = {}
+
+        for index, item in enumerate(items):
+            try:
+                task_id = uuid.UUID(str(item.get("id")))
+            except ValueError:
+                errors[index] = {"id": ["Must be a valid UUID."]}
+                continue
+
+            if task_id in seen:
+                errors[index] = TASK_DUPLICATED
+                continue
+
+            seen.add(task_id)
+            ids[index] = task_id
+
+        # the rows stay locked from the permission and validation checks
+        # until the update, a concurrent write cannot slip in between
+        with transaction.atomic():
+            tasks = self.get_tasks(seen, for_update=True)
+            permission = CanUpdateTask()
+            changes = {}
+
+            for index, task_id in ids.items():
+                task = tasks.get(task_id)
+
+                if task is None:
+                    errors[index] = TASK_NOT_FOUND
+                    continue
+
+                if not permission.has_object_permission(request, self, task):
+                    errors[index] = TASK_PERMISSION_DENIED
+                    continue
+
+                item_serializer = TaskBulkUpdateItemSerializer(
+                    task,
+                    data=items[index],
+                    partial=True,
+                    context={"request": request},
+                )
+                if not item_serializer.is_valid():
+                    errors[index] = item_serializer.errors
+                    continue
+
+                validated_data = dict(item_serializer.validated_data)
+                validated_data.pop("id")
+                changes[index] = (task, validated_data)
+
+            bulk_update_tasks(list(changes.values()), user=request.user)
+
+        results = [
+            self.success(index, changes[index][0])
+            if index in changes
+            else self.error(index, errors[index])
+            for index in range(len(items))
+        ]
+
+        return self.build_response("Bulk task update processed", results)
+
+    def delete(self, request):
+        serializer = TaskBulkDeleteSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        ids = serializer.validated_data["ids"]
+
+        tasks = self.get_tasks(ids)
+        permission = CanDeleteTask()
+        seen = set()
+        deleted = []
+        results = []
+
+        for index, task_id in enumerate(ids):
+            task = tasks.get(task_id)
+
+            if task_id in seen:
+                results.append(self.error(index, TASK_DUPLICATED))
+                continue
+
+            seen.add(task_id)
+
+            if task is None:
+                results.append(self.error(index, TASK_NOT_FOUND))
+            elif not permission.has_object_permission(request, self, task):
+                results.append(self.error(index, TASK_PERMISSION_DENIED))
+            else:
+                deleted.append(task)
+                results.append(
+                    {"index": index, "status": "success", "data": {"id": task.id}}
+                )
+
+        bulk_delete_tasks(deleted)
+
+        return self.build_response("Bulk task deletion processed", results)
@@ -5,35 +5,80 @@ from rest_framework import status
 from django.shortcuts import get_object_or_404
 from rest_framework.exceptions import PermissionDenied
 from django.utils import timezone
+from django.db.models import Count, Max, Q
+from django.db.models.functions import Greatest
 from rest_framework.exceptions import PermissionDenied
 
 
 
 from tasks.models import Task, Comment
+from tasks.cache import get_task_acl, get_task_acl_or_404
+from tasks.search import refresh_task_search_vectors
 from tasks.serializers.comment import (
     CommentCreateUpdateSerializer,
     CommentDetailSerializer
 )
 from core.permissions import CanViewOrCreateComment , CanViewOrCreateComment, CanUpdateComment, CanDeleteComment
-from core.pagination import DefaultPagination
+from core.pagination import get_paginator
+from core.conditional import make_etag, set_validators, not_modified_response
 from core.choices import UserRoleChoices
 
 
+# live comment count and newest change of any comment, deleted ones
+# included, identify the list version: deleting the newest comment still
+# moves Last-Modified forward. The comments embed their authors, renaming
+# one changes the list too.
+COMMENT_LIST_VERSION = {
+    "count": Count("id", filter=Q(deleted_at__isnull=True)),
+    "comments_modified": Max(Greatest("created_at", "updated_at", "deleted_at")),
+    "users_modified": Max("user__updated_at", filter=Q(deleted_at__isnull=True)),
+}
+
+
+def get_comment_list_validators(request, version):
+    """
+    ETag and Last-Modified of a comment list from its COMMENT_LIST_VERSION
+    aggregate.
+    """
+    stamps = [
+        stamp
+        for stamp in (version["comments_modified"], version["users_modified"])
+        if stamp is not None
+    ]
+    etag = make_etag(
+        request.get_full_path(),
+        version["count"],
+        *[stamp.isoformat() for stamp in stamps],
+    )
+    return etag, max(stamps, default=None)
+
+
 class TaskCommentListCreateAPIView(APIView):
     permission_classes = [IsAuthenticated, CanViewOrCreateComment]
 
     def get(self, request, task_id):
-        task = get_object_or_404(Task, id=task_id, deleted_at__isnull=True)
+        task = get_task_acl_or_404(task_id)
 
         #  object-level permission
         self.check_object_permissions(request, task)
 
-        queryset = Comment.objects.filter(
-            task=task,
-            deleted_at__isnull=True
+        comments = Comment.objects.filter(
+            organization_id=task.organization_id,
+            task_id=task.id,
         )
 
-        paginator = DefaultPagination()
+        version = comments.aggregate(**COMMENT_LIST_VERSION)
+        queryset = comments.filter(deleted_at__isnull=True)
+        etag, last_modified = get_comment_list_validators(request, version)
+
+        not_modified = not_modified_response(request, etag, last_modified)
+        if not_modified is not None:
+            return not_modified
+
+        queryset = queryset.order_by("-created_at", "-id")
+        queryset = CommentDetailSerializer.setup_eager_loading(queryset)
+
+        paginator = get_paginator(request)
         page = paginator.paginate_queryset(queryset, request)
 
         if page is not None:
@@ -44,19 +89,20 @@ class TaskCommentListCreateAPIView(APIView):
                 "data": serializer.data,
             }
             response.update(paginator.get_root_pagination_data())
-            return Response(response)
+            return set_validators(Response(response), etag, last_modified)
 
         serializer = CommentDetailSerializer(queryset, many=True)
-        return Response(
+        response = Response(
             {
                 "status": "success",
                 "message": "Comments retrieved successfully",
                 "data": serializer.data,
             }
         )
+        return set_validators(response, etag, last_modified)
 
     def post(self, request, task_id):
-        task = get_object_or_404(Task, id=task_id, deleted_at__isnull=True)
+        task = get_task_acl_or_404(task_id)
 
         #  object-level permission
         self.check_object_permissions(request, task)
@@ -83,11 +129,12 @@ class TaskCommentDetailUpdateDeleteAPIView(APIView):
     permission_classes = [IsAuthenticated]
 
     def get_object(self, request, task_id, comment_id):
-        task = get_object_or_404(Task, id=task_id, deleted_at__isnull=True)
+        task = get_task_acl_or_404(task_id)
         comment = get_object_or_404(
-            Comment,
+            CommentDetailSerializer.setup_eager_loading(Comment.objects.all()),
             id=comment_id,
-            task=task,
+            organization_id=task.organization_id,
+            task_id=task.id,
             deleted_at__isnull=True
         )
         return comment
@@ -96,7 +143,7 @@ class TaskCommentDetailUpdateDeleteAPIView(APIView):
         comment = self.get_object(request, task_id, comment_id)
 
         self.permission_classes = [IsAuthenticated, CanViewOrCreateComment]
-        self.check_object_permissions(request, comment.task)
+        self.check_object_permissions(request, get_task_acl(comment.task_id))
 
         return Response(
             {
@@ -116,12 +163,13 @@ class TaskCommentDetailUpdateDeleteAPIView(APIView):
             comment,
             data=request.data,
             partial=True,
-            context={"request": request, "task": comment.task}
+            context={"request": request, "task": get_task_acl(comment.task_id)}
         )
         serializer.is_valid(raise_exception=True)
 
         comment.message = serializer.validated_data["message"]
-        comment.save(update_fields=["message"])
+        comment.save(update_fields=["message", "updated_at"])
+        refresh_task_search_vectors([comment.task_id])
 
         return Response(
             {
@@ -139,6 +187,7 @@ class TaskCommentDetailUpdateDeleteAPIView(APIView):
 
         comment.deleted_at = timezone.now()
         comment.save(update_fields=["deleted_at"])
+        refresh_task_search_vectors([comment.task_id])
 
         return Response(
             {
@@ -0,0 +1,43 @@
+from django.http import StreamingHttpResponse
+from django.utils import timezone
+from rest_framework.views import APIView
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.exceptions import ValidationError
+
+from tasks.export import EXPORT_FORMATS
+from tasks.search import search_tasks
+from tasks.services import get_visible_tasks, filter_tasks
+
+
+class TaskExportAPIView(APIView):
+    """
+    Stream every visible task as CSV or NDJSON.
+
+    Takes the task list filters (owner_id, assignee_id, status, priority, q)
+    and `file_format`, `format` being taken by DRF content negotiation.
+    """
+
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        file_format = request.query_params.get("file_format", "csv")
+        if file_format not in EXPORT_FORMATS:
+            raise ValidationError(
+                {"file_format": [f"Must be one of: {', '.join(EXPORT_FORMATS)}."]}
+            )
+
+        queryset = get_visible_tasks(request.user)
+        queryset = filter_tasks(queryset, request.query_params)
+
+        search = request.query_params.get("q")
+        if search:
+            queryset = search_tasks(queryset, search)
+        else:
+            queryset = queryset.order_by("-created_at", "-id")
+
+        stream, content_type = EXPORT_FORMATS[file_format]
+        filename = f"tasks-{timezone.now():%Y%m%d%H%M%S}.{file_format}"
+
+        response = StreamingHttpResponse(stream(queryset), content_type=content_type)
+        response["Content-Disposition"] = f'attachment; filename="{filename}"'
+        return response
@@ -1,29 +1,90 @@
+import datetime
+
 from django.shortcuts import get_object_or_404
+from django.utils import timezone
 from rest_framework.views import APIView
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework import status
-from rest_framework.exceptions import PermissionDenied
+from rest_framework.exceptions import PermissionDenied, ValidationError
+from django.db.models import Count, Max
 
 from core.choices import UserRoleChoices
-from core.pagination import DefaultPagination
+from core.constants import history_list_months
+from core.pagination import get_paginator
 from tasks.models import Task, TaskHistory
+from tasks.cache import get_task_acl_or_404
 from tasks.serializers.history import TaskHistorySerializer
 from core.permissions import CanViewTaskHistory
+from core.conditional import make_etag, set_validators, not_modified_response
+from tasks.partitions import add_months, month_bound, month_start
+
+
+def get_history_window(params):
+    """
+    Months [start, end) a task history list covers.
+
+    `?month=YYYY-MM` lists that month, by default the list covers the current
+    month and the `history_list_months` before it. The bounds are on
+    created_at, the partition key of tasks_history, so the queries only
+    touch the partitions of those months however long the history grows.
+    """
+    month = params.get("month")
+
+    if not month:
+        current = month_start(timezone.now())
+        return add_months(current, -history_list_months), add_months(current, 1)
+
+    try:
+        start = datetime.datetime.strptime(month, "%Y-%m").date()
+    except ValueError:
+        raise ValidationError({"month": ["Expected a month as YYYY-MM."]})
+
+    return start, add_months(start, 1)
+
+
+def get_task_history(task, params):
+    """
+    History rows of a task within the requested window.
+    """
+    start, end = get_history_window(params)
+
+    return TaskHistory.objects.filter(
+        organization_id=task.organization_id,
+        task_id=task.id,
+        created_at__gte=month_bound(start),
+        created_at__lt=month_bound(end),
+    )
 
 
 class TaskHistoryListAPIView(APIView):
     permission_classes = [IsAuthenticated, CanViewTaskHistory]
 
     def get(self, request, task_id):
-        task = get_object_or_404(Task, id=task_id, deleted_at__isnull=True)
+        task = get_task_acl_or_404(task_id)
 
         # object-level permission
         self.check_object_permissions(request, task)
 
-        queryset = TaskHistory.objects.filter(task=task).order_by("-created_at")
+        queryset = get_task_history(task, request.query_params)
+
+        # history is append only, count and newest row identify its version
+        version = queryset.aggregate(count=Count("id"), last_created=Max("created_at"))
+        last_modified = version["last_created"]
+        etag = make_etag(
+            request.get_full_path(),
+            version["count"],
+            last_modified.isoformat() if last_modified else None,
+        )
+
+        not_modified = not_modified_response(request, etag, last_modified)
+        if not_modified is not None:
+            return not_modified
+
+        queryset = queryset.order_by("-created_at", "-id")
+        queryset = TaskHistorySerializer.setup_eager_loading(queryset)
 
-        paginator = DefaultPagination()
+        paginator = get_paginator(request)
         page = paginator.paginate_queryset(queryset, request)
 
         serializer = TaskHistorySerializer(page, many=True)
@@ -36,4 +97,5 @@ class TaskHistoryListAPIView(APIView):
 
         response_data.update(paginator.get_root_pagination_data())
 
-        return Response(response_data, status=status.HTTP_200_OK)
+        response = Response(response_data, status=status.HTTP_200_OK)
+        return set_validators(response, etag, last_modified)
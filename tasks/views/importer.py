@@ -0,0 +1,52 @@
+import codecs
+
+from rest_framework.views import APIView
+from rest_framework.parsers import MultiPartParser
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework import status
+from rest_framework.exceptions import ValidationError
+
+from core.permissions import IsAdmin
+from tasks.importer import IMPORT_FORMATS, import_tasks, read_rows
+
+
+class TaskImportAPIView(APIView):
+    """
+    Import tasks from an uploaded CSV or NDJSON `file`.
+
+    The file is read line by line, the response reports the imported count
+    and the errors of rejected rows by line number.
+    """
+
+    permission_classes = [IsAuthenticated, IsAdmin]
+    parser_classes = [MultiPartParser]
+
+    def post(self, request):
+        upload = request.FILES.get("file")
+        if upload is None:
+            raise ValidationError({"file": ["No file was submitted."]})
+
+        file_format = request.data.get("file_format") or (
+            upload.name.rsplit(".", 1)[-1].lower()
+        )
+        if file_format not in IMPORT_FORMATS:
+            raise ValidationError(
+                {"file_format": [f"Must be one of: {', '.join(IMPORT_FORMATS)}."]}
+            )
+
+        lines = codecs.iterdecode(upload, "utf-8-sig")
+
+        try:
+            report = import_tasks(read_rows(lines, file_format), user=request.user)
+        except UnicodeDecodeError:
+            raise ValidationError({"file": ["File must be UTF-8 encoded."]})
+
+        return Response(
+            {
+                "status": "success",
+                "message": "Task import processed",
+                "data": report,
+            },
+            status=status.HTTP_200_OK,
+        )
@@ -0,0 +1,35 @@
+from django.conf import settings
+from rest_framework.views import APIView
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework import status
+
+from tasks.services import get_visible_tasks
+from tasks.stats import compute_task_stats, rollup_task_stats
+
+
+class TaskStatsAPIView(APIView):
+    """
+    Task counts by status and priority, overdue counts and per-assignee
+    workload, scoped by the same role rules as the task list.
+
+    Counts come from the rollup table when TASK_STATS_ROLLUP_ENABLED is set,
+    otherwise from a single grouped query over the visible tasks.
+    """
+
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        if settings.TASK_STATS_ROLLUP_ENABLED:
+            stats = rollup_task_stats(request.user)
+        else:
+            stats = compute_task_stats(get_visible_tasks(request.user))
+
+        return Response(
+            {
+                "status": "success",
+                "message": "Task statistics retrieved successfully",
+                "data": stats,
+            },
+            status=status.HTTP_200_OK,
+        )
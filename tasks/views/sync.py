@@ -0,0 +1,118 @@
+import datetime
+import uuid
+
+from django.db.models import Q
+from django.db.models.functions import Greatest
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+from rest_framework.views import APIView
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework import status
+from rest_framework.exceptions import ValidationError
+
+from core.constants import sync_batch_size, sync_watermark_lag
+from core.pagination import encode_cursor, decode_cursor
+from tasks.services import get_visible_tasks
+from tasks.serializers.task import TaskDetailSerializer
+
+
+class TaskSyncAPIView(APIView):
+    """
+    Delta sync for offline clients.
+
+    Without `since` it returns the live tasks, with the `watermark` of a
+    previous response it returns only tasks created, updated or soft deleted
+    after it, deletions as tombstones. Changes are ordered by
+    (changed_at, id), so a client repeats the call with the new watermark
+    while `has_more` is true.
+
+    Timestamps are set before their transaction commits, a change committed
+    late can carry a time older than rows already returned. The last page's
+    watermark is held back by `sync_watermark_lag` so the next sync returns
+    the recent changes again instead of skipping late commits, clients apply
+    changes by id so repeats are harmless.
+    """
+
+    permission_classes = [IsAuthenticated]
+
+    def decode_watermark(self, value):
+        payload = decode_cursor(value)
+
+        try:
+            changed_at = parse_datetime(payload["c"])
+            pk = uuid.UUID(payload["i"])
+        except (KeyError, TypeError, ValueError):
+            changed_at = None
+
+        if changed_at is None:
+            raise ValidationError({"since": ["Invalid watermark."]})
+
+        return changed_at, pk
+
+    def encode_watermark(self, changed_at, pk):
+        return encode_cursor({"c": changed_at.isoformat(), "i": str(pk)})
+
+    def get(self, request):
+        since = request.query_params.get("since")
+        started_at = timezone.now()
+
+        queryset = get_visible_tasks(request.user, include_deleted=True)
+
+        if since:
+            changed_at, pk = self.decode_watermark(since)
+            # plain column filters first so the (assignee, updated_at) and
+            # (assignee, deleted_at) indexes can narrow the scan
+            queryset = queryset.filter(
+                Q(updated_at__gte=changed_at) | Q(deleted_at__gte=changed_at)
+            )
+        else:
+            queryset = queryset.filter(deleted_at__isnull=True)
+
+        queryset = queryset.annotate(
+            changed_at=Greatest("updated_at", "deleted_at")
+        )
+
+        if since:
+            queryset = queryset.filter(
+                Q(changed_at__gt=changed_at) | Q(changed_at=changed_at, id__gt=pk)
+            )
+
+        queryset = queryset.order_by("changed_at", "id")
+        queryset = TaskDetailSerializer.setup_eager_loading(queryset)
+
+        rows = list(queryset[: sync_batch_size + 1])
+        has_more = len(rows) > sync_batch_size
+        rows = rows[:sync_batch_size]
+
+        safe_until = started_at - datetime.timedelta(seconds=sync_watermark_lag)
+
+        if rows and (has_more or rows[-1].changed_at <= safe_until):
+            # intermediate pages keep their position, the held back
+            # watermark of the last page covers them again
+            watermark = self.encode_watermark(rows[-1].changed_at, rows[-1].id)
+        elif since and changed_at <= safe_until:
+            watermark = since
+        else:
+            watermark = self.encode_watermark(safe_until, uuid.UUID(int=0))
+
+        changed = [task for task in rows if task.deleted_at is None]
+        deleted = [
+            {"id": task.id, "deleted_at": task.deleted_at}
+            for task in rows
+            if task.deleted_at is not None
+        ]
+
+        return Response(
+            {
+                "status": "success",
+                "message": "Tasks synchronized successfully",
+                "data": {
+                    "changed": TaskDetailSerializer(changed, many=True).data,
+                    "deleted": deleted,
+                    "watermark": watermark,
+                    "has_more": has_more,
+                },
+            },
+            status=status.HTTP_200_OK,
+        )
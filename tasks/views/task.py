@@ -6,12 +6,21 @@ from rest_framework.response import Response
 from rest_framework import status
 from rest_framework.exceptions import PermissionDenied
 from django.utils import timezone
+from django.db import transaction
 
 from core.choices import UserRoleChoices
-from core.pagination import DefaultPagination
+from core.pagination import DefaultPagination, get_paginator
 from core.permissions import CanViewTask, CanUpdateTask, CanDeleteTask
-from tasks.services import update_task
+from core.conditional import make_etag, set_validators, not_modified_response, check_if_match
+from tasks.services import update_task, delete_task, get_visible_tasks, filter_tasks
 from tasks.models import Task
+from tasks.search import search_tasks
+from tasks.cache import (
+    get_task_acl_or_404,
+    task_list_cache_key,
+    get_cached_task_list,
+    set_cached_task_list,
+)
 from tasks.serializers.task import (
     TaskCreateSerializer,
     TaskDetailSerializer,
@@ -21,6 +30,16 @@ from tasks.serializers.task import (
 
 User = get_user_model()
 
+# the detail embeds the owner and assignee, their changes change it too
+TASK_VALIDATOR_FIELDS = ("updated_at", "owner__updated_at", "assignee__updated_at")
+
+
+def get_task_validators(task_id, stamps):
+    """
+    ETag and Last-Modified of a task detail from its TASK_VALIDATOR_FIELDS.
+    """
+    return make_etag(task_id, *[stamp.isoformat() for stamp in stamps]), max(stamps)
+
 
 class TaskListCreateAPIView(APIView):
     permission_classes = [IsAuthenticated]
@@ -47,37 +66,27 @@ class TaskListCreateAPIView(APIView):
 
     def get(self, request):
         user = request.user
-        
-        if user.role == UserRoleChoices.ADMIN:
-            queryset = Task.objects.filter(deleted_at__isnull = True)
 
-        else:
-            queryset = Task.objects.filter(
-                assignee=user,
-                deleted_at__isnull=True
-            )
-    
+        cache_key = task_list_cache_key(request)
+        cached_response = get_cached_task_list(cache_key)
+        if cached_response is not None:
+            return Response(cached_response, status=status.HTTP_200_OK)
 
-        owner_id = request.query_params.get("owner_id")
-        assignee_id = request.query_params.get("assignee_id")
-        status_param = request.query_params.get("status")
-        priority_param = request.query_params.get("priority")
+        queryset = get_visible_tasks(user)
+        queryset = filter_tasks(queryset, request.query_params)
 
-        if owner_id:
-            queryset = queryset.filter(owner_id=owner_id)
+        search = request.query_params.get("q")
 
-        if assignee_id:
-            queryset = queryset.filter(assignee_id=assignee_id)
-
-        if status_param:
-            queryset = queryset.filter(status=status_param)
-
-        if priority_param:
-            queryset = queryset.filter(priority=priority_param)
+        if search:
+            # ranked results, keyset pagination only applies to created_at order
+            queryset = search_tasks(queryset, search)
+            paginator = DefaultPagination()
+        else:
+            queryset = queryset.order_by("-created_at", "-id")
+            paginator = get_paginator(request)
 
-        queryset = queryset.order_by("-created_at")
+        queryset = TaskListSerializer.setup_eager_loading(queryset)
 
-        paginator = DefaultPagination()
         page = paginator.paginate_queryset(queryset, request)
 
         serializer = TaskListSerializer(page, many=True)
@@ -88,8 +97,8 @@ class TaskListCreateAPIView(APIView):
             "data": serializer.data,
         }
 
-        
         response_data.update(paginator.get_root_pagination_data())
+        set_cached_task_list(cache_key, response_data)
 
         return Response(response_data, status=status.HTTP_200_OK)
     
@@ -98,16 +107,39 @@ class TaskListCreateAPIView(APIView):
 class TaskDetailUpdateDeleteAPIView(APIView):
     permission_classes = [IsAuthenticated]
 
-    def get_object(self, request, id):
-        task = get_object_or_404(Task, id=id, deleted_at__isnull=True)
+    def get_object(self, request, id, for_update=False):
+        queryset = TaskDetailSerializer.setup_eager_loading(Task.objects.all())
+        if for_update:
+            queryset = queryset.select_for_update(of=("self",))
+
+        task = get_object_or_404(queryset, id=id, deleted_at__isnull=True)
         self.check_object_permissions(request, task)
         return task
 
+    def get_stamps(self, id):
+        return get_object_or_404(
+            Task.objects.values_list(*TASK_VALIDATOR_FIELDS),
+            id=id,
+            deleted_at__isnull=True,
+        )
+
     def get(self, request, id):
         self.permission_classes = [IsAuthenticated, CanViewTask]
+        self.check_object_permissions(request, get_task_acl_or_404(id))
+
+        # validators come from a timestamps only read, the full task and its
+        # users are only loaded when the client copy is outdated
+        stamps = self.get_stamps(id)
+        etag, last_modified = get_task_validators(id, stamps)
+
+        not_modified = not_modified_response(request, etag, last_modified)
+        if not_modified is not None:
+            return not_modified
+
         task = self.get_object(request, id)
+        etag, last_modified = get_task_validators(task.id, (task.updated_at, *stamps[1:]))
 
-        return Response(
+        response = Response(
             {
                 "status": "success",
                 "message": "Task retrieved successfully",
@@ -115,26 +147,32 @@ class TaskDetailUpdateDeleteAPIView(APIView):
             },
             status=status.HTTP_200_OK,
         )
+        return set_validators(response, etag, last_modified)
 
     def patch(self, request, id):
         self.permission_classes = [IsAuthenticated, CanUpdateTask]
-        task = self.get_object(request, id)
 
-        serializer = TaskUpdateSerializer(
-            task,
-            data=request.data,
-            partial=True,
-            context={"request": request},
-        )
-        serializer.is_valid(raise_exception=True)
+        with transaction.atomic():
+            # the row lock keeps the If-Match check and the write together
+            task = self.get_object(request, id, for_update=True)
+            stamps = self.get_stamps(id)
+            check_if_match(request, get_task_validators(task.id, stamps)[0])
+
+            serializer = TaskUpdateSerializer(
+                task,
+                data=request.data,
+                partial=True,
+                context={"request": request},
+            )
+            serializer.is_valid(raise_exception=True)
 
-        task = update_task(
-            task,
-            user=request.user,
-            **serializer.validated_data
-        )
+            task = update_task(
+                task,
+                user=request.user,
+                **serializer.validated_data
+            )
 
-        return Response(
+        response = Response(
             {
                 "status": "success",
                 "message": "Task updated successfully",
@@ -142,13 +180,14 @@ class TaskDetailUpdateDeleteAPIView(APIView):
             },
             status=status.HTTP_200_OK,
         )
+        etag, last_modified = get_task_validators(task.id, (task.updated_at, *stamps[1:]))
+        return set_validators(response, etag, last_modified)
 
     def delete(self, request, id):
         self.permission_classes = [IsAuthenticated, CanDeleteTask]
         task = self.get_object(request, id)
 
-        task.deleted_at = timezone.now()
-        task.save(update_fields=["deleted_at"])
+        delete_task(task)
 
         return Response(
             {
@@ -0,0 +1,67 @@
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.utils import get_md5_hash_password
+
+from users.cache import get_cached_user, aget_cached_user
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """
+    JWT authentication that reads the user row from the cache.
+
+    Same checks as `JWTAuthentication.get_user`, plus soft deleted users are
+    rejected. Cached rows are invalidated whenever the user is updated,
+    deleted or changes password.
+    """
+
+    def get_user_id(self, validated_token):
+        try:
+            return validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError:
+            raise InvalidToken(_("Token contained no recognizable user identification"))
+
+    def get_user(self, validated_token):
+        user = get_cached_user(self.get_user_id(validated_token))
+        return self.check_user(user, validated_token)
+
+    async def aget_user(self, validated_token):
+        user = await aget_cached_user(self.get_user_id(validated_token))
+        return self.check_user(user, validated_token)
+
+    async def aauthenticate(self, request):
+        """
+        `authenticate` for async views, token validation is CPU only and
+        the user row comes from the cache or the async ORM.
+        """
+        header = self.get_header(request)
+        if header is None:
+            return None
+
+        raw_token = self.get_raw_token(header)
+        if raw_token is None:
+            return None
+
+        validated_token = self.get_validated_token(raw_token)
+        return await self.aget_user(validated_token), validated_token
+
+    def check_user(self, user, validated_token):
+        if user is None:
+            raise AuthenticationFailed(_("User not found"), code="user_not_found")
+
+        if not user.is_active or user.deleted_at is not None:
+            raise AuthenticationFailed(_("User is inactive"), code="user_inactive")
+
+        if api_settings.CHECK_REVOKE_TOKEN:
+            # cached users carry the digest instead of the password hash
+            password_md5 = getattr(user, "password_md5", None)
+            if password_md5 is None:
+                password_md5 = get_md5_hash_password(user.password)
+
+            if validated_token.get(api_settings.REVOKE_TOKEN_CLAIM) != password_md5:
+                raise AuthenticationFailed(
+                    _("The user's password has been changed."), code="password_changed"
+                )
+
+        return user
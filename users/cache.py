@@ -0,0 +1,112 @@
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS, transaction
+from rest_framework_simplejwt.utils import get_md5_hash_password
+
+from core.constants import user_cache_timeout
+
+User = get_user_model()
+
+
+# the columns authentication and permission checks read, plus the profile
+# fields responses render for the request user (UserListDetailSerializer,
+# UserMiniDetailSerializer) so write paths do not load them one by one. The
+# cache is shared between workers, the password hash itself is never stored.
+# Kept in model field order, as `Model.from_db` expects.
+CACHED_USER_FIELDS = tuple(
+    field.attname
+    for field in User._meta.concrete_fields
+    if field.attname in {
+        "id",
+        "username",
+        "email",
+        "first_name",
+        "last_name",
+        "role",
+        "organization_id",
+        "is_active",
+        "deleted_at",
+        "created_at",
+        "updated_at",
+    }
+)
+
+
+def _user_key(user_id):
+    # versioned with CACHED_USER_FIELDS, older entries hold other columns
+    return f"auth_user:v3:{user_id}"
+
+
+def _user_query(user_id):
+    # read from the primary, a lagging replica would put a stale row back in
+    # the cache right after an invalidation
+    return (
+        User.objects.using(DEFAULT_DB_ALIAS)
+        .filter(id=user_id)
+        .values_list(*CACHED_USER_FIELDS, "password")
+    )
+
+
+def _to_entry(row):
+    *values, password = row
+    return (*values, get_md5_hash_password(password))
+
+
+def _from_entry(entry):
+    """
+    Build the request user from a cache entry.
+
+    Columns outside CACHED_USER_FIELDS are deferred, reading one (the password
+    for a password change) loads it on demand.
+    """
+    *values, password_md5 = entry
+    user = User.from_db(DEFAULT_DB_ALIAS, CACHED_USER_FIELDS, values)
+    user.password_md5 = password_md5
+    return user
+
+
+def get_cached_user(user_id):
+    """
+    Return the user of an authenticated request, cached by user id.
+    """
+    key = _user_key(user_id)
+    entry = cache.get(key)
+
+    if entry is None:
+        row = _user_query(user_id).first()
+        if row is None:
+            return None
+
+        entry = _to_entry(row)
+        cache.set(key, entry, user_cache_timeout)
+
+    return _from_entry(entry)
+
+
+async def aget_cached_user(user_id):
+    """
+    `get_cached_user` for async views.
+    """
+    key = _user_key(user_id)
+    entry = await cache.aget(key)
+
+    if entry is None:
+        row = await _user_query(user_id).afirst()
+        if row is None:
+            return None
+
+        entry = _to_entry(row)
+        await cache.aset(key, entry, user_cache_timeout)
+
+    return _from_entry(entry)
+
+
+def invalidate_cached_user(user_id):
+    """
+    Drop the cached user now and again once the current transaction
+    commits, a request reading the old row before the commit may have
+    cached it in between.
+    """
+    key = _user_key(user_id)
+    cache.delete(key)
+    transaction.on_commit(lambda: cache.delete(key))
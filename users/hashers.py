@@ -0,0 +1,34 @@
+from django.conf import settings
+from django.contrib.auth.hashers import PBKDF2PasswordHasher, check_password
+
+from users.cache import invalidate_cached_user
+
+
+class ConfigurablePBKDF2PasswordHasher(PBKDF2PasswordHasher):
+    """
+    PBKDF2 with the iteration count taken from PASSWORD_HASH_ITERATIONS.
+
+    Uses the same algorithm name as Django's hasher, so existing hashes keep
+    verifying and are upgraded on login when the iteration count changes.
+    """
+
+    @property
+    def iterations(self):
+        return settings.PASSWORD_HASH_ITERATIONS or PBKDF2PasswordHasher.iterations
+
+
+def check_and_upgrade_password(user, raw_password):
+    """
+    Verify a password and rehash it with the preferred hasher if needed.
+
+    Django calls the setter only when the stored hash uses another hasher or
+    different cost parameters, so steady state logins do not write.
+    """
+
+    def setter(raw_password):
+        user.set_password(raw_password)
+        user._password = None
+        user.save(update_fields=["password"])
+        invalidate_cached_user(user.id)
+
+    return check_password(raw_password, user.password, setter)
@@ -0,0 +1,86 @@
+import time
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from rest_framework.exceptions import ValidationError
+
+from core.choices import UserCascadeActionChoices
+from core.constants import user_cascade_batch_size
+from users.models import UserCascadeJob
+from users.services import start_user_cascade, process_user_cascade_batch
+
+User = get_user_model()
+
+
+class Command(BaseCommand):
+    help = (
+        "Soft delete or restore a user with their tasks and comments in id "
+        "ordered batches, or resume interrupted runs."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("username", nargs="?")
+        parser.add_argument(
+            "--restore",
+            action="store_true",
+            help="Restore the user instead of deleting them.",
+        )
+        parser.add_argument(
+            "--resume",
+            action="store_true",
+            help="Continue every unfinished job instead of starting one.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=user_cascade_batch_size,
+            help="Number of rows updated per transaction.",
+        )
+        parser.add_argument(
+            "--sleep",
+            type=float,
+            default=0,
+            help="Seconds to wait between batches to limit database load.",
+        )
+
+    def handle(self, *args, **options):
+        if options["resume"]:
+            jobs = list(UserCascadeJob.objects.filter(completed_at__isnull=True))
+        elif options["username"]:
+            jobs = [self.start(options["username"], options["restore"])]
+        else:
+            raise CommandError("Pass a username or --resume.")
+
+        for job in jobs:
+            self.run(job, options["batch_size"], options["sleep"])
+
+        self.stdout.write(self.style.SUCCESS(f"{len(jobs)} cascade jobs finished."))
+
+    def start(self, username, restore):
+        try:
+            user = User.objects.get(username=username)
+        except User.DoesNotExist:
+            raise CommandError(f"User '{username}' does not exist.")
+
+        action = (
+            UserCascadeActionChoices.RESTORE
+            if restore
+            else UserCascadeActionChoices.DELETE
+        )
+
+        try:
+            return start_user_cascade(user, action)
+        except ValidationError as exc:
+            raise CommandError(exc.detail["non_field_errors"][0])
+
+    def run(self, job, batch_size, sleep):
+        while job.completed_at is None:
+            job = process_user_cascade_batch(job, batch_size)
+            self.stdout.write(
+                f"{job.get_action_display()} {job.user_id}: {job.phase}, "
+                f"{job.tasks_affected} tasks, {job.tasks_skipped} skipped, "
+                f"{job.comments_affected} comments"
+            )
+
+            if sleep:
+                time.sleep(sleep)
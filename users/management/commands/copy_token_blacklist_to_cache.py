@@ -0,0 +1,32 @@
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken
+
+from users.token_blacklist import CacheBlacklistStore
+
+
+class Command(BaseCommand):
+    help = (
+        "Copy the unexpired refresh tokens blacklisted in the database into "
+        "the cache store. Run it before switching TOKEN_BLACKLIST_STORE to "
+        "CacheBlacklistStore, and again right after the switch to catch tokens "
+        "blacklisted in between."
+    )
+
+    def handle(self, *args, **options):
+        store = CacheBlacklistStore()
+        total = 0
+
+        rows = (
+            BlacklistedToken.objects
+            .filter(token__expires_at__gt=timezone.now())
+            .values_list("token__jti", "token__expires_at")
+            .iterator(chunk_size=2000)
+        )
+        for jti, expires_at in rows:
+            store.add_jti(jti, expires_at)
+            total += 1
+
+        self.stdout.write(
+            self.style.SUCCESS(f"{total} blacklisted tokens copied to the cache.")
+        )
@@ -0,0 +1,37 @@
+# Generated by Django 6.0 on 2026-10-16 14:00
+
+import django.db.models.deletion
+import uuid
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0003_user_trigram_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='UserCascadeJob',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('action', models.CharField(choices=[('DELETE', 'Delete'), ('RESTORE', 'Restore')], max_length=20)),
+                ('stamp', models.DateTimeField()),
+                ('phase', models.CharField(choices=[('OWNED_TASKS', 'Owned Tasks'), ('ASSIGNED_TASKS', 'Assigned Tasks'), ('COMMENTS', 'Comments'), ('DONE', 'Done')], default='OWNED_TASKS', max_length=20)),
+                ('last_id', models.UUIDField(blank=True, null=True)),
+                ('tasks_affected', models.PositiveIntegerField(default=0)),
+                ('tasks_skipped', models.PositiveIntegerField(default=0)),
+                ('comments_affected', models.PositiveIntegerField(default=0)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('completed_at', models.DateTimeField(blank=True, null=True)),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='cascade_jobs', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'db_table': 'user_cascade_jobs',
+                'constraints': [models.UniqueConstraint(condition=models.Q(('completed_at__isnull', True)), fields=('user',), name='user_cascade_jobs_one_running')],
+            },
+        ),
+    ]
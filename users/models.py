@@ -1,7 +1,13 @@
 import uuid
 from django.db import models
 from django.contrib.auth.models import AbstractUser
-from core.choices import UserRoleChoices
+from django.contrib.postgres.indexes import GinIndex, OpClass
+from django.db.models.functions import Upper
+from core.choices import (
+    UserRoleChoices,
+    UserCascadeActionChoices,
+    UserCascadePhaseChoices,
+)
 
 
 class Organization(models.Model):
@@ -54,8 +60,61 @@ class User(AbstractUser):
         indexes = [
             models.Index(fields=["role"]),
             models.Index(fields=["created_at"]),
+            # assignee picker substring matches, see users.search
+            GinIndex(
+                OpClass(Upper("username"), name="gin_trgm_ops"),
+                name="users_username_trgm_idx",
+            ),
+            GinIndex(
+                OpClass(Upper("email"), name="gin_trgm_ops"),
+                name="users_email_trgm_idx",
+            ),
         ]
 
     def __str__(self):
         return f"{self.email} ({self.role})"
 
+
+# progress of a batched soft delete or restore of a user, see users.services
+class UserCascadeJob(models.Model):
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+
+    user = models.ForeignKey(
+        User,
+        on_delete=models.CASCADE,
+        related_name="cascade_jobs",
+    )
+
+    action = models.CharField(max_length=20, choices=UserCascadeActionChoices.choices)
+
+    # the deleted_at stamp written by the delete, restore only reverts rows
+    # carrying it so tasks deleted on their own stay deleted
+    stamp = models.DateTimeField()
+
+    phase = models.CharField(
+        max_length=20,
+        choices=UserCascadePhaseChoices.choices,
+        default=UserCascadePhaseChoices.OWNED_TASKS,
+    )
+    last_id = models.UUIDField(null=True, blank=True)
+
+    tasks_affected = models.PositiveIntegerField(default=0)
+    tasks_skipped = models.PositiveIntegerField(default=0)
+    comments_affected = models.PositiveIntegerField(default=0)
+
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+    completed_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        db_table = "user_cascade_jobs"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["user"],
+                name="user_cascade_jobs_one_running",
+                condition=models.Q(completed_at__isnull=True),
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.action} {self.user_id} ({self.phase})"
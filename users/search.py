@@ -0,0 +1,29 @@
+from django.contrib.auth import get_user_model
+from django.db.models import Q
+
+from core.constants import autocomplete_max_results
+
+User = get_user_model()
+
+
+def autocomplete_users(user, text):
+    """
+    Substring match on username and email of the users `user` can assign
+    tasks to, the live users of their organization, served by the trigram
+    indexes on UPPER(username) and UPPER(email).
+
+    Like `autocomplete_tasks`, the LIMIT applies to unordered matches and
+    only the returned suggestions are sorted.
+    """
+    matches = (
+        User.objects
+        .filter(
+            organization_id=user.organization_id,
+            deleted_at__isnull=True,
+            is_active=True,
+        )
+        .filter(Q(username__icontains=text) | Q(email__icontains=text))
+        .only("id", "username", "email", "first_name", "last_name")
+        [:autocomplete_max_results]
+    )
+    return sorted(matches, key=lambda match: match.username.lower())
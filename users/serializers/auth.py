@@ -1,9 +1,11 @@
 import re
 from rest_framework import serializers
-from rest_framework_simplejwt.tokens import RefreshToken
+from users.tokens import RefreshToken
 from rest_framework_simplejwt.exceptions import TokenError , InvalidToken
 from django.contrib.auth import get_user_model
-from django.contrib.auth.hashers import check_password
+from django.contrib.auth.hashers import make_password
+from users.hashers import check_and_upgrade_password
+from users.cache import invalidate_cached_user
 
 User = get_user_model()
 
@@ -106,24 +108,27 @@ class LoginSerializer(serializers.Serializer):
         username = attrs["username"]
         password = attrs["password"]
 
-        try:
-            user = User.objects.get(username=username)
-        except User.DoesNotExist:
+        # deleted and inactive accounts are filtered out by the query itself,
+        # only the columns needed to verify and issue tokens are loaded
+        user = (
+            User.objects
+            .filter(
+                username=username,
+                deleted_at__isnull=True,
+                is_active=True,
+            )
+            .only("id", "password", "is_active")
+            .first()
+        )
+
+        if user is None:
+            # hash anyway so unknown usernames take as long as wrong passwords
+            make_password(password)
             raise serializers.ValidationError("Invalid username or password")
-            
-        if not check_password(password, user.password):
+
+        if not check_and_upgrade_password(user, password):
             raise serializers.ValidationError("Invalid username or password")
-        
-        if user.deleted_at:
-            raise serializers.ValidationError(
-                "User account is deleted. Contact admin to re-activate the account."
-            )
 
-        if not user.is_active:
-            raise serializers.ValidationError(
-                "User account is temporary inactive. Do contact admin to re-activate the account."
-            )
-        
         attrs["user"] = user
         return attrs
     
@@ -165,6 +170,7 @@ class ResetPasswordSerializer(serializers.Serializer):
         user = self.context["request"].user
         user.set_password(self.validated_data["new_password"])
         user.save()
+        invalidate_cached_user(user.id)
         return user
     
 
@@ -1,6 +1,11 @@
 from rest_framework import serializers
 from django.contrib.auth import get_user_model
+from django.db.models import Q
 from core.choices import UserRoleChoices
+from users.cache import invalidate_cached_user
+from users.models import UserCascadeJob
+from tasks.cache import bump_task_list_generations
+from tasks.models import Task
 
 User = get_user_model()
 class UserListDetailSerializer(serializers.ModelSerializer):
@@ -63,7 +68,7 @@ class UserUpdateSerializer(serializers.Serializer):
         
         if "is_active" in attrs:
             # If the user is NOT an Admin, they cannot change is_active.
-            if request_user and request_user.role != UserRoleChoices.ADMIN:
+            if request_user and request_user.role != UserRoleChoices.TENANT_ADMIN:
                 
                 # Check 1: Prevent changing the value
                 if getattr(self.instance, 'is_active') != attrs['is_active']:
@@ -92,5 +97,37 @@ class UserUpdateSerializer(serializers.Serializer):
     def update(self, instance, validated_data):
         for field, value in validated_data.items():
             setattr(instance, field, value)
-        instance.save(update_fields=validated_data.keys())
-        return instance
\ No newline at end of file
+        # updated_at versions the responses embedding the user
+        instance.save(update_fields=[*validated_data.keys(), "updated_at"])
+        invalidate_cached_user(instance.id)
+        # task lists embed the user's mini details, the user's tasks may be
+        # listed under other organizations than the user's own
+        organization_ids = set(
+            Task.objects.filter(Q(owner_id=instance.id) | Q(assignee_id=instance.id))
+            .values_list("organization_id", flat=True)
+            .distinct()
+        )
+        bump_task_list_generations(
+            organization_ids=[instance.organization_id, *organization_ids],
+            owner_ids=[instance.id],
+            assignee_ids=[instance.id],
+        )
+        return instance
+
+
+class UserCascadeJobSerializer(serializers.ModelSerializer):
+    """
+    Progress and affected counts of a user soft delete or restore.
+    """
+    class Meta:
+        model = UserCascadeJob
+        fields = (
+            'id',
+            'action',
+            'phase',
+            'tasks_affected',
+            'tasks_skipped',
+            'comments_affected',
+            'created_at',
+            'completed_at',
+        )
@@ -1,36 +1,233 @@
+from django.contrib.auth import get_user_model
 from django.utils import timezone
 from django.db import transaction
+from django.db.models.functions import Lower
+from rest_framework import serializers
+from core.choices import UserCascadeActionChoices, UserCascadePhaseChoices
+from core.constants import user_cascade_batch_size
 from tasks.models import Task, Comment
+from tasks.search import refresh_task_search_vectors
+from tasks.services import notify_tasks_changed
+from tasks.stats import task_stats_key, record_task_stats
+from users.cache import invalidate_cached_user
+from users.models import UserCascadeJob
+
+User = get_user_model()
+
+
+NEXT_PHASE = {
+    UserCascadePhaseChoices.OWNED_TASKS: UserCascadePhaseChoices.ASSIGNED_TASKS,
+    UserCascadePhaseChoices.ASSIGNED_TASKS: UserCascadePhaseChoices.COMMENTS,
+    UserCascadePhaseChoices.COMMENTS: UserCascadePhaseChoices.DONE,
+}
+
+TASK_PHASE_FIELDS = {
+    UserCascadePhaseChoices.OWNED_TASKS: "owner_id",
+    UserCascadePhaseChoices.ASSIGNED_TASKS: "assignee_id",
+}
 
 
-#To do - in future - admin can restore the user and all its attributes including the tasks and all
-            # or admin can allow to remove the user (hard delete) and recreate the new user 
-            # or can just use patch and remove all the associated item and pretend to be use the same existing user 
 @transaction.atomic
-def soft_delete_user(user):
+def start_user_cascade(user, action):
     """
-    Soft delete a user.
+    Create the job of a soft delete or restore, or return the unfinished one.
+
+    A delete marks the user deleted right away, so they can no longer log in
+    while their tasks and comments are processed. A restore reverts the rows
+    carrying the user's deleted_at stamp and the user itself last.
     """
+    job = (
+        UserCascadeJob.objects
+        .select_for_update()
+        .filter(user=user, completed_at__isnull=True)
+        .first()
+    )
 
-    now = timezone.now()
+    if job is not None:
+        if job.action != action:
+            raise serializers.ValidationError(
+                {
+                    "non_field_errors": [
+                        f"A {job.get_action_display().lower()} of this user "
+                        f"is still running."
+                    ]
+                }
+            )
+        return job
 
-    user.deleted_at = now
-    user.save(update_fields=["deleted_at"])
+    if action == UserCascadeActionChoices.RESTORE and user.deleted_at is None:
+        raise serializers.ValidationError(
+            {"non_field_errors": ["User is not deleted."]}
+        )
 
-    Task.objects.filter(
-        deleted_at__isnull=True
-    ).filter(
-        owner=user
-    ).update(deleted_at=now)
+    if action == UserCascadeActionChoices.DELETE:
+        user.deleted_at = timezone.now()
+        user.save(update_fields=["deleted_at"])
+        invalidate_cached_user(user.id)
+
+    return UserCascadeJob.objects.create(
+        user=user,
+        action=action,
+        stamp=user.deleted_at,
+    )
+
+
+def _state_filter(job):
+    if job.action == UserCascadeActionChoices.DELETE:
+        return {"deleted_at__isnull": True}
+    return {"deleted_at": job.stamp}
+
+
+def _cascade_tasks(job, batch_size):
+    queryset = Task.objects.filter(
+        **{TASK_PHASE_FIELDS[job.phase]: job.user_id},
+        **_state_filter(job),
+    )
+    if job.last_id:
+        queryset = queryset.filter(id__gt=job.last_id)
 
+    tasks = list(
+        queryset
+        .select_for_update()
+        .order_by("id")
+        .only(
+            "id",
+            "organization_id",
+            "owner_id",
+            "assignee_id",
+            "title",
+            "status",
+            "priority",
+        )
+        [:batch_size]
+    )
+    if not tasks:
+        return 0
+
+    if job.action == UserCascadeActionChoices.DELETE:
+        affected = tasks
+        deleted_at = job.stamp
+    else:
+        # a live task may have taken the title since, those stay deleted
+        taken = set(
+            Task.objects.filter(
+                assignee_id__in={task.assignee_id for task in tasks},
+                deleted_at__isnull=True,
+            )
+            .annotate(normalized_title=Lower("title"))
+            .filter(normalized_title__in={task.title.lower() for task in tasks})
+            .values_list("assignee_id", "normalized_title")
+        )
+
+        affected = []
+        for task in tasks:
+            key = (task.assignee_id, task.title.lower())
+            if key not in taken:
+                taken.add(key)
+                affected.append(task)
+
+        deleted_at = None
+
+    # updated_at moves too, a restored task must sort after the tombstone
+    # delta sync clients already received
     Task.objects.filter(
-        deleted_at__isnull=True
-    ).filter(
-        assignee=user
-    ).update(deleted_at=now)
+        id__in=[task.id for task in affected]
+    ).update(deleted_at=deleted_at, updated_at=timezone.now())
+
+    keys = [task_stats_key(task) for task in affected]
+    if job.action == UserCascadeActionChoices.DELETE:
+        record_task_stats(removed=keys)
+    else:
+        record_task_stats(added=keys)
+    notify_tasks_changed(affected)
+
+    job.last_id = tasks[-1].id
+    job.tasks_affected += len(affected)
+    job.tasks_skipped += len(tasks) - len(affected)
+    return len(tasks)
 
+
+def _cascade_comments(job, batch_size):
+    queryset = Comment.objects.filter(user_id=job.user_id, **_state_filter(job))
+    if job.last_id:
+        queryset = queryset.filter(id__gt=job.last_id)
+
+    comments = list(queryset.order_by("id").values_list("id", "task_id")[:batch_size])
+    if not comments:
+        return 0
+
+    deleted_at = (
+        job.stamp if job.action == UserCascadeActionChoices.DELETE else None
+    )
     Comment.objects.filter(
-        user=user,
-        deleted_at__isnull=True
-    ).update(deleted_at=now)
+        id__in=[comment_id for comment_id, _ in comments]
+    ).update(deleted_at=deleted_at, updated_at=timezone.now())
+    refresh_task_search_vectors({task_id for _, task_id in comments})
+
+    job.last_id = comments[-1][0]
+    job.comments_affected += len(comments)
+    return len(comments)
+
 
+@transaction.atomic
+def process_user_cascade_batch(job, batch_size=user_cascade_batch_size):
+    """
+    Process the next id ordered batch of a cascade job in its own short
+    transaction and save the progress with it.
+    """
+    job = UserCascadeJob.objects.select_for_update().get(id=job.id)
+
+    if job.phase == UserCascadePhaseChoices.DONE:
+        return job
+
+    if job.phase == UserCascadePhaseChoices.COMMENTS:
+        processed = _cascade_comments(job, batch_size)
+    else:
+        processed = _cascade_tasks(job, batch_size)
+
+    if processed < batch_size:
+        job.phase = NEXT_PHASE[job.phase]
+        job.last_id = None
+
+    if job.phase == UserCascadePhaseChoices.DONE:
+        job.completed_at = timezone.now()
+
+        if job.action == UserCascadeActionChoices.RESTORE:
+            User.objects.filter(id=job.user_id).update(deleted_at=None)
+            invalidate_cached_user(job.user_id)
+
+    job.save()
+    return job
+
+
+def run_user_cascade(job, batch_size=user_cascade_batch_size, max_batches=None):
+    """
+    Process a cascade job until it completes, or until `max_batches` batches
+    were processed.
+
+    Interrupted or bounded runs keep their progress and continue from the
+    last batch when run again, see the `cascade_user` command.
+    """
+    batches = 0
+    while job.completed_at is None and (max_batches is None or batches < max_batches):
+        job = process_user_cascade_batch(job, batch_size)
+        batches += 1
+
+    return job
+
+
+def soft_delete_user(user, batch_size=user_cascade_batch_size, max_batches=None):
+    """
+    Soft delete a user with their owned and assigned tasks and comments.
+    """
+    job = start_user_cascade(user, UserCascadeActionChoices.DELETE)
+    return run_user_cascade(job, batch_size, max_batches)
+
+
+def restore_user(user, batch_size=user_cascade_batch_size, max_batches=None):
+    """
+    Restore a soft deleted user with the tasks and comments deleted with
+    them.
+    """
+    job = start_user_cascade(user, UserCascadeActionChoices.RESTORE)
+    return run_user_cascade(job, batch_size, max_batches)
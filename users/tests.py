@@ -1,3 +1,315 @@
-from django.test import TestCase
+import threading
+from unittest import mock
 
-# Create your tests here.
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection, connections
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.exceptions import ValidationError
+from rest_framework.test import APITestCase, APITransactionTestCase
+
+from core.choices import (
+    UserCascadeActionChoices,
+    UserCascadePhaseChoices,
+    UserRoleChoices,
+)
+from core.testing import assert_endpoint_queries, table_reads
+from tasks.models import Comment, Task
+from users.cache import get_cached_user
+from users.models import Organization, UserCascadeJob
+from users.services import (
+    process_user_cascade_batch,
+    restore_user,
+    run_user_cascade,
+    soft_delete_user,
+    start_user_cascade,
+)
+from users.tokens import RefreshToken
+
+User = get_user_model()
+
+
+class UserEndpointQueryCountTests(APITestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.organization = Organization.objects.create(name="Acme")
+        cls.admin = User.objects.create_user(
+            username="admin",
+            email="admin@example.com",
+            password="password",
+            organization=cls.organization,
+            role=UserRoleChoices.TENANT_ADMIN,
+        )
+        for index in range(5):
+            User.objects.create_user(
+                username=f"member{index}",
+                email=f"member{index}@example.com",
+                password="password",
+                organization=cls.organization,
+            )
+
+    def setUp(self):
+        cache.clear()
+        self.client.force_authenticate(self.admin)
+
+    def test_user_list(self):
+        # count, page
+        response = assert_endpoint_queries(self.client, "get", "/api/v1/users/", 2)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.data["data"]), 6)
+
+
+class UserCascadeFixturesMixin:
+    """
+    A member with three tasks assigned by the admin and a comment on each.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.organization = Organization.objects.create(name="Acme")
+        cls.admin = User.objects.create_user(
+            username="admin",
+            email="admin@example.com",
+            password="password",
+            organization=cls.organization,
+            role=UserRoleChoices.TENANT_ADMIN,
+        )
+        cls.member = User.objects.create_user(
+            username="member",
+            email="member@example.com",
+            password="password",
+            organization=cls.organization,
+        )
+        for index in range(3):
+            task = Task.objects.create(
+                organization=cls.organization,
+                owner=cls.admin,
+                assignee=cls.member,
+                title=f"task {index}",
+            )
+            Comment.objects.create(
+                organization=cls.organization,
+                task=task,
+                user=cls.member,
+                message=f"comment {index}",
+            )
+
+    def setUp(self):
+        cache.clear()
+        self.client.force_authenticate(self.admin)
+
+
+class UserCascadeTests(UserCascadeFixturesMixin, APITestCase):
+    """
+    Deleting or restoring a user processes a bounded number of batches in
+    the request, the `cascade_user` command finishes the job.
+    """
+
+    def test_finished_cascade(self):
+        response = self.client.delete(f"/api/v1/users/{self.member.id}/")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(
+            Task.objects.filter(assignee=self.member, deleted_at__isnull=True).exists()
+        )
+
+    @mock.patch("users.views.user.user_cascade_request_batches", 1)
+    def test_unfinished_cascade_is_resumed(self):
+        response = self.client.delete(f"/api/v1/users/{self.member.id}/")
+
+        self.assertEqual(response.status_code, 202)
+        job = UserCascadeJob.objects.get(user=self.member)
+        self.assertIsNone(job.completed_at)
+
+        call_command("cascade_user", resume=True, stdout=mock.Mock())
+
+        job.refresh_from_db()
+        self.assertEqual(job.phase, UserCascadePhaseChoices.DONE)
+        self.assertEqual(job.tasks_affected, 3)
+        self.assertEqual(job.comments_affected, 3)
+        self.assertFalse(
+            Comment.objects.filter(user=self.member, deleted_at__isnull=True).exists()
+        )
+
+    def test_interrupted_cascade_resumes_where_it_stopped(self):
+        job = start_user_cascade(self.member, UserCascadeActionChoices.DELETE)
+        # owned tasks (none), then the first two assigned tasks
+        for _ in range(3):
+            job = process_user_cascade_batch(job, batch_size=1)
+
+        self.assertEqual(job.phase, UserCascadePhaseChoices.ASSIGNED_TASKS)
+        self.assertEqual(job.tasks_affected, 2)
+
+        # a new worker picks the job up from the database
+        job = run_user_cascade(UserCascadeJob.objects.get(id=job.id), batch_size=1)
+
+        self.assertIsNotNone(job.completed_at)
+        self.assertEqual(job.tasks_affected, 3)
+        self.assertEqual(job.comments_affected, 3)
+        self.assertFalse(
+            Task.objects.filter(assignee=self.member, deleted_at__isnull=True).exists()
+        )
+
+    def test_running_cascade_is_reused(self):
+        job = start_user_cascade(self.member, UserCascadeActionChoices.DELETE)
+
+        self.assertEqual(
+            start_user_cascade(self.member, UserCascadeActionChoices.DELETE).id, job.id
+        )
+        with self.assertRaises(ValidationError):
+            start_user_cascade(self.member, UserCascadeActionChoices.RESTORE)
+
+    def test_restore_keeps_tasks_deleted_on_their_own(self):
+        task = Task.objects.filter(assignee=self.member).order_by("id").first()
+        Task.objects.filter(id=task.id).update(deleted_at=timezone.now())
+
+        soft_delete_user(self.member)
+        self.member.refresh_from_db()
+        job = restore_user(self.member)
+
+        self.assertEqual(job.tasks_affected, 2)
+        self.assertIsNotNone(Task.objects.get(id=task.id).deleted_at)
+        self.member.refresh_from_db()
+        self.assertIsNone(self.member.deleted_at)
+
+    def test_restore_skips_titles_taken_since(self):
+        soft_delete_user(self.member)
+        Task.objects.create(
+            organization=self.organization,
+            owner=self.admin,
+            assignee=self.member,
+            title="TASK 0",
+        )
+
+        self.member.refresh_from_db()
+        job = restore_user(self.member)
+
+        self.assertEqual(job.tasks_skipped, 1)
+        self.assertEqual(
+            Task.objects.filter(
+                assignee=self.member, title__iexact="task 0", deleted_at__isnull=True
+            ).count(),
+            1,
+        )
+
+    @mock.patch("users.views.user.user_cascade_request_batches", 1)
+    def test_unfinished_restore_is_accepted(self):
+        soft_delete_user(self.member)
+
+        response = self.client.post(f"/api/v1/users/{self.member.id}/restore/")
+
+        self.assertEqual(response.status_code, 202)
+        self.assertIsNone(response.data["data"]["completed_at"])
+
+
+class UserAutocompleteTests(APITestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.organization = Organization.objects.create(name="Acme")
+        other = Organization.objects.create(name="Globex")
+        cls.admin = User.objects.create_user(
+            username="admin",
+            email="admin@example.com",
+            password="password",
+            organization=cls.organization,
+            role=UserRoleChoices.TENANT_ADMIN,
+        )
+        for organization in (cls.organization, other):
+            User.objects.create_user(
+                username=f"member_{organization.name.lower()}",
+                email=f"member@{organization.name.lower()}.example.com",
+                password="password",
+                organization=organization,
+            )
+
+    def setUp(self):
+        cache.clear()
+        self.client.force_authenticate(self.admin)
+
+    def test_suggests_own_organization_only(self):
+        response = self.client.get("/api/v1/users/autocomplete/", {"q": "member"})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            [user["username"] for user in response.data["data"]],
+            ["member_acme"],
+        )
+
+
+class CachedRequestUserTests(APITestCase):
+    """
+    The request user comes from the user cache with its profile fields, only
+    the password hash is loaded when a view needs it.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.organization = Organization.objects.create(name="Acme")
+        cls.user = User.objects.create_user(
+            username="member",
+            email="member@example.com",
+            password="password",
+            organization=cls.organization,
+        )
+
+    def setUp(self):
+        cache.clear()
+        token = RefreshToken.for_user(self.user).access_token
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
+        get_cached_user(self.user.id)
+
+    def test_reset_password(self):
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.post(
+                "/api/v1/users/reset-password/",
+                {
+                    "current_password": "password",
+                    "new_password": "new-password!",
+                    "confirm_new_password": "new-password!",
+                },
+                format="json",
+            )
+
+        self.assertEqual(response.status_code, 200, response.data)
+        self.assertEqual(response.data["data"]["email"], "member@example.com")
+        # the password hash, everything rendered comes from the cache
+        self.assertEqual(len(table_reads(context, "users")), 1)
+
+
+class UserCascadeWorkerTests(UserCascadeFixturesMixin, APITransactionTestCase):
+    """
+    Workers resuming the same job at once serialize on the job row, every
+    row is processed and counted once.
+    """
+
+    def setUp(self):
+        self.setUpTestData()
+        super().setUp()
+
+    def test_concurrent_workers(self):
+        job = start_user_cascade(self.member, UserCascadeActionChoices.DELETE)
+        errors = []
+
+        def worker():
+            try:
+                run_user_cascade(UserCascadeJob.objects.get(id=job.id), batch_size=1)
+            except Exception as exc:
+                errors.append(exc)
+            finally:
+                connections.close_all()
+
+        threads = [threading.Thread(target=worker) for _ in range(2)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=30)
+
+        self.assertEqual(errors, [])
+        job.refresh_from_db()
+        self.assertIsNotNone(job.completed_at)
+        self.assertEqual(job.tasks_affected, 3)
+        self.assertEqual(job.comments_affected, 3)
@@ -0,0 +1,35 @@
+from rest_framework.throttling import SimpleRateThrottle
+
+
+class LoginIPRateThrottle(SimpleRateThrottle):
+    """
+    Limits login attempts per client IP.
+    """
+
+    scope = "login_ip"
+
+    def get_cache_key(self, request, view):
+        return self.cache_format % {
+            "scope": self.scope,
+            "ident": self.get_ident(request),
+        }
+
+
+class LoginUsernameRateThrottle(SimpleRateThrottle):
+    """
+    Limits login attempts per target username, whatever IP they come from.
+    """
+
+    scope = "login_username"
+
+    def get_cache_key(self, request, view):
+        data = request.data if hasattr(request.data, "get") else {}
+        username = data.get("username")
+
+        if not username or not isinstance(username, str):
+            return None
+
+        return self.cache_format % {
+            "scope": self.scope,
+            "ident": username.lower(),
+        }
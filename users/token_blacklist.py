@@ -0,0 +1,101 @@
+from functools import lru_cache
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.exceptions import ImproperlyConfigured
+from django.utils import timezone
+from django.utils.module_loading import import_string
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.token_blacklist.models import (
+    BlacklistedToken,
+    OutstandingToken,
+)
+from rest_framework_simplejwt.utils import datetime_from_epoch
+
+from core.cache import is_shared_cache
+
+
+class BaseBlacklistStore:
+    """
+    Where refresh token jtis are recorded when a token is blacklisted.
+    """
+
+    def track(self, token, user):
+        """
+        Record a newly issued refresh token, no-op unless the store needs it.
+        """
+
+    def add(self, token):
+        raise NotImplementedError
+
+    def contains(self, jti):
+        raise NotImplementedError
+
+
+class DatabaseBlacklistStore(BaseBlacklistStore):
+    """
+    Stock simplejwt behaviour, backed by the token_blacklist tables.
+    """
+
+    def track(self, token, user):
+        OutstandingToken.objects.create(
+            user=user,
+            jti=token[api_settings.JTI_CLAIM],
+            token=str(token),
+            created_at=token.current_time,
+            expires_at=datetime_from_epoch(token["exp"]),
+        )
+
+    def add(self, token):
+        outstanding, _ = OutstandingToken.objects.get_or_create(
+            jti=token[api_settings.JTI_CLAIM],
+            defaults={
+                "token": str(token),
+                "expires_at": datetime_from_epoch(token["exp"]),
+            },
+        )
+        return BlacklistedToken.objects.get_or_create(token=outstanding)
+
+    def contains(self, jti):
+        return BlacklistedToken.objects.filter(token__jti=jti).exists()
+
+
+class CacheBlacklistStore(BaseBlacklistStore):
+    """
+    Keeps blacklisted jtis in the Django cache until the token expires.
+
+    Nothing is written for issued tokens and entries expire on their own, so
+    there is no table to grow or compact. Refuses to run on a per process
+    cache, where a blacklisted token would still be accepted by every other
+    worker and after a restart.
+
+    Tokens blacklisted in the database before switching are not seen by this
+    store, copy them with the `copy_token_blacklist_to_cache` command first.
+    """
+
+    key_prefix = "jwt_blacklist"
+
+    def __init__(self):
+        if not is_shared_cache():
+            raise ImproperlyConfigured(
+                "CacheBlacklistStore needs a cache shared by every worker, "
+                "set CACHE_BACKEND to redis or memcached."
+            )
+
+    def _key(self, jti):
+        return f"{self.key_prefix}:{jti}"
+
+    def add(self, token):
+        self.add_jti(token[api_settings.JTI_CLAIM], datetime_from_epoch(token["exp"]))
+
+    def add_jti(self, jti, expires_at):
+        timeout = max(int((expires_at - timezone.now()).total_seconds()), 1)
+        cache.set(self._key(jti), True, timeout)
+
+    def contains(self, jti):
+        return cache.get(self._key(jti)) is not None
+
+
+@lru_cache(maxsize=None)
+def get_blacklist_store():
+    return import_string(settings.TOKEN_BLACKLIST_STORE)()
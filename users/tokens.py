@@ -0,0 +1,30 @@
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import BlacklistMixin
+from rest_framework_simplejwt.tokens import RefreshToken as BaseRefreshToken
+
+from users.token_blacklist import get_blacklist_store
+
+
+class RefreshToken(BaseRefreshToken):
+    """
+    Refresh token that checks and records blacklisting through the
+    configured TOKEN_BLACKLIST_STORE instead of always using the database.
+    """
+
+    def check_blacklist(self):
+        jti = self.payload[api_settings.JTI_CLAIM]
+
+        if get_blacklist_store().contains(jti):
+            raise TokenError(_("Token is blacklisted"))
+
+    def blacklist(self):
+        return get_blacklist_store().add(self)
+
+    @classmethod
+    def for_user(cls, user):
+        # skip BlacklistMixin.for_user, the store decides what to record
+        token = super(BlacklistMixin, cls).for_user(user)
+        get_blacklist_store().track(token, user)
+        return token
@@ -1,5 +1,5 @@
 from django.urls import path
-from .views import RegisterAPIView , LoginAPIView , ResetPasswordAPIView , LogoutAPIView , TokenRefreshAPIView , UserListAPIView, UserDetailUpdateDeleteAPIView , OrganizationCreateAPIView
+from .views import RegisterAPIView , LoginAPIView , ResetPasswordAPIView , LogoutAPIView , TokenRefreshAPIView , UserListAPIView, UserDetailUpdateDeleteAPIView , OrganizationCreateAPIView , UserAutocompleteAPIView , UserRestoreAPIView
 
 urlpatterns = [
     path("auth/register/", RegisterAPIView.as_view()),
@@ -8,8 +8,10 @@ urlpatterns = [
     path("auth/refresh/", TokenRefreshAPIView.as_view()),
 
     path("users/" , UserListAPIView.as_view()),
+    path("users/autocomplete/", UserAutocompleteAPIView.as_view()),
     path("users/reset-password/", ResetPasswordAPIView.as_view()),
     path("users/<uuid:id>/" , UserDetailUpdateDeleteAPIView.as_view()),
+    path("users/<uuid:id>/restore/", UserRestoreAPIView.as_view()),
 
     path("organizations/" , OrganizationCreateAPIView.as_view())
 ]
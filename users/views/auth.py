@@ -2,7 +2,8 @@ from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework.permissions import AllowAny , IsAuthenticated
 from rest_framework import status
-from rest_framework_simplejwt.tokens import RefreshToken
+from users.tokens import RefreshToken
+from users.throttling import LoginIPRateThrottle, LoginUsernameRateThrottle
 
 from users.serializers import RegisterSerializer , LoginSerializer , ResetPasswordSerializer , LogoutSerializer , TokenRefreshSerializer , UserListDetailSerializer
 
@@ -27,6 +28,7 @@ class RegisterAPIView(APIView):
 
 class LoginAPIView(APIView):
     permission_classes = [AllowAny]
+    throttle_classes = [LoginIPRateThrottle, LoginUsernameRateThrottle]
 
     def post(self , request):
         serializer = LoginSerializer(data = request.data)
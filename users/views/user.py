@@ -8,14 +8,34 @@ from django.contrib.auth import get_user_model
 
 from users.serializers.user import (
     UserListDetailSerializer,
+    UserMiniDetailSerializer,
     UserUpdateSerializer,
+    UserCascadeJobSerializer,
 )
+from users.search import autocomplete_users
+from core.serializers import AutocompleteQuerySerializer
 from core.permissions import IsAdmin , IsAdminOrSelf
+from core.constants import user_cascade_request_batches
 from core.pagination import DefaultPagination
-from users.services import soft_delete_user
+from users.services import soft_delete_user, restore_user
 
 User = get_user_model()  #getting user model inherited from abstractuser
 
+
+def cascade_accepted(job, message):
+    """
+    Response of a user cascade left unfinished by the request, the
+    `cascade_user --resume` command completes it.
+    """
+    return Response(
+        {
+            "status": "success",
+            "message": message,
+            "data": UserCascadeJobSerializer(job).data,
+        },
+        status=status.HTTP_202_ACCEPTED,
+    )
+
 class UserListAPIView(APIView):
     permission_classes = [IsAuthenticated, IsAdmin]
 
@@ -23,9 +43,11 @@ class UserListAPIView(APIView):
         queryset = (
             User.objects
             .filter(deleted_at__isnull=True)
-            .order_by("first_name", "last_name")
+            .order_by("first_name", "last_name", "id")
         )
 
+        # keyset pagination re-sorts by created_at, which would drop the
+        # name order, users are listed by page number only
         paginator = DefaultPagination()
         page = paginator.paginate_queryset(queryset, request)
 
@@ -42,6 +64,25 @@ class UserListAPIView(APIView):
         return Response(response_data, status=status.HTTP_200_OK)
 
 
+class UserAutocompleteAPIView(APIView):
+    permission_classes = [IsAuthenticated, IsAdmin]
+
+    def get(self, request):
+        serializer = AutocompleteQuerySerializer(data=request.query_params)
+        serializer.is_valid(raise_exception=True)
+
+        users = autocomplete_users(request.user, serializer.validated_data["q"])
+
+        return Response(
+            {
+                "status": "success",
+                "message": "User suggestions retrieved successfully",
+                "data": UserMiniDetailSerializer(users, many=True).data,
+            },
+            status=status.HTTP_200_OK,
+        )
+
+
 class UserDetailUpdateDeleteAPIView(APIView):
     permission_classes = [IsAuthenticated, IsAdminOrSelf]    # IsAdminOrSelf - admin or self user(logged in user) 
 
@@ -88,20 +129,40 @@ class UserDetailUpdateDeleteAPIView(APIView):
             status=status.HTTP_200_OK,
         )
 
-    #To do - in future - admin can restore the user and all its attributes including the tasks and all
-            # or admin can allow to remove the user (hard delete) and recreate the new user 
-            # or can just use patch and remove all the associated item and pretend to be use the same existing user
-
     def delete(self, request, id):
         user = self.get_object(request, id)
 
-        soft_delete_user(user)
+        job = soft_delete_user(user, max_batches=user_cascade_request_batches)
+
+        if job.completed_at is None:
+            return cascade_accepted(job, "User deletion started")
 
         return Response(
             {
                 "status": "success",
                 "message": "User deleted successfully",
-                "data": None,
+                "data": UserCascadeJobSerializer(job).data,
+            },
+            status=status.HTTP_200_OK,
+        )
+
+
+class UserRestoreAPIView(APIView):
+    permission_classes = [IsAuthenticated, IsAdmin]
+
+    def post(self, request, id):
+        user = get_object_or_404(User, id=id, deleted_at__isnull=False)
+
+        job = restore_user(user, max_batches=user_cascade_request_batches)
+
+        if job.completed_at is None:
+            return cascade_accepted(job, "User restore started")
+
+        return Response(
+            {
+                "status": "success",
+                "message": "User restored successfully",
+                "data": UserCascadeJobSerializer(job).data,
             },
             status=status.HTTP_200_OK,
         )
\ No newline at end of file